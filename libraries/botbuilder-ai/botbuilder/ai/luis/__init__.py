@@ -4,6 +4,7 @@
 from .luis_application import LuisApplication
 from .luis_recognizer_options_v3 import LuisRecognizerOptionsV3
 from .luis_prediction_options import LuisPredictionOptions
+from .luis_result_cache import LuisResultCache
 from .luis_telemetry_constants import LuisTelemetryConstants
 from .luis_recognizer import LuisRecognizer
 
@@ -12,5 +13,6 @@ __all__ = [
     "LuisRecognizerOptionsV3",
     "LuisPredictionOptions",
     "LuisRecognizer",
+    "LuisResultCache",
     "LuisTelemetryConstants",
 ]
@@ -3,6 +3,8 @@
 
 import json
 from typing import Dict, List, Tuple, Union
+
+from aiohttp import ClientSession
 from botbuilder.core import (
     BotAssert,
     IntentScore,
@@ -36,6 +38,7 @@ class LuisRecognizer(Recognizer):
             LuisRecognizerOptionsV2, LuisRecognizerOptionsV3, LuisPredictionOptions
         ] = None,
         include_api_results: bool = False,
+        http_client: ClientSession = None,
     ):
         """Initializes a new instance of the :class:`LuisRecognizer` class.
 
@@ -45,7 +48,15 @@ class LuisRecognizer(Recognizer):
         :type prediction_options: :class:`LuisPredictionOptions`, optional
         :param include_api_results: True to include raw LUIS API response, defaults to False.
         :type include_api_results: bool, optional
+        :param http_client: The HTTP client to call LUIS with, defaults to a pooled session created on first use.
+        :type http_client: :class:`aiohttp.ClientSession`, optional
         :raises: TypeError
+
+        .. remarks::
+            When `http_client` is omitted, the recognizer owns the session it creates and keeps it open across
+            calls for its connection pool. Call :meth:`close` when the recognizer is no longer needed, or use it
+            with `async with`, so the session is closed; a recognizer used again afterwards creates a new one.
+            A session passed in `http_client` is never closed by the recognizer.
         """
 
         if isinstance(application, LuisApplication):
@@ -69,6 +80,28 @@ class LuisRecognizer(Recognizer):
         self.telemetry_client = self._options.telemetry_client
         self.log_personal_information = self._options.log_personal_information
 
+        self._http_client = http_client
+        self._owns_http_client = http_client is None
+
+    async def close(self):
+        """Closes the HTTP client if it was created by the recognizer."""
+        if self._owns_http_client and self._http_client:
+            await self._http_client.close()
+            self._http_client = None
+
+    async def __aenter__(self) -> "LuisRecognizer":
+        return self
+
+    async def __aexit__(self, *exc_details):
+        await self.close()
+
+    def _get_http_client(self) -> ClientSession:
+        # Created on first use so it belongs to the running event loop, then reused for its connection pool.
+        if self._http_client is None or self._http_client.closed:
+            self._http_client = ClientSession()
+            self._owns_http_client = True
+        return self._http_client
+
     @staticmethod
     def top_intent(
         results: RecognizerResult, default_intent: str = "None", min_score: float = 0.0
@@ -303,9 +336,13 @@ class LuisRecognizer(Recognizer):
         ],
     ):
         if isinstance(luis_prediction_options, LuisRecognizerOptionsV3):
-            return LuisRecognizerV3(self._application, luis_prediction_options)
+            return LuisRecognizerV3(
+                self._application, luis_prediction_options, self._get_http_client()
+            )
         if isinstance(luis_prediction_options, LuisRecognizerOptionsV2):
-            return LuisRecognizerV3(self._application, luis_prediction_options)
+            return LuisRecognizerV3(
+                self._application, luis_prediction_options, self._get_http_client()
+            )
 
         recognizer_options = LuisRecognizerOptionsV2(
             luis_prediction_options.bing_spell_check_subscription_key,
@@ -320,4 +357,6 @@ class LuisRecognizer(Recognizer):
             luis_prediction_options.telemetry_client,
             luis_prediction_options.log_personal_information,
         )
-        return LuisRecognizerV2(self._application, recognizer_options)
+        return LuisRecognizerV2(
+            self._application, recognizer_options, self._get_http_client()
+        )
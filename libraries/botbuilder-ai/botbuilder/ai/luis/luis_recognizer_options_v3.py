@@ -5,6 +5,7 @@ from typing import List
 
 from botbuilder.core import BotTelemetryClient, NullTelemetryClient
 from .luis_recognizer_options import LuisRecognizerOptions
+from .luis_result_cache import LuisResultCache
 
 
 class LuisRecognizerOptionsV3(LuisRecognizerOptions):
@@ -22,6 +23,7 @@ class LuisRecognizerOptionsV3(LuisRecognizerOptions):
         include_api_results: bool = True,
         telemetry_client: BotTelemetryClient = NullTelemetryClient(),
         log_personal_information: bool = False,
+        result_cache: LuisResultCache = None,
     ):
         super().__init__(
             include_api_results, telemetry_client, log_personal_information
@@ -35,3 +37,4 @@ class LuisRecognizerOptionsV3(LuisRecognizerOptions):
         self.external_entities = external_entities
         self.slot = slot
         self.version: str = version
+        self.result_cache = result_cache
@@ -1,10 +1,15 @@
 # Copyright (c) Microsoft Corporation. All rights reserved.
 # Licensed under the MIT License.
 
+import json
 from typing import Dict
-from azure.cognitiveservices.language.luis.runtime import LUISRuntimeClient
+from urllib.parse import quote
+
+from aiohttp import ClientResponse, ClientSession, ClientTimeout
+from azure.cognitiveservices.language.luis.runtime import models
 from azure.cognitiveservices.language.luis.runtime.models import LuisResult
-from msrest.authentication import CognitiveServicesCredentials
+from msrest import Deserializer
+from msrest.universal_http.aiohttp import AioHttpClientResponse
 from botbuilder.core import (
     TurnContext,
     RecognizerResult,
@@ -17,6 +22,12 @@ from .luis_util import LuisUtil
 from .activity_util import ActivityUtil
 
 
+class _LuisErrorResponse(AioHttpClientResponse):
+    def body(self) -> bytes:
+        # Errors may come without a body.
+        return self._body or b""
+
+
 class LuisRecognizerV2(LuisRecognizerInternal):
     # The value type for a LUIS trace activity.
     luis_trace_type: str = "https://www.luis.ai/schemas/trace"
@@ -24,41 +35,33 @@ class LuisRecognizerV2(LuisRecognizerInternal):
     # The context label for a LUIS trace activity.
     luis_trace_label: str = "Luis Trace"
 
+    _deserialize = Deserializer(
+        {k: v for k, v in models.__dict__.items() if isinstance(v, type)}
+    )
+
     def __init__(
         self,
         luis_application: LuisApplication,
         luis_recognizer_options_v2: LuisRecognizerOptionsV2 = None,
+        http_client: ClientSession = None,
     ):
         super().__init__(luis_application)
-        credentials = CognitiveServicesCredentials(luis_application.endpoint_key)
-        self._runtime = LUISRuntimeClient(luis_application.endpoint, credentials)
-        self._runtime.config.add_user_agent(LuisUtil.get_user_agent())
-        self._runtime.config.connection.timeout = (
-            luis_recognizer_options_v2.timeout // 1000
-        )
         self.luis_recognizer_options_v2 = (
             luis_recognizer_options_v2 or LuisRecognizerOptionsV2()
         )
         self._application = luis_application
+        self._http_client = http_client
 
     async def recognizer_internal(self, turn_context: TurnContext):
         utterance: str = (
             turn_context.activity.text if turn_context.activity is not None else None
         )
-        luis_result: LuisResult = self._runtime.prediction.resolve(
-            self._application.application_id,
-            utterance,
-            timezone_offset=self.luis_recognizer_options_v2.timezone_offset,
-            verbose=self.luis_recognizer_options_v2.include_all_intents,
-            staging=self.luis_recognizer_options_v2.staging,
-            spell_check=self.luis_recognizer_options_v2.spell_check,
-            bing_spell_check_subscription_key=self.luis_recognizer_options_v2.bing_spell_check_subscription_key,
-            log=(
-                self.luis_recognizer_options_v2.log
-                if self.luis_recognizer_options_v2.log is not None
-                else True
-            ),
-        )
+
+        if self._http_client:
+            luis_result = await self._predict(self._http_client, utterance)
+        else:
+            async with ClientSession() as http_client:
+                luis_result = await self._predict(http_client, utterance)
 
         recognizer_result: RecognizerResult = RecognizerResult(
             text=utterance,
@@ -88,6 +91,60 @@ class LuisRecognizerV2(LuisRecognizerInternal):
 
         return recognizer_result
 
+    async def _predict(self, http_client: ClientSession, utterance: str) -> LuisResult:
+        options = self.luis_recognizer_options_v2
+        url = "%s/luis/v2.0/apps/%s" % (
+            self._application.endpoint,
+            quote(self._application.application_id, safe=""),
+        )
+
+        params = {"log": LuisRecognizerV2._bool_param(options.log is not False)}
+        if options.timezone_offset is not None:
+            params["timezoneOffset"] = str(options.timezone_offset)
+        if options.include_all_intents is not None:
+            params["verbose"] = LuisRecognizerV2._bool_param(
+                options.include_all_intents
+            )
+        if options.staging is not None:
+            params["staging"] = LuisRecognizerV2._bool_param(options.staging)
+        if options.spell_check is not None:
+            params["spellCheck"] = LuisRecognizerV2._bool_param(options.spell_check)
+        if options.bing_spell_check_subscription_key is not None:
+            params["bing-spell-check-subscription-key"] = (
+                options.bing_spell_check_subscription_key
+            )
+
+        headers = {
+            "Ocp-Apim-Subscription-Key": self._application.endpoint_key,
+            "Accept": "application/json",
+            "Content-Type": "application/json; charset=utf-8",
+            "User-Agent": LuisUtil.get_user_agent(),
+        }
+
+        async with http_client.post(
+            url,
+            params=params,
+            data=json.dumps(utterance),
+            headers=headers,
+            timeout=ClientTimeout(total=options.timeout / 1000),
+        ) as response:
+            if response.status != 200:
+                raise await LuisRecognizerV2._api_error(response)
+            body = await response.json(content_type=None)
+
+        return LuisRecognizerV2._deserialize("LuisResult", body)
+
+    @staticmethod
+    async def _api_error(response: ClientResponse) -> models.APIErrorException:
+        # Raised like the LUIS runtime client does, with the APIError returned by the service.
+        error_response = _LuisErrorResponse(None, response)
+        await error_response.load_body()
+        return models.APIErrorException(LuisRecognizerV2._deserialize, error_response)
+
+    @staticmethod
+    def _bool_param(value: bool) -> str:
+        return "true" if value else "false"
+
     async def _emit_trace_info(
         self,
         turn_context: TurnContext,
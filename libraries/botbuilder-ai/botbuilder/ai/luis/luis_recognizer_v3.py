@@ -1,6 +1,7 @@
 # Copyright (c) Microsoft Corporation. All rights reserved.
 # Licensed under the MIT License.
 
+import json
 import re
 from typing import Dict
 
@@ -13,6 +14,7 @@ from botbuilder.core import (
     TurnContext,
 )
 from .luis_recognizer_internal import LuisRecognizerInternal
+from .luis_telemetry_constants import LuisTelemetryConstants
 from .luis_recognizer_options_v3 import LuisRecognizerOptionsV3
 from .luis_application import LuisApplication
 
@@ -44,6 +46,7 @@ class LuisRecognizerV3(LuisRecognizerInternal):
         self,
         luis_application: LuisApplication,
         luis_recognizer_options_v3: LuisRecognizerOptionsV3 = None,
+        http_client: aiohttp.ClientSession = None,
     ):
         super().__init__(luis_application)
 
@@ -51,6 +54,7 @@ class LuisRecognizerV3(LuisRecognizerInternal):
             luis_recognizer_options_v3 or LuisRecognizerOptionsV3()
         )
         self._application = luis_application
+        self._http_client = http_client
 
     async def recognizer_internal(self, turn_context: TurnContext):
         recognizer_result: RecognizerResult = None
@@ -61,46 +65,88 @@ class LuisRecognizerV3(LuisRecognizerInternal):
 
         url = self._build_url()
         body = self._build_request(utterance)
+
+        result_cache = self.luis_recognizer_options_v3.result_cache
+        cached = None
+        if result_cache is not None:
+            cache_key = self._get_cache_key(url, body)
+            cached = result_cache.get(cache_key)
+            self.luis_recognizer_options_v3.telemetry_client.track_metric(
+                (
+                    LuisTelemetryConstants.cache_hit_metric
+                    if cached is not None
+                    else LuisTelemetryConstants.cache_miss_metric
+                ),
+                1,
+            )
+
+        if cached is not None:
+            luis_result, recognizer_result = cached
+        else:
+            luis_result = await self._predict(url, body)
+            recognizer_result = self._build_recognizer_result(utterance, luis_result)
+            if result_cache is not None:
+                result_cache.set(cache_key, (luis_result, recognizer_result))
+
+        await self._emit_trace_info(
+            turn_context,
+            luis_result,
+            recognizer_result,
+            self.luis_recognizer_options_v3,
+        )
+
+        return recognizer_result
+
+    async def _predict(self, url: str, body: Dict[str, object]) -> Dict[str, object]:
+        if self._http_client:
+            return await self._post(self._http_client, url, body)
+
+        async with aiohttp.ClientSession() as http_client:
+            return await self._post(http_client, url, body)
+
+    async def _post(
+        self, http_client: aiohttp.ClientSession, url: str, body: Dict[str, object]
+    ) -> Dict[str, object]:
         headers = {
             "Ocp-Apim-Subscription-Key": self.luis_application.endpoint_key,
             "Content-Type": "application/json",
         }
 
-        async with aiohttp.ClientSession() as session:
-            async with session.post(
-                url, json=body, headers=headers, ssl=False
-            ) as result:
-                luis_result = await result.json()
-
-                recognizer_result = RecognizerResult(
-                    text=utterance,
-                    intents=self._get_intents(luis_result["prediction"]),
-                    entities=self._extract_entities_and_metadata(
-                        luis_result["prediction"]
-                    ),
-                )
-
-                if self.luis_recognizer_options_v3.include_instance_data:
-                    recognizer_result.entities[self._metadata_key] = (
-                        recognizer_result.entities[self._metadata_key]
-                        if self._metadata_key in recognizer_result.entities
-                        else {}
-                    )
+        async with http_client.post(
+            url, json=body, headers=headers, ssl=False
+        ) as result:
+            return await result.json()
+
+    def _build_recognizer_result(
+        self, utterance: str, luis_result: Dict[str, object]
+    ) -> RecognizerResult:
+        recognizer_result = RecognizerResult(
+            text=utterance,
+            intents=self._get_intents(luis_result["prediction"]),
+            entities=self._extract_entities_and_metadata(luis_result["prediction"]),
+        )
 
-                if "sentiment" in luis_result["prediction"]:
-                    recognizer_result.properties["sentiment"] = self._get_sentiment(
-                        luis_result["prediction"]
-                    )
+        if self.luis_recognizer_options_v3.include_instance_data:
+            recognizer_result.entities[self._metadata_key] = (
+                recognizer_result.entities[self._metadata_key]
+                if self._metadata_key in recognizer_result.entities
+                else {}
+            )
 
-                await self._emit_trace_info(
-                    turn_context,
-                    luis_result,
-                    recognizer_result,
-                    self.luis_recognizer_options_v3,
-                )
+        if "sentiment" in luis_result["prediction"]:
+            recognizer_result.properties["sentiment"] = self._get_sentiment(
+                luis_result["prediction"]
+            )
 
         return recognizer_result
 
+    @staticmethod
+    def _get_cache_key(url: str, body: Dict[str, object]) -> str:
+        # The url holds the application, slot or version and query options, the body the utterance and the
+        # prediction options. The utterance is used as is, since the entity positions and text of the prediction
+        # refer to its characters.
+        return json.dumps([url, body], sort_keys=True, default=str)
+
     def _build_url(self):
         base_uri = (
             self._application.endpoint or "https://westus.api.cognitive.microsoft.com"
@@ -0,0 +1,66 @@
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License.
+
+import time
+from collections import OrderedDict
+from copy import deepcopy
+from typing import Tuple
+
+
+class LuisResultCache:
+    """
+    A bounded cache of LUIS predictions.
+
+    .. remarks::
+        Set it as the `result_cache` of :class:`LuisRecognizerOptionsV3` to answer repeated utterances,
+        such as "yes", "help" or "cancel", without calling LUIS. Predictions are cached per application,
+        slot or version, request options and exact utterance, since the entity positions and text of a
+        prediction refer to the characters of the utterance that was sent.
+    """
+
+    def __init__(self, max_items: int = 1000, time_to_live: float = None):
+        """
+        Initializes a new instance of the :class:`LuisResultCache` class.
+
+        :param max_items: The maximum number of predictions to keep.
+        :type max_items: int
+        :param time_to_live: Optional, the number of seconds a prediction is kept.
+        :type time_to_live: float
+        """
+        if max_items is None or max_items <= 0:
+            raise ValueError("LuisResultCache(): max_items must be positive.")
+        if time_to_live is not None and time_to_live <= 0:
+            raise ValueError("LuisResultCache(): time_to_live must be positive.")
+
+        self.max_items = max_items
+        self.time_to_live = time_to_live
+        self.hits = 0
+        self.misses = 0
+        self._items: "OrderedDict[str, Tuple[float, object]]" = OrderedDict()
+
+    def get(self, key: str) -> object:
+        entry = self._items.get(key)
+        if entry is not None and entry[0] is not None and entry[0] <= time.monotonic():
+            del self._items[key]
+            entry = None
+
+        if entry is None:
+            self.misses += 1
+            return None
+
+        self._items.move_to_end(key)
+        self.hits += 1
+        return deepcopy(entry[1])
+
+    def set(self, key: str, value: object):
+        expires_at = time.monotonic() + self.time_to_live if self.time_to_live else None
+        self._items[key] = (expires_at, deepcopy(value))
+        self._items.move_to_end(key)
+        while len(self._items) > self.max_items:
+            self._items.popitem(last=False)
+
+    def clear(self):
+        self._items.clear()
+
+    def __len__(self) -> int:
+        return len(self._items)
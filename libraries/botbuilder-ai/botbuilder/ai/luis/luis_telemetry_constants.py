@@ -22,3 +22,7 @@ class LuisTelemetryConstants(str, Enum):
     sentiment_label_property = "sentimentLabel"
     sentiment_score_property = "sentimentScore"
     from_id_property = "fromId"
+    cache_hit_metric = "LuisResultCacheHit"
+    """Metric tracked when a prediction is served from the result cache"""
+    cache_miss_metric = "LuisResultCacheMiss"
+    """Metric tracked when a prediction is not in the result cache"""
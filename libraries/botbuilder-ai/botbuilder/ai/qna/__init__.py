@@ -10,6 +10,7 @@ from .utils import (
     ActiveLearningUtils,
     GenerateAnswerUtils,
     HttpRequestUtils,
+    QnAAnswerCache,
     QnATelemetryConstants,
 )
 
@@ -28,6 +29,7 @@ __all__ = [
     "FeedbackRecords",
     "GenerateAnswerUtils",
     "HttpRequestUtils",
+    "QnAAnswerCache",
     "Metadata",
     "QueryResult",
     "QueryResults",
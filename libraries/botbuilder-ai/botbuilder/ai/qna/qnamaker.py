@@ -13,6 +13,7 @@ from .models import FeedbackRecord, QueryResult, QueryResults
 from .utils import (
     ActiveLearningUtils,
     GenerateAnswerUtils,
+    QnAAnswerCache,
     QnATelemetryConstants,
     TrainUtils,
 )
@@ -40,6 +41,7 @@ class QnAMaker(QnAMakerTelemetryClient):
         http_client: ClientSession = None,
         telemetry_client: BotTelemetryClient = None,
         log_personal_information: bool = None,
+        answer_cache: QnAAnswerCache = None,
     ):
         super().__init__(log_personal_information, telemetry_client)
 
@@ -71,7 +73,11 @@ class QnAMaker(QnAMakerTelemetryClient):
         self.log_personal_information = log_personal_information or False
 
         self._generate_answer_helper = GenerateAnswerUtils(
-            self.telemetry_client, self._endpoint, options, self._http_client
+            self.telemetry_client,
+            self._endpoint,
+            options,
+            self._http_client,
+            answer_cache,
         )
         self._active_learning_train_helper = TrainUtils(
             self._endpoint, self._http_client
@@ -8,6 +8,7 @@
 from .active_learning_utils import ActiveLearningUtils
 from .generate_answer_utils import GenerateAnswerUtils
 from .http_request_utils import HttpRequestUtils
+from .qna_answer_cache import QnAAnswerCache
 from .qna_telemetry_constants import QnATelemetryConstants
 from .train_utils import TrainUtils
 from .qna_card_builder import QnACardBuilder
@@ -16,6 +17,7 @@ __all__ = [
     "ActiveLearningUtils",
     "GenerateAnswerUtils",
     "HttpRequestUtils",
+    "QnAAnswerCache",
     "QnATelemetryConstants",
     "TrainUtils",
     "QnACardBuilder",
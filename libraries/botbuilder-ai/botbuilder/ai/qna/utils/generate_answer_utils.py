@@ -12,6 +12,7 @@ from botbuilder.core import BotTelemetryClient, NullTelemetryClient, TurnContext
 from botbuilder.schema import Activity
 
 from .http_request_utils import HttpRequestUtils
+from .qna_answer_cache import QnAAnswerCache
 
 from ..qnamaker_endpoint import QnAMakerEndpoint
 from ..qnamaker_options import QnAMakerOptions
@@ -39,6 +40,7 @@ class GenerateAnswerUtils:
         endpoint: QnAMakerEndpoint,
         options: QnAMakerOptions,
         http_client: ClientSession,
+        answer_cache: QnAAnswerCache = None,
     ):
         """
         Parameters
@@ -51,6 +53,8 @@ class GenerateAnswerUtils:
         options: QnA Maker options to configure the instance.
 
         http_client: HTTP client.
+
+        answer_cache: Optional cache of the answers.
         """
         self._telemetry_client = telemetry_client
         self._endpoint = endpoint
@@ -61,6 +65,7 @@ class GenerateAnswerUtils:
         self._validate_options(self.options)
 
         self._http_client = http_client
+        self._answer_cache = answer_cache
 
     async def get_answers(
         self, context: TurnContext, options: QnAMakerOptions = None
@@ -167,15 +172,21 @@ class GenerateAnswerUtils:
             strict_filters_join_operator=options.strict_filters_join_operator,
         )
 
-        http_request_helper = HttpRequestUtils(self._http_client)
+        async def query() -> QueryResults:
+            http_request_helper = HttpRequestUtils(self._http_client)
 
-        response: Any = await http_request_helper.execute_http_request(
-            url, question, self._endpoint, options.timeout
-        )
+            response: Any = await http_request_helper.execute_http_request(
+                url, question, self._endpoint, options.timeout
+            )
 
-        result: QueryResults = await self._format_qna_result(response, options)
+            return await self._format_qna_result(response, options)
 
-        return result
+        if self._answer_cache is None:
+            return await query()
+
+        # The request body holds the question and every option that changes the answers.
+        cache_key = json.dumps([url, question.serialize()], sort_keys=True)
+        return await self._answer_cache.get_or_add(cache_key, query)
 
     async def _emit_trace_info(
         self, context: TurnContext, result: List[QueryResult], options: QnAMakerOptions
@@ -0,0 +1,95 @@
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License.
+
+import asyncio
+import time
+from collections import OrderedDict
+from copy import deepcopy
+from typing import Awaitable, Callable, Dict, Tuple
+
+from ..models import QueryResults
+
+
+class QnAAnswerCache:
+    """
+    Caches the answers of a QnA Maker knowledge base.
+
+    remarks
+    --------
+        Pass an instance to `QnAMaker` to answer repeated questions without calling the service.
+        Answers are cached per knowledge base, question and query options, and concurrent queries
+        for the same key share a single request. Failed queries are not cached.
+        Derive from this class and override `get_or_add` to use a different store.
+    """
+
+    def __init__(self, max_items: int = 1000, time_to_live: float = 300):
+        """
+        Parameters
+        -----------
+        max_items (int):
+            The maximum number of answers to keep.
+        time_to_live (float):
+            The number of seconds an answer is kept.
+        """
+        if max_items is None or max_items <= 0:
+            raise ValueError("QnAAnswerCache(): max_items must be positive.")
+        if time_to_live is None or time_to_live <= 0:
+            raise ValueError("QnAAnswerCache(): time_to_live must be positive.")
+
+        self.max_items = max_items
+        self.time_to_live = time_to_live
+        self.hits = 0
+        self.misses = 0
+        self._items: "OrderedDict[str, Tuple[float, QueryResults]]" = OrderedDict()
+        self._pending: Dict[str, asyncio.Future] = {}
+
+    async def get_or_add(
+        self, key: str, query: Callable[[], Awaitable[QueryResults]]
+    ) -> QueryResults:
+        """
+        Returns the cached answers for a key, or runs the query and caches its answers.
+
+        Parameters
+        -----------
+        key (str):
+            The cache key of the query.
+        query (Callable[[], Awaitable[QueryResults]]):
+            Queries the knowledge base.
+        """
+        entry = self._items.get(key)
+        if entry is not None and entry[0] <= time.monotonic():
+            del self._items[key]
+            entry = None
+
+        if entry is not None:
+            self._items.move_to_end(key)
+            self.hits += 1
+            return deepcopy(entry[1])
+
+        self.misses += 1
+        pending = self._pending.get(key)
+        if pending is None:
+            pending = asyncio.ensure_future(self._query(key, query))
+            self._pending[key] = pending
+
+        # A cancelled caller doesn't cancel the query for the others waiting on it.
+        return deepcopy(await asyncio.shield(pending))
+
+    def clear(self):
+        self._items.clear()
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    async def _query(
+        self, key: str, query: Callable[[], Awaitable[QueryResults]]
+    ) -> QueryResults:
+        try:
+            result = await query()
+            self._items[key] = (time.monotonic() + self.time_to_live, result)
+            self._items.move_to_end(key)
+            while len(self._items) > self.max_items:
+                self._items.popitem(last=False)
+            return result
+        finally:
+            del self._pending[key]
@@ -3,16 +3,20 @@
 
 # pylint: disable=protected-access
 
+import asyncio
 import json
+import re
+import time
 from os import path
 from typing import Dict, Tuple, Union
 from unittest import mock
 from unittest.mock import MagicMock, Mock
 
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+from aioresponses import aioresponses
+from azure.cognitiveservices.language.luis.runtime.models import APIErrorException
 from aiounittest import AsyncTestCase
-from msrest import Deserializer
-from requests import Session
-from requests.models import Response
 
 from botbuilder.ai.luis import LuisApplication, LuisPredictionOptions, LuisRecognizer
 from botbuilder.ai.luis.luis_util import LuisUtil
@@ -666,6 +670,102 @@ class LuisRecognizerTest(AsyncTestCase):
     async def test_patterns(self):
         await self._test_json("Patterns.json")
 
+    async def test_v2_request(self):
+        utterance: str = "My name is Emad"
+        options = LuisPredictionOptions(include_all_intents=True, staging=True)
+        recognizer = LuisRecognizerTest._get_luis_recognizer(
+            LuisRecognizer, options=options
+        )
+        response_json = LuisRecognizerTest._get_json_for_file(
+            "SingleIntent_SimplyEntity.json"
+        )
+
+        pattern = re.compile(r"^https://westus.api.cognitive.microsoft.com.*$")
+        with aioresponses() as mock_post:
+            mock_post.post(pattern, payload=response_json, repeat=True)
+            for _ in range(2):
+                await recognizer.recognize(
+                    LuisRecognizerTest._get_context(utterance, TestAdapter())
+                )
+            requests = list(mock_post.requests.items())
+
+        (method, url), calls = requests[0]
+        self.assertEqual(1, len(requests))
+        self.assertEqual(2, len(calls))
+        self.assertEqual("POST", method)
+        self.assertEqual(f"/luis/v2.0/apps/{LuisRecognizerTest._luisAppId}", url.path)
+        self.assertEqual("true", url.query["verbose"])
+        self.assertEqual("true", url.query["staging"])
+        self.assertEqual("true", url.query["log"])
+        self.assertEqual(json.dumps(utterance), calls[0].kwargs["data"])
+        self.assertEqual(
+            LuisRecognizerTest._subscriptionKey,
+            calls[0].kwargs["headers"]["Ocp-Apim-Subscription-Key"],
+        )
+
+        # The recognizer keeps one session for all its calls.
+        http_client = recognizer._http_client
+        self.assertFalse(http_client.closed)
+        await recognizer.close()
+        self.assertTrue(http_client.closed)
+
+    async def test_v2_errors_are_api_errors(self):
+        pattern = re.compile(r"^https://westus.api.cognitive.microsoft.com.*$")
+
+        async with LuisRecognizerTest._get_luis_recognizer(
+            LuisRecognizer
+        ) as recognizer:
+            with aioresponses() as mock_post:
+                mock_post.post(
+                    pattern,
+                    status=401,
+                    payload={"statusCode": 401, "message": "Access denied"},
+                )
+                with self.assertRaises(APIErrorException) as context:
+                    await recognizer.recognize(
+                        LuisRecognizerTest._get_context("hi", TestAdapter())
+                    )
+
+        self.assertEqual("Access denied", context.exception.message)
+        self.assertIsNone(recognizer._http_client)
+
+    async def test_v2_calls_do_not_block_each_other(self):
+        response_json = LuisRecognizerTest._get_json_for_file(
+            "SingleIntent_SimplyEntity.json"
+        )
+
+        async def predict(_request: web.Request):
+            await asyncio.sleep(0.2)
+            return web.json_response(response_json)
+
+        app = web.Application()
+        app.router.add_post("/luis/v2.0/apps/{app_id}", predict)
+
+        async with TestServer(app, host="127.0.0.1") as server:
+            luis_app = LuisApplication(
+                LuisRecognizerTest._luisAppId,
+                LuisRecognizerTest._subscriptionKey,
+                str(server.make_url("")),
+            )
+            recognizer = LuisRecognizer(luis_app)
+
+            start = time.monotonic()
+            results = await asyncio.gather(
+                *[
+                    recognizer.recognize(
+                        LuisRecognizerTest._get_context(
+                            "My name is Emad", NullAdapter()
+                        )
+                    )
+                    for _ in range(5)
+                ]
+            )
+            elapsed = time.monotonic() - start
+            await recognizer.close()
+
+        self.assertTrue(all("SpecifyName" in result.intents for result in results))
+        self.assertLess(elapsed, 0.8)
+
     def assert_score(self, score: float) -> None:
         self.assertTrue(score >= 0)
         self.assertTrue(score <= 1)
@@ -721,18 +821,14 @@ class LuisRecognizerTest(AsyncTestCase):
             recognizer_class, include_api_results=include_api_results, options=options
         )
         context = LuisRecognizerTest._get_context(utterance, bot_adapter)
-        response = Mock(spec=Response)
-        response.status_code = 200
-        response.headers = {}
-        response.reason = ""
-        with mock.patch.object(Session, "send", return_value=response):
-            with mock.patch.object(
-                Deserializer, "_unpack_content", return_value=response_json
-            ):
+        pattern = re.compile(r"^https://westus.api.cognitive.microsoft.com.*$")
+        async with recognizer:
+            with aioresponses() as mock_post:
+                mock_post.post(pattern, payload=response_json, status=200)
                 result = await recognizer.recognize(
                     context, telemetry_properties, telemetry_metrics
                 )
-                return recognizer, result
+        return recognizer, result
 
     @classmethod
     def _get_json_for_file(cls, response_file: str) -> Dict[str, object]:
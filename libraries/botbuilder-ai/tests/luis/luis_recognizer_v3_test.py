@@ -14,9 +14,11 @@ from aioresponses import aioresponses
 from aiounittest import AsyncTestCase
 from botbuilder.ai.luis import LuisRecognizerOptionsV3
 from botbuilder.ai.luis import LuisApplication, LuisPredictionOptions, LuisRecognizer
+from botbuilder.ai.luis import LuisResultCache, LuisTelemetryConstants
 from botbuilder.ai.luis.luis_util import LuisUtil
 from botbuilder.core import (
     BotAdapter,
+    BotTelemetryClient,
     IntentScore,
     RecognizerResult,
     TurnContext,
@@ -28,6 +30,7 @@ from botbuilder.schema import (
     ChannelAccount,
     ConversationAccount,
 )
+from null_adapter import NullAdapter
 
 
 class LuisRecognizerV3Test(AsyncTestCase):
@@ -81,9 +84,10 @@ class LuisRecognizerV3Test(AsyncTestCase):
         pattern = re.compile(r"^https://westus.api.cognitive.microsoft.com.*$")
         mock_get.post(pattern, payload=response_json, status=200)
 
-        result = await recognizer.recognize(
-            context, telemetry_properties, telemetry_metrics
-        )
+        async with recognizer:
+            result = await recognizer.recognize(
+                context, telemetry_properties, telemetry_metrics
+            )
         return recognizer, result
 
     @classmethod
@@ -249,3 +253,65 @@ class LuisRecognizerV3Test(AsyncTestCase):
         self.assertEqual(
             LuisRecognizerV3Test._luisAppId, luis_trace_info["luisModel"]["ModelID"]
         )
+
+    async def test_result_cache(self):
+        # Arrange
+        expected_json = LuisRecognizerV3Test._get_json_for_file("Minimal_v3.json")
+        response_json = expected_json["v3"]["response"]
+        telemetry_client = mock.create_autospec(BotTelemetryClient)
+        result_cache = LuisResultCache(max_items=10)
+        options = LuisRecognizerOptionsV3(
+            telemetry_client=telemetry_client, result_cache=result_cache
+        )
+        recognizer = LuisRecognizerV3Test._get_luis_recognizer(
+            LuisRecognizer, options=options
+        )
+        pattern = re.compile(r"^https://westus.api.cognitive.microsoft.com.*$")
+
+        # Act
+        with aioresponses() as mock_post:
+            mock_post.post(pattern, payload=response_json, repeat=True)
+            first = await recognizer.recognize(
+                LuisRecognizerV3Test._get_context("fly on delta at 3pm", NullAdapter())
+            )
+            second = await recognizer.recognize(
+                LuisRecognizerV3Test._get_context("fly on delta at 3pm", NullAdapter())
+            )
+            # Entity positions refer to the exact utterance, so other casing or spacing isn't a hit.
+            await recognizer.recognize(
+                LuisRecognizerV3Test._get_context(
+                    " Fly on Delta at 3pm ", NullAdapter()
+                )
+            )
+            request_count = sum(len(calls) for calls in mock_post.requests.values())
+        await recognizer.close()
+
+        # Assert
+        self.assertEqual(2, request_count)
+        self.assertEqual(1, result_cache.hits)
+        self.assertEqual(2, result_cache.misses)
+        self.assertEqual("fly on delta at 3pm", second.text)
+        self.assertEqual(first.intents.keys(), second.intents.keys())
+        self.assertIsNot(first.entities, second.entities)
+
+        metrics = [call[0][0] for call in telemetry_client.track_metric.call_args_list]
+        self.assertEqual(
+            [
+                LuisTelemetryConstants.cache_miss_metric,
+                LuisTelemetryConstants.cache_hit_metric,
+                LuisTelemetryConstants.cache_miss_metric,
+            ],
+            metrics,
+        )
+
+    def test_result_cache_is_bounded(self):
+        result_cache = LuisResultCache(max_items=2)
+        for index in range(3):
+            result_cache.set(str(index), index)
+
+        self.assertEqual(2, len(result_cache))
+        self.assertIsNone(result_cache.get("0"))
+        self.assertEqual(2, result_cache.get("2"))
+
+        with self.assertRaises(ValueError):
+            LuisResultCache(max_items=0)
@@ -4,6 +4,7 @@
 # pylint: disable=protected-access
 # pylint: disable=too-many-lines
 
+import asyncio
 import unittest
 from os import path
 from typing import List, Dict
@@ -22,7 +23,11 @@ from botbuilder.ai.qna.models import (
     QueryResult,
     QnARequestContext,
 )
-from botbuilder.ai.qna.utils import HttpRequestUtils, QnATelemetryConstants
+from botbuilder.ai.qna.utils import (
+    HttpRequestUtils,
+    QnAAnswerCache,
+    QnATelemetryConstants,
+)
 from botbuilder.ai.qna.models import GenerateAnswerRequestBody
 from botbuilder.core import BotAdapter, BotTelemetryClient, TurnContext
 from botbuilder.core.adapters import TestAdapter
@@ -993,6 +998,83 @@ class QnaApplicationTest(aiounittest.AsyncTestCase):
             self.assertIsNotNone(filtered_results)
             self.assertEqual(3, len(filtered_results), "should get three results")
 
+    async def test_answer_cache(self):
+        # Arrange
+        response_json = QnaApplicationTest._get_json_for_file("ReturnsAnswer.json")
+        answer_cache = QnAAnswerCache()
+        qna = QnAMaker(QnaApplicationTest.tests_endpoint, answer_cache=answer_cache)
+        question: str = "how do I clean the stove?"
+
+        async def post(*_args, **_kwargs):
+            await asyncio.sleep(0.05)
+            return response_json
+
+        # Act
+        with patch("aiohttp.ClientSession.post", side_effect=post) as mock_post:
+            concurrent = await asyncio.gather(
+                *[
+                    qna.get_answers(
+                        QnaApplicationTest._get_context(question, TestAdapter())
+                    )
+                    for _ in range(3)
+                ]
+            )
+            cached = await qna.get_answers(
+                QnaApplicationTest._get_context(question, TestAdapter())
+            )
+            other_options = await qna.get_answers(
+                QnaApplicationTest._get_context(question, TestAdapter()),
+                QnAMakerOptions(top=3),
+            )
+            post_count = mock_post.call_count
+
+        # Assert
+        self.assertEqual(2, post_count)
+        self.assertEqual(2, len(answer_cache))
+        self.assertEqual(1, answer_cache.hits)
+        for answers in concurrent + [cached, other_options]:
+            self.assertEqual(1, len(answers))
+            self.assertEqual(
+                "BaseCamp: You can use a damp rag to clean around the Power Pack",
+                answers[0].answer,
+            )
+        self.assertIsNot(concurrent[0][0], cached[0])
+
+    async def test_answer_cache_using_requests_module(self):
+        response_json = QnaApplicationTest._get_json_for_file("ReturnsAnswer.json")
+        answer_cache = QnAAnswerCache()
+        qna = QnAMaker(
+            QnaApplicationTest.tests_endpoint,
+            http_client=requests,
+            answer_cache=answer_cache,
+        )
+
+        with patch("requests.post", return_value=response_json) as mock_post:
+            for _ in range(2):
+                answers = await qna.get_answers(
+                    QnaApplicationTest._get_context("how do I clean the stove?", None)
+                )
+                self.assertEqual(1, len(answers))
+            post_count = mock_post.call_count
+
+        self.assertEqual(1, post_count)
+
+    async def test_answer_cache_does_not_keep_failures(self):
+        answer_cache = QnAAnswerCache()
+        calls = 0
+
+        async def query():
+            nonlocal calls
+            calls += 1
+            raise ValueError("failed")
+
+        for _ in range(2):
+            with self.assertRaises(ValueError):
+                await answer_cache.get_or_add("key", query)
+
+        self.assertEqual(2, calls)
+        self.assertEqual(0, len(answer_cache))
+
     @classmethod
     async def _get_service_result(
         cls,
@@ -11,6 +11,7 @@ from .cosmosdb_partitioned_storage import (
     CosmosDbPartitionedStorage,
     CosmosDbPartitionedConfig,
     CosmosDbKeyEscape,
+    CosmosDbOperationMetrics,
 )
 from .blob_storage import BlobStorage, BlobStorageSettings
 
@@ -19,6 +20,7 @@ __all__ = [
     "BlobStorage",
     "BlobStorageSettings",
     "CosmosDbKeyEscape",
+    "CosmosDbOperationMetrics",
     "CosmosDbPartitionedStorage",
     "CosmosDbPartitionedConfig",
     "__version__",
@@ -1,6 +1,7 @@
 # Copyright (c) Microsoft Corporation. All rights reserved.
 # Licensed under the MIT License.
 
+import asyncio
 import json
 from typing import Dict, List
 
@@ -32,6 +33,9 @@ class BlobStorageSettings:
     :param connection_string: Connection string of the Blob Storage account.
         Required if not using account_name and account_key.
     :type connection_string: str
+    :param max_concurrency: The maximum number of blob operations the storage runs at the same time.
+        Defaults to 10.
+    :type max_concurrency: int
     """
 
     def __init__(
@@ -40,11 +44,13 @@ class BlobStorageSettings:
         account_name: str = "",
         account_key: str = "",
         connection_string: str = "",
+        max_concurrency: int = 10,
     ):
         self.container_name = container_name
         self.account_name = account_name
         self.account_key = account_key
         self.connection_string = connection_string
+        self.max_concurrency = max_concurrency
 
 
 # New Azure Blob SDK only allows connection strings, but our SDK allows key+name.
@@ -69,6 +75,8 @@ class BlobStorage(Storage):
     If an entity is an StoreItem, the storage object will set the entity's e_tag
     property value to the blob's e_tag upon read. Afterward, an match_condition with the ETag value
     will be generated during Write. New entities start with a null e_tag.
+    Multi-key reads, writes and deletes run their blob operations concurrently, bounded by
+    settings.max_concurrency. All blob operations share the connection pool of one container client.
 
     :param settings: Settings used to instantiate the Blob service.
     :type settings: :class:`botbuilder.azure.BlobStorageSettings`
@@ -92,6 +100,9 @@ class BlobStorage(Storage):
         )
 
         self.__initialized = False
+        # Created on first use, so it belongs to the running event loop.
+        self.__semaphore: asyncio.Semaphore = None
+        self.__max_concurrency = settings.max_concurrency or 10
 
     async def _initialize(self):
         if self.__initialized is False:
@@ -118,16 +129,20 @@ class BlobStorage(Storage):
 
         items = {}
 
-        for key in keys:
+        async def read_blob(key: str):
             blob_client = self.__container_client.get_blob_client(key)
 
             try:
-                items[key] = await self._inner_read_blob(blob_client)
+                async with self._get_semaphore():
+                    items[key] = await self._inner_read_blob(blob_client)
             except HttpResponseError as err:
                 if err.status_code == 404:
-                    continue
+                    return
 
-        return items
+        await asyncio.gather(*[read_blob(key) for key in keys])
+
+        # Keep the order of the requested keys.
+        return {key: items[key] for key in keys if key in items}
 
     async def write(self, changes: Dict[str, object]):
         """Stores a new entity in the configured blob container.
@@ -143,7 +158,7 @@ class BlobStorage(Storage):
 
         await self._initialize()
 
-        for name, item in changes.items():
+        async def write_blob(name: str, item: object):
             blob_reference = self.__container_client.get_blob_client(name)
 
             e_tag = None
@@ -157,12 +172,19 @@ class BlobStorage(Storage):
 
             item_str = self._store_item_to_str(item)
 
-            if e_tag:
-                await blob_reference.upload_blob(
-                    item_str, match_condition=MatchConditions.IfNotModified, etag=e_tag
-                )
-            else:
-                await blob_reference.upload_blob(item_str, overwrite=True)
+            async with self._get_semaphore():
+                if e_tag:
+                    await blob_reference.upload_blob(
+                        item_str,
+                        match_condition=MatchConditions.IfNotModified,
+                        etag=e_tag,
+                    )
+                else:
+                    await blob_reference.upload_blob(item_str, overwrite=True)
+
+        await asyncio.gather(
+            *[write_blob(name, item) for name, item in changes.items()]
+        )
 
     async def delete(self, keys: List[str]):
         """Deletes entity blobs from the configured container.
@@ -175,14 +197,22 @@ class BlobStorage(Storage):
 
         await self._initialize()
 
-        for key in keys:
+        async def delete_blob(key: str):
             blob_client = self.__container_client.get_blob_client(key)
             try:
-                await blob_client.delete_blob()
+                async with self._get_semaphore():
+                    await blob_client.delete_blob()
             # We can't delete what's already gone.
             except ResourceNotFoundError:
                 pass
 
+        await asyncio.gather(*[delete_blob(key) for key in keys])
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        if self.__semaphore is None:
+            self.__semaphore = asyncio.Semaphore(self.__max_concurrency)
+        return self.__semaphore
+
     def _store_item_to_str(self, item: object) -> str:
         return encode(item)
 
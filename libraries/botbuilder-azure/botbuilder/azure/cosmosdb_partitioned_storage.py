@@ -3,8 +3,11 @@
 
 # Copyright (c) Microsoft Corporation. All rights reserved.
 # Licensed under the MIT License.
-from typing import Dict, List
+from typing import Callable, Dict, List
 from threading import Lock
+from functools import partial
+from time import perf_counter
+import asyncio
 import json
 from hashlib import sha256
 from azure.core import MatchConditions
@@ -29,6 +32,7 @@ class CosmosDbPartitionedConfig:
         container_throughput: int = 400,
         key_suffix: str = "",
         compatibility_mode: bool = False,
+        max_concurrency: int = None,
         **kwargs,
     ):
         """Create the Config object.
@@ -44,6 +48,8 @@ class CosmosDbPartitionedConfig:
             key characters. (e.g. not: '\\', '?', '/', '#', '*')
         :param compatibility_mode: True if keys should be truncated in order to support previous CosmosDb
             max key length of 255.
+        :param max_concurrency: The maximum number of point operations the storage issues at the same time.
+            Defaults to 10.
         :return CosmosDbPartitionedConfig:
         """
         self.__config_file = kwargs.get("filename")
@@ -61,6 +67,27 @@ class CosmosDbPartitionedConfig:
         )
         self.key_suffix = key_suffix or kwargs.get("key_suffix")
         self.compatibility_mode = compatibility_mode or kwargs.get("compatibility_mode")
+        self.max_concurrency = max_concurrency or kwargs.get("max_concurrency", 10)
+
+
+class CosmosDbOperationMetrics:
+    """Running totals for one kind of point operation issued by CosmosDbPartitionedStorage."""
+
+    def __init__(self):
+        self.count = 0
+        self.request_charge = 0.0
+        self.duration = 0.0
+
+    def record(self, request_charge: float, duration: float):
+        """Record a completed operation.
+
+        :param request_charge: The request units charged for the operation.
+        :param duration: The duration of the operation in seconds.
+        :return:
+        """
+        self.count += 1
+        self.request_charge += request_charge
+        self.duration += duration
 
 
 class CosmosDbKeyEscape:
@@ -107,7 +134,12 @@ class CosmosDbKeyEscape:
 
 
 class CosmosDbPartitionedStorage(Storage):
-    """A CosmosDB based storage provider using partitioning for a bot."""
+    """A CosmosDB based storage provider using partitioning for a bot.
+
+    Multi-key reads, writes and deletes issue their point operations concurrently, bounded by
+    config.max_concurrency. The request units and time spent are tracked in read_metrics,
+    write_metrics and delete_metrics.
+    """
 
     def __init__(self, config: CosmosDbPartitionedConfig):
         """Create the storage object.
@@ -122,6 +154,12 @@ class CosmosDbPartitionedStorage(Storage):
         self.compatability_mode_partition_key = False
         # Lock used for synchronizing container creation
         self.__lock = Lock()
+        self.read_metrics = CosmosDbOperationMetrics()
+        self.write_metrics = CosmosDbOperationMetrics()
+        self.delete_metrics = CosmosDbOperationMetrics()
+        # Created on first use, so it belongs to the running event loop.
+        self.__semaphore: asyncio.Semaphore = None
+        self.__max_concurrency = config.max_concurrency or 10
         if config.key_suffix is None:
             config.key_suffix = ""
         if not config.key_suffix.__eq__(""):
@@ -147,29 +185,31 @@ class CosmosDbPartitionedStorage(Storage):
 
         await self.initialize()
 
-        store_items = {}
-
-        for key in keys:
+        async def read_key(key: str):
+            escaped_key = CosmosDbKeyEscape.sanitize_key(
+                key, self.config.key_suffix, self.config.compatibility_mode
+            )
             try:
-                escaped_key = CosmosDbKeyEscape.sanitize_key(
-                    key, self.config.key_suffix, self.config.compatibility_mode
-                )
-
-                read_item_response = self.container.read_item(
-                    escaped_key, self.__get_partition_key(escaped_key)
+                return await self.__run(
+                    self.read_metrics,
+                    self.container.read_item,
+                    escaped_key,
+                    self.__get_partition_key(escaped_key),
                 )
-                document_store_item = read_item_response
-                if document_store_item:
-                    store_items[document_store_item["realId"]] = self.__create_si(
-                        document_store_item
-                    )
             # When an item is not found a CosmosException is thrown, but we want to
             # return an empty collection so in this instance we catch and do not rethrow.
             # Throw for any other exception.
             except cosmos_exceptions.CosmosResourceNotFoundError:
-                continue
-            except Exception as err:
-                raise err
+                return None
+
+        store_items = {}
+        for document_store_item in await asyncio.gather(
+            *[read_key(key) for key in keys]
+        ):
+            if document_store_item:
+                store_items[document_store_item["realId"]] = self.__create_si(
+                    document_store_item
+                )
         return store_items
 
     async def write(self, changes: Dict[str, object]):
@@ -185,7 +225,7 @@ class CosmosDbPartitionedStorage(Storage):
 
         await self.initialize()
 
-        for key, change in changes.items():
+        async def write_key(key: str, change: object):
             e_tag = None
             if isinstance(change, dict):
                 e_tag = change.get("e_tag", None)
@@ -203,16 +243,19 @@ class CosmosDbPartitionedStorage(Storage):
 
             access_condition = e_tag != "*" and e_tag and e_tag != ""
 
-            try:
-                self.container.upsert_item(
-                    body=doc,
-                    etag=e_tag if access_condition else None,
-                    match_condition=(
-                        MatchConditions.IfNotModified if access_condition else None
-                    ),
-                )
-            except Exception as err:
-                raise err
+            await self.__run(
+                self.write_metrics,
+                self.container.upsert_item,
+                body=doc,
+                etag=e_tag if access_condition else None,
+                match_condition=(
+                    MatchConditions.IfNotModified if access_condition else None
+                ),
+            )
+
+        await asyncio.gather(
+            *[write_key(key, change) for key, change in changes.items()]
+        )
 
     async def delete(self, keys: List[str]):
         """Remove storeitems from storage.
@@ -222,19 +265,21 @@ class CosmosDbPartitionedStorage(Storage):
         """
         await self.initialize()
 
-        for key in keys:
+        async def delete_key(key: str):
             escaped_key = CosmosDbKeyEscape.sanitize_key(
                 key, self.config.key_suffix, self.config.compatibility_mode
             )
             try:
-                self.container.delete_item(
+                await self.__run(
+                    self.delete_metrics,
+                    self.container.delete_item,
                     escaped_key,
                     self.__get_partition_key(escaped_key),
                 )
             except cosmos_exceptions.CosmosResourceNotFoundError:
-                continue
-            except Exception as err:
-                raise err
+                pass
+
+        await asyncio.gather(*[delete_key(key) for key in keys])
 
     async def initialize(self):
         if not self.container:
@@ -298,6 +343,37 @@ class CosmosDbPartitionedStorage(Storage):
                 else:
                     raise err
 
+    def __get_semaphore(self) -> asyncio.Semaphore:
+        if self.__semaphore is None:
+            self.__semaphore = asyncio.Semaphore(self.__max_concurrency)
+        return self.__semaphore
+
+    async def __run(
+        self, metrics: CosmosDbOperationMetrics, operation: Callable, *args, **kwargs
+    ):
+        """Run a blocking point operation on the default executor, bounded by max_concurrency.
+
+        :param metrics: The metrics to record the operation in.
+        :param operation: The container operation to run.
+        :return: The result of the operation.
+        """
+        request_charges = []
+
+        def response_hook(headers, _):
+            request_charges.append(
+                float(headers.get(http_constants.HttpHeaders.RequestCharge, 0))
+            )
+
+        async with self.__get_semaphore():
+            start = perf_counter()
+            try:
+                return await asyncio.get_event_loop().run_in_executor(
+                    None,
+                    partial(operation, *args, response_hook=response_hook, **kwargs),
+                )
+            finally:
+                metrics.record(sum(request_charges), perf_counter() - start)
+
     def __get_partition_key(self, key: str) -> str:
         return None if self.compatability_mode_partition_key else key
 
@@ -1,8 +1,16 @@
 # Copyright (c) Microsoft Corporation. All rights reserved.
 # Licensed under the MIT License.
 
+import asyncio
+from contextlib import asynccontextmanager
+
 import pytest
-from azure.core.exceptions import ResourceNotFoundError
+from azure.core.exceptions import (
+    HttpResponseError,
+    ResourceExistsError,
+    ResourceModifiedError,
+    ResourceNotFoundError,
+)
 from azure.storage.blob.aio import BlobServiceClient
 from botbuilder.core import StoreItem
 from botbuilder.azure import BlobStorage, BlobStorageSettings
@@ -244,3 +252,146 @@ class TestBlobStorage:
         await storage.delete(["foo", "bar"])
         data = await storage.read(["test"])
         assert len(data.keys()) == 1
+
+
+class FakeBlobProperties:
+    def __init__(self, etag: str):
+        self.etag = etag
+
+
+class FakeDownloader:
+    def __init__(self, content: str, etag: str):
+        self.properties = FakeBlobProperties(f'"{etag}"')
+        self._content = content
+
+    async def content_as_text(self):
+        return self._content
+
+
+class FakeBlobClient:
+    def __init__(self, container: "FakeContainerClient", name: str):
+        self._container = container
+        self._name = name
+
+    async def download_blob(self):
+        async with self._container.operation():
+            if self._name not in self._container.blobs:
+                raise HttpResponseError(response=FakeResponse(404))
+            return FakeDownloader(*self._container.blobs[self._name])
+
+    async def upload_blob(self, data, overwrite=False, match_condition=None, etag=None):
+        async with self._container.operation():
+            current = self._container.blobs.get(self._name)
+            if match_condition and (current is None or current[1] != etag):
+                raise ResourceModifiedError()
+            if not overwrite and not match_condition and current is not None:
+                raise ResourceExistsError()
+            self._container.e_tag += 1
+            self._container.blobs[self._name] = (data, str(self._container.e_tag))
+
+    async def delete_blob(self):
+        async with self._container.operation():
+            if self._name not in self._container.blobs:
+                raise ResourceNotFoundError()
+            del self._container.blobs[self._name]
+
+
+class FakeResponse:
+    def __init__(self, status_code: int):
+        self.status_code = status_code
+        self.reason = None
+        self.headers = {}
+
+    def text(self):
+        return ""
+
+
+class FakeContainerClient:
+    """An in-memory stand-in for the Azurite container client."""
+
+    def __init__(self, delay: float = 0):
+        self.blobs = {}
+        self.e_tag = 0
+        self.delay = delay
+        self.active = 0
+        self.max_active = 0
+
+    async def create_container(self):
+        pass
+
+    def get_blob_client(self, name: str) -> FakeBlobClient:
+        return FakeBlobClient(self, name)
+
+    @asynccontextmanager
+    async def operation(self):
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        try:
+            await asyncio.sleep(self.delay)
+            yield
+        finally:
+            self.active -= 1
+
+
+def get_fake_storage(container: FakeContainerClient = None, max_concurrency=10):
+    settings = BlobStorageSettings(
+        container_name="test",
+        connection_string=BLOB_STORAGE_SETTINGS.connection_string,
+        max_concurrency=max_concurrency,
+    )
+    storage = BlobStorage(settings)
+    # pylint: disable=protected-access
+    storage._BlobStorage__container_client = container or FakeContainerClient()
+    return storage
+
+
+class TestBlobStorageWithFakeContainer:
+    @pytest.mark.asyncio
+    async def test_create_object(self):
+        test_ran = await StorageBaseTests.create_object(get_fake_storage())
+
+        assert test_ran
+
+    @pytest.mark.asyncio
+    async def test_update_object(self):
+        test_ran = await StorageBaseTests.update_object(get_fake_storage())
+
+        assert test_ran
+
+    @pytest.mark.asyncio
+    async def test_perform_batch_operations(self):
+        test_ran = await StorageBaseTests.perform_batch_operations(get_fake_storage())
+
+        assert test_ran
+
+    @pytest.mark.asyncio
+    async def test_multi_key_operations_are_concurrent_and_bounded(self):
+        container = FakeContainerClient(delay=0.01)
+        storage = get_fake_storage(container, max_concurrency=4)
+        keys = [f"key{index}" for index in range(12)]
+
+        await storage.write(
+            {key: SimpleStoreItem(counter=index) for index, key in enumerate(keys)}
+        )
+        data = await storage.read(["unknown"] + keys)
+        await storage.delete(keys)
+
+        assert list(data.keys()) == keys
+        assert data["key3"].counter == 3
+        assert not container.blobs
+        assert container.max_active == 4
+
+    def test_can_be_created_before_the_loop(self):
+        storage = get_fake_storage(max_concurrency=2)
+
+        async def write_and_read():
+            await storage.write({"key": SimpleStoreItem(counter=2)})
+            return await storage.read(["key"])
+
+        loop = asyncio.new_event_loop()
+        try:
+            data = loop.run_until_complete(write_and_read())
+        finally:
+            loop.close()
+
+        assert data["key"].counter == 2
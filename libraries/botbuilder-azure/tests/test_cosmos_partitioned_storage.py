@@ -1,6 +1,11 @@
 # Copyright (c) Microsoft Corporation. All rights reserved.
 # Licensed under the MIT License.
 
+from contextlib import contextmanager
+from copy import deepcopy
+from threading import Lock
+from time import sleep
+
 import azure.cosmos.exceptions as cosmos_exceptions
 from azure.cosmos import documents
 import pytest
@@ -203,3 +208,118 @@ class TestCosmosDbPartitionedStorageBaseStorageTests:
         test_ran = await StorageBaseTests.proceeds_through_waterfall(get_storage())
 
         assert test_ran
+
+
+class FakeContainer:
+    """An in-memory stand-in for the container client, so the storage can be tested without an account."""
+
+    def __init__(self, delay: float = 0):
+        self.documents = {}
+        self.delay = delay
+        self.active = 0
+        self.max_active = 0
+        self._lock = Lock()
+        self._e_tag = 0
+
+    def read_item(self, item, partition_key, response_hook=None, **_):
+        with self._operation(response_hook):
+            if item not in self.documents:
+                raise cosmos_exceptions.CosmosResourceNotFoundError()
+            return deepcopy(self.documents[item])
+
+    def upsert_item(
+        self, body, etag=None, match_condition=None, response_hook=None, **_
+    ):
+        with self._operation(response_hook):
+            current = self.documents.get(body["id"])
+            if match_condition and (current is None or current["_etag"] != etag):
+                raise cosmos_exceptions.CosmosAccessConditionFailedError()
+            with self._lock:
+                self._e_tag += 1
+                body = dict(body, _etag=str(self._e_tag))
+            self.documents[body["id"]] = body
+            return body
+
+    def delete_item(self, item, partition_key, response_hook=None, **_):
+        with self._operation(response_hook):
+            if item not in self.documents:
+                raise cosmos_exceptions.CosmosResourceNotFoundError()
+            del self.documents[item]
+
+    @contextmanager
+    def _operation(self, response_hook):
+        with self._lock:
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        try:
+            sleep(self.delay)
+            yield
+            if response_hook:
+                response_hook({"x-ms-request-charge": "1.5"}, None)
+        finally:
+            with self._lock:
+                self.active -= 1
+
+
+def get_fake_storage(container: FakeContainer = None, max_concurrency: int = None):
+    config = get_settings()
+    config.max_concurrency = max_concurrency
+    storage = CosmosDbPartitionedStorage(config)
+    storage.container = container or FakeContainer()
+    return storage
+
+
+class TestCosmosDbPartitionedStorageWithFakeContainer:
+    @pytest.mark.asyncio
+    async def test_create_object(self):
+        test_ran = await StorageBaseTests.create_object(get_fake_storage())
+
+        assert test_ran
+
+    @pytest.mark.asyncio
+    async def test_update_object(self):
+        test_ran = await StorageBaseTests.update_object(get_fake_storage())
+
+        assert test_ran
+
+    @pytest.mark.asyncio
+    async def test_delete_object(self):
+        test_ran = await StorageBaseTests.delete_object(get_fake_storage())
+
+        assert test_ran
+
+    @pytest.mark.asyncio
+    async def test_perform_batch_operations(self):
+        test_ran = await StorageBaseTests.perform_batch_operations(get_fake_storage())
+
+        assert test_ran
+
+    @pytest.mark.asyncio
+    async def test_multi_key_operations_are_concurrent_and_bounded(self):
+        container = FakeContainer(delay=0.02)
+        storage = get_fake_storage(container, max_concurrency=4)
+        keys = [f"key{index}" for index in range(12)]
+
+        await storage.write({key: {"value": key} for key in keys})
+        items = await storage.read(keys + ["unknown"])
+        await storage.delete(keys)
+
+        assert sorted(items.keys()) == sorted(keys)
+        assert items["key3"]["value"] == "key3"
+        assert not container.documents
+        assert container.max_active == 4
+
+    @pytest.mark.asyncio
+    async def test_records_operation_metrics(self):
+        storage = get_fake_storage()
+
+        await storage.write({"a": {"value": 1}, "b": {"value": 2}})
+        await storage.read(["a", "b", "c"])
+        await storage.delete(["a"])
+
+        assert storage.write_metrics.count == 2
+        assert storage.write_metrics.request_charge == 3.0
+        assert storage.read_metrics.count == 3
+        assert storage.read_metrics.request_charge == 3.0
+        assert storage.delete_metrics.count == 1
+        assert storage.delete_metrics.duration >= 0
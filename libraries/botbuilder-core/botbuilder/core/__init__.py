@@ -11,6 +11,7 @@ from . import conversation_reference_extension
 from .about import __version__
 from .activity_handler import ActivityHandler
 from .auto_save_state_middleware import AutoSaveStateMiddleware
+from .background_transcript_logger import BackgroundTranscriptLogger
 from .bot import Bot
 from .bot_assert import BotAssert
 from .bot_adapter import BotAdapter
@@ -18,6 +19,7 @@ from .bot_framework_adapter import BotFrameworkAdapter, BotFrameworkAdapterSetti
 from .bot_state import BotState
 from .bot_state_set import BotStateSet
 from .bot_telemetry_client import BotTelemetryClient, Severity
+from .caching_storage import CachingStorage
 from .card_factory import CardFactory
 from .channel_service_handler import BotActionNotImplementedError, ChannelServiceHandler
 from .cloud_adapter_base import CloudAdapterBase
@@ -39,6 +41,7 @@ from .recognizer_result import RecognizerResult, TopIntent
 from .show_typing_middleware import ShowTypingMiddleware
 from .state_property_accessor import StatePropertyAccessor
 from .state_property_info import StatePropertyInfo
+from .state_fingerprint import compute_pickle_hash, compute_state_fingerprint
 from .storage import Storage, StoreItem, calculate_change_hash
 from .telemetry_constants import TelemetryConstants
 from .telemetry_logger_constants import TelemetryLoggerConstants
@@ -55,6 +58,7 @@ __all__ = [
     "AnonymousReceiveMiddleware",
     "AutoSaveStateMiddleware",
     "Bot",
+    "BackgroundTranscriptLogger",
     "BotActionNotImplementedError",
     "BotAdapter",
     "BotAssert",
@@ -63,12 +67,15 @@ __all__ = [
     "BotState",
     "BotStateSet",
     "BotTelemetryClient",
+    "CachingStorage",
     "calculate_change_hash",
     "CardFactory",
     "ChannelServiceHandler",
     "CloudAdapterBase",
     "CloudChannelServiceHandler",
     "ComponentRegistration",
+    "compute_pickle_hash",
+    "compute_state_fingerprint",
     "ConversationState",
     "conversation_reference_extension",
     "ExtendedUserTokenProvider",
@@ -0,0 +1,151 @@
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License.
+
+import asyncio
+import traceback
+from collections import deque
+from time import monotonic
+from typing import Deque, Dict, List, Tuple
+
+from botbuilder.schema import Activity
+
+from .transcript_logger import TranscriptLogger, log_activities
+
+
+class BackgroundTranscriptLogger(TranscriptLogger):
+    """
+    A transcript logger that writes to another logger in the background.
+
+    .. remarks::
+        Activities are queued and written by a background task, so a turn doesn't wait on its transcript.
+        The queued activities of a conversation are written in order, in batches of up to `max_batch_size`,
+        through :meth:`TranscriptLogger.log_activities` of the underlying logger. Different conversations
+        are written concurrently.
+
+        At most `max_queued_activities` activities are queued; while the queue is full, new activities are
+        dropped and counted in `dropped`. Activities the underlying logger fails to write are counted in
+        `failed`. `lag` is the number of seconds the last written batch waited in the queue.
+
+        Call :meth:`close` before shutting down to write the queued activities.
+    """
+
+    def __init__(
+        self,
+        logger: TranscriptLogger,
+        max_queued_activities: int = 10000,
+        max_batch_size: int = 100,
+    ):
+        """
+        Initializes a new instance of the :class:`BackgroundTranscriptLogger` class.
+
+        :param logger: The logger to write the activities to.
+        :type logger: :class:`TranscriptLogger`
+        :param max_queued_activities: The maximum number of activities waiting to be written.
+        :type max_queued_activities: int
+        :param max_batch_size: The maximum number of activities written in one call to the logger.
+        :type max_batch_size: int
+        """
+        if logger is None:
+            raise TypeError("BackgroundTranscriptLogger(): logger cannot be None.")
+        if max_queued_activities <= 0:
+            raise ValueError(
+                "BackgroundTranscriptLogger(): max_queued_activities must be positive."
+            )
+        if max_batch_size <= 0:
+            raise ValueError(
+                "BackgroundTranscriptLogger(): max_batch_size must be positive."
+            )
+
+        self.logger = logger
+        self.max_queued_activities = max_queued_activities
+        self.max_batch_size = max_batch_size
+        self.dropped = 0
+        self.failed = 0
+        self.lag = 0.0
+        self._queue: Deque[Tuple[float, Activity]] = deque()
+        # Created with the worker, so they belong to the loop the activities are logged on.
+        self._activity_queued: asyncio.Event = None
+        self._idle: asyncio.Event = None
+        self._worker: asyncio.Future = None
+        self._closed = False
+
+    @property
+    def queue_length(self) -> int:
+        """The number of activities waiting to be written."""
+        return len(self._queue)
+
+    async def log_activity(self, activity: Activity) -> None:
+        await self.log_activities([activity])
+
+    async def log_activities(self, activities: List[Activity]) -> None:
+        if self._closed:
+            await log_activities(self.logger, activities)
+            return
+
+        queued_at = monotonic()
+        for activity in activities:
+            if len(self._queue) >= self.max_queued_activities:
+                self.dropped += 1
+                continue
+            self._queue.append((queued_at, activity))
+
+        if self._queue:
+            if self._worker is None:
+                self._activity_queued = asyncio.Event()
+                self._idle = asyncio.Event()
+                self._worker = asyncio.ensure_future(self._write_queued())
+            self._idle.clear()
+            self._activity_queued.set()
+
+    async def flush(self):
+        """
+        Waits until the queued activities are written.
+        """
+        if self._idle is not None:
+            await self._idle.wait()
+
+    async def close(self):
+        """
+        Writes the queued activities and stops the background task.
+        Activities logged afterwards are written directly to the underlying logger.
+        """
+        await self.flush()
+        self._closed = True
+
+        if self._worker is not None:
+            self._worker.cancel()
+            self._worker = None
+
+    async def _write_queued(self):
+        while True:
+            if not self._queue:
+                self._idle.set()
+                self._activity_queued.clear()
+                await self._activity_queued.wait()
+                continue
+
+            queued = self._queue
+            self._queue = deque()
+
+            conversations: Dict[Tuple[str, str], List[Tuple[float, Activity]]] = {}
+            for item in queued:
+                activity = item[1]
+                key = (
+                    activity.channel_id,
+                    activity.conversation.id if activity.conversation else None,
+                )
+                conversations.setdefault(key, []).append(item)
+
+            await asyncio.gather(
+                *[self._write_conversation(items) for items in conversations.values()]
+            )
+
+    async def _write_conversation(self, items: List[Tuple[float, Activity]]):
+        for index in range(0, len(items), self.max_batch_size):
+            batch = items[index : index + self.max_batch_size]
+            try:
+                await log_activities(self.logger, [activity for _, activity in batch])
+                self.lag = monotonic() - batch[0][0]
+            except Exception:  # pylint: disable=broad-except
+                self.failed += len(batch)
+                traceback.print_exc()
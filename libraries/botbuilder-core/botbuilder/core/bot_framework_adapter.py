@@ -11,8 +11,9 @@ import uuid
 from http import HTTPStatus
 from typing import List, Callable, Awaitable, Union, Dict
 from msrest.serialization import Model
+from msrest.universal_http.async_abc import AsyncHTTPSender as AsyncHttpDriver
 
-from botframework.connector import Channels, EmulatorApiClient
+from botframework.connector import AsyncBfPipeline, Channels, EmulatorApiClient
 from botframework.connector.aio import ConnectorClient
 from botframework.connector.auth import (
     AuthenticationConfiguration,
@@ -121,6 +122,7 @@ class BotFrameworkAdapterSettings:
         auth_configuration: AuthenticationConfiguration = None,
         app_credentials: AppCredentials = None,
         credential_provider: CredentialProvider = None,
+        http_driver: AsyncHttpDriver = None,
     ):
         """
         Contains the settings used to initialize a :class:`BotFrameworkAdapter` instance.
@@ -143,6 +145,8 @@ class BotFrameworkAdapterSettings:
         :type auth_configuration: :class:`botframework.connector.auth.AuthenticationConfiguration`
         :param credential_provider: Defaults to SimpleCredentialProvider if one isn't specified.
         :param app_credentials: Allows for a custom AppCredentials.  Used, for example, for CertificateAppCredentials.
+        :param http_driver: The HTTP driver the connector clients send their requests with, such as the
+        `AiohttpHttpDriver` of botbuilder-integration-aiohttp. Defaults to the requests driver of msrest.
         """
 
         self.app_id = app_id
@@ -159,6 +163,7 @@ class BotFrameworkAdapterSettings:
             else SimpleCredentialProvider(self.app_id, self.app_password)
         )
         self.auth_configuration = auth_configuration or AuthenticationConfiguration()
+        self.http_driver = http_driver
 
         # If no open_id_metadata values were passed in the settings, check the
         # process' Environment Variable.
@@ -1154,7 +1159,16 @@ class BotFrameworkAdapter(
         )
         client = self._connector_client_cache.get(client_key)
         if not client:
-            client = ConnectorClient(credentials, base_url=service_url)
+            http_driver = getattr(self.settings, "http_driver", None)
+            if http_driver:
+                client = ConnectorClient(
+                    credentials,
+                    base_url=service_url,
+                    pipeline_type=AsyncBfPipeline,
+                    driver=http_driver,
+                )
+            else:
+                client = ConnectorClient(credentials, base_url=service_url)
             client.config.add_user_agent(USER_AGENT)
             self._connector_client_cache[client_key] = client
 
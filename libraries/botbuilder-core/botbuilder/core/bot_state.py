@@ -3,30 +3,125 @@
 
 from abc import abstractmethod
 from copy import deepcopy
-from typing import Callable, Dict, Union
-from jsonpickle.pickler import Pickler
+from typing import Callable, Dict, Set, Union
 from botbuilder.core.state_property_accessor import StatePropertyAccessor
 from .bot_assert import BotAssert
+from .state_fingerprint import StateHashFunction, compute_state_fingerprint
 from .turn_context import TurnContext
 from .storage import Storage
 from .property_manager import PropertyManager
 
+_IMMUTABLE_TYPES = (type(None), bool, int, float, str, bytes)
+
 
 class CachedBotState:
     """
     Internal cached bot state.
+
+    .. remarks::
+        Properties read or written through :class:`BotState` are tracked individually, so detecting
+        changes only fingerprints the values handed out during the turn. Accessing the raw :attr:`state`
+        dictionary falls back to fingerprinting every property.
     """
 
-    def __init__(self, state: Dict[str, object] = None):
-        self.state = state if state is not None else {}
-        self.hash = self.compute_hash(state)
+    def __init__(
+        self,
+        state: Dict[str, object] = None,
+        hash_function: StateHashFunction = None,
+    ):
+        self._state = state if state is not None else {}
+        self._hash_function = hash_function or compute_state_fingerprint
+        self._property_hashes: Dict[str, str] = {}
+        self._immutable_values: Dict[str, object] = {}
+        self._changed_properties: Set[str] = set()
+        self._state_exposed = False
+        # State that did not exist in storage is always written on the first save.
+        self._force_changed = state is None
+
+    @property
+    def state(self) -> Dict[str, object]:
+        if not self._state_exposed:
+            self._state_exposed = True
+            for name, value in self._state.items():
+                self._track(name, value)
+        return self._state
+
+    @property
+    def untracked_state(self) -> Dict[str, object]:
+        """
+        The state dictionary, returned without giving up per-property tracking.
+        Only use this to hand the state to storage.
+        """
+        return self._state
+
+    @property
+    def is_empty(self) -> bool:
+        return not self._state
 
     @property
     def is_changed(self) -> bool:
-        return self.hash != self.compute_hash(self.state)
+        if self._force_changed or self._changed_properties:
+            return True
+
+        for name, value_hash in self._property_hashes.items():
+            if name not in self._state:
+                return True
+            value = self._state[name]
+            if name in self._immutable_values:
+                if value is not self._immutable_values[name]:
+                    return True
+            elif value_hash != self.compute_hash(value):
+                return True
+
+        if self._state_exposed:
+            return any(name not in self._property_hashes for name in self._state)
+
+        return False
 
     def compute_hash(self, obj: object) -> str:
-        return str(Pickler().flatten(obj))
+        return self._hash_function(obj)
+
+    def get_value(self, name: str) -> object:
+        value = self._state[name]
+        self._track(name, value)
+        return value
+
+    def set_value(self, name: str, value: object):
+        self._state[name] = value
+        self._changed_properties.add(name)
+
+    def delete_value(self, name: str):
+        del self._state[name]
+        self._changed_properties.add(name)
+
+    def mark_changed(self):
+        self._force_changed = True
+
+    def mark_saved(self):
+        """
+        Resets change tracking after the state has been persisted.
+        """
+        if self._state_exposed:
+            tracked = set(self._state)
+        else:
+            tracked = set(self._property_hashes).union(self._changed_properties)
+        self._property_hashes = {}
+        self._immutable_values = {}
+        self._changed_properties = set()
+        self._force_changed = False
+        for name in tracked:
+            if name in self._state:
+                self._track(name, self._state[name])
+
+    def _track(self, name: str, value: object):
+        if name in self._property_hashes or name in self._changed_properties:
+            return
+        if type(value) in _IMMUTABLE_TYPES:
+            # Immutable values can only change by being replaced, so identity is enough.
+            self._property_hashes[name] = None
+            self._immutable_values[name] = value
+            return
+        self._property_hashes[name] = self.compute_hash(value)
 
 
 class BotState(PropertyManager):
@@ -41,7 +136,12 @@ class BotState(PropertyManager):
         You can define additional scopes for your bot.
     """
 
-    def __init__(self, storage: Storage, context_service_key: str):
+    def __init__(
+        self,
+        storage: Storage,
+        context_service_key: str,
+        state_hash_function: StateHashFunction = None,
+    ):
         """
         Initializes a new instance of the :class:`BotState` class.
 
@@ -49,6 +149,10 @@ class BotState(PropertyManager):
         :type storage:  :class:`bptbuilder.core.Storage`
         :param context_service_key: The key for the state cache for this :class:`BotState`
         :type context_service_key: str
+        :param state_hash_function: Optional, the function used to detect changes to the cached state.
+            Defaults to :func:`compute_state_fingerprint`; pass :func:`compute_pickle_hash` to use the
+            jsonpickle based detection.
+        :type state_hash_function: Callable[[object], str]
 
         .. remarks::
             This constructor creates a state management object and associated scope. The object uses
@@ -60,6 +164,7 @@ class BotState(PropertyManager):
         self.state_key = "state"
         self._storage = storage
         self._context_service_key = context_service_key
+        self.state_hash_function = state_hash_function or compute_state_fingerprint
 
     def get_cached_state(self, turn_context: TurnContext):
         """
@@ -103,13 +208,11 @@ class BotState(PropertyManager):
         """
         BotAssert.context_not_none(turn_context)
 
-        cached_state = self.get_cached_state(turn_context)
         storage_key = self.get_storage_key(turn_context)
 
-        if force or not cached_state or not cached_state.state:
+        if self._is_load_required(turn_context, force):
             items = await self._storage.read([storage_key])
-            val = items.get(storage_key)
-            turn_context.turn_state[self._context_service_key] = CachedBotState(val)
+            self._set_loaded_state(turn_context, items.get(storage_key))
 
     async def save_changes(
         self, turn_context: TurnContext, force: bool = False
@@ -125,13 +228,28 @@ class BotState(PropertyManager):
         """
         BotAssert.context_not_none(turn_context)
 
+        changes = self._get_changes(turn_context, force)
+        if changes:
+            await self._storage.write(changes)
+            self.get_cached_state(turn_context).mark_saved()
+
+    def _is_load_required(self, turn_context: TurnContext, force: bool) -> bool:
+        cached_state = self.get_cached_state(turn_context)
+        return force or not cached_state or cached_state.is_empty
+
+    def _set_loaded_state(self, turn_context: TurnContext, state: Dict[str, object]):
+        turn_context.turn_state[self._context_service_key] = CachedBotState(
+            state, self.state_hash_function
+        )
+
+    def _get_changes(self, turn_context: TurnContext, force: bool) -> Dict[str, object]:
         cached_state = self.get_cached_state(turn_context)
 
         if force or (cached_state is not None and cached_state.is_changed):
             storage_key = self.get_storage_key(turn_context)
-            changes: Dict[str, object] = {storage_key: cached_state.state}
-            await self._storage.write(changes)
-            cached_state.hash = cached_state.compute_hash(cached_state.state)
+            return {storage_key: cached_state.untracked_state}
+
+        return {}
 
     async def clear_state(self, turn_context: TurnContext):
         """
@@ -147,9 +265,9 @@ class BotState(PropertyManager):
         """
         BotAssert.context_not_none(turn_context)
 
-        #  Explicitly setting the hash will mean IsChanged is always true. And that will force a Save.
-        cache_value = CachedBotState()
-        cache_value.hash = ""
+        #  Explicitly marking the state as changed will mean IsChanged is always true. And that will force a Save.
+        cache_value = CachedBotState({}, self.state_hash_function)
+        cache_value.mark_changed()
         turn_context.turn_state[self._context_service_key] = cache_value
 
     async def delete(self, turn_context: TurnContext) -> None:
@@ -192,7 +310,7 @@ class BotState(PropertyManager):
 
         # if there is no value, this will throw, to signal to IPropertyAccesor that a default value should be computed
         # This allows this to work with value types
-        return cached_state.state[property_name]
+        return cached_state.get_value(property_name)
 
     async def delete_property_value(
         self, turn_context: TurnContext, property_name: str
@@ -211,7 +329,7 @@ class BotState(PropertyManager):
         if not property_name:
             raise TypeError("BotState.delete_property(): property_name cannot be None.")
         cached_state = self.get_cached_state(turn_context)
-        del cached_state.state[property_name]
+        cached_state.delete_value(property_name)
 
     async def set_property_value(
         self, turn_context: TurnContext, property_name: str, value: object
@@ -232,7 +350,7 @@ class BotState(PropertyManager):
         if not property_name:
             raise TypeError("BotState.delete_property(): property_name cannot be None.")
         cached_state = self.get_cached_state(turn_context)
-        cached_state.state[property_name] = value
+        cached_state.set_value(property_name, value)
 
 
 class BotStatePropertyAccessor(StatePropertyAccessor):
@@ -1,12 +1,23 @@
 # Copyright (c) Microsoft Corporation. All rights reserved.
 # Licensed under the MIT License.
 
-from typing import List
+import asyncio
+from typing import Dict, List, Tuple
 from .bot_state import BotState
+from .storage import Storage
 from .turn_context import TurnContext
 
 
 class BotStateSet:
+    """
+    Manages a collection of :class:`BotState` objects.
+
+    .. remarks::
+        State objects that share a storage are loaded with a single multi-key read and saved with a single
+        multi-key write. Separate storages are accessed concurrently. State objects that override
+        :meth:`BotState.load` or :meth:`BotState.save_changes` are called individually.
+    """
+
     def __init__(self, bot_states: List[BotState]):
         self.bot_states = list(bot_states)
 
@@ -18,9 +29,60 @@ class BotStateSet:
         return self
 
     async def load_all(self, turn_context: TurnContext, force: bool = False):
+        # pylint: disable=protected-access
+        tasks = []
+        batches: Dict[int, Tuple[Storage, List[Tuple[BotState, str]]]] = {}
+
         for bot_state in self.bot_states:
-            await bot_state.load(turn_context, force)
+            if not BotStateSet._can_batch(bot_state, "load"):
+                tasks.append(bot_state.load(turn_context, force))
+                continue
+
+            storage_key = bot_state.get_storage_key(turn_context)
+            if bot_state._is_load_required(turn_context, force):
+                storage = bot_state._storage
+                batches.setdefault(id(storage), (storage, []))[1].append(
+                    (bot_state, storage_key)
+                )
+
+        async def read_batch(storage: Storage, entries: List[Tuple[BotState, str]]):
+            items = await storage.read(list({key: None for _, key in entries}))
+            for bot_state, storage_key in entries:
+                bot_state._set_loaded_state(turn_context, items.get(storage_key))
+
+        tasks.extend(read_batch(*batch) for batch in batches.values())
+        await asyncio.gather(*tasks)
 
     async def save_all_changes(self, turn_context: TurnContext, force: bool = False):
+        # pylint: disable=protected-access
+        tasks = []
+        batches: Dict[int, Tuple[Storage, Dict[str, object], List[BotState]]] = {}
+
         for bot_state in self.bot_states:
-            await bot_state.save_changes(turn_context, force)
+            if not BotStateSet._can_batch(bot_state, "save_changes"):
+                tasks.append(bot_state.save_changes(turn_context, force))
+                continue
+
+            changes = bot_state._get_changes(turn_context, force)
+            if changes:
+                storage = bot_state._storage
+                batch = batches.setdefault(id(storage), (storage, {}, []))
+                batch[1].update(changes)
+                batch[2].append(bot_state)
+
+        async def write_batch(
+            storage: Storage, changes: Dict[str, object], bot_states: List[BotState]
+        ):
+            await storage.write(changes)
+            for bot_state in bot_states:
+                bot_state.get_cached_state(turn_context).mark_saved()
+
+        tasks.extend(write_batch(*batch) for batch in batches.values())
+        await asyncio.gather(*tasks)
+
+    @staticmethod
+    def _can_batch(bot_state: BotState, method_name: str) -> bool:
+        # State objects that replace how they are loaded or saved are left to do so.
+        return getattr(type(bot_state), method_name) is getattr(
+            BotState, method_name
+        ) and hasattr(bot_state, "_storage")
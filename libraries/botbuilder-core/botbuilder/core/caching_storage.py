@@ -0,0 +1,197 @@
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License.
+
+import asyncio
+from copy import deepcopy
+from typing import Dict, List
+
+from .memory_storage import MemoryStorage
+from .storage import Storage
+
+
+class CachingStorage(Storage):
+    """
+    A storage layer that keeps a local in-memory copy of the items of another storage.
+
+    .. remarks::
+        Reads are served from the local cache when possible and only the missing keys are read from
+        the underlying storage. Writes go to the underlying storage, so e_tag conflicts are still detected
+        there. Since the underlying storage assigns new e_tags on write, written keys are dropped from the
+        cache and cached again on the next read. Turns that only read state don't touch the underlying
+        storage at all.
+
+        Other processes writing to the same storage are not seen until a cached item expires, so
+        `time_to_live` bounds how stale a read can be.
+
+        When `write_delay` is set, writes are held for that many seconds and writes to the same key within
+        the window are coalesced into one. Held items are served to reads and written one key at a time, so a
+        failing key doesn't hold back the others. An item rejected because of an e_tag conflict is dropped,
+        so the next read returns the item from the underlying storage. An item that fails otherwise is held
+        again, unless the key was written again meanwhile, and retried by the next delayed write or
+        :meth:`flush`. :meth:`flush` waits for a delayed write in progress and raises the first error of the
+        delayed writes since the last flush, or of its own write. Call it before shutting down.
+    """
+
+    def __init__(
+        self,
+        storage: Storage,
+        max_items: int = None,
+        time_to_live: float = None,
+        write_delay: float = None,
+    ):
+        """
+        Initializes a new instance of the :class:`CachingStorage` class.
+
+        :param storage: The storage to cache.
+        :type storage: :class:`Storage`
+        :param max_items: Optional, the maximum number of items to keep in the cache.
+        :type max_items: int
+        :param time_to_live: Optional, the number of seconds an item is kept in the cache.
+        :type time_to_live: float
+        :param write_delay: Optional, the number of seconds writes are held and coalesced.
+        :type write_delay: float
+        """
+        if storage is None:
+            raise TypeError("CachingStorage(): storage cannot be None.")
+        if write_delay is not None and write_delay <= 0:
+            raise ValueError("CachingStorage(): write_delay must be positive.")
+
+        super(CachingStorage, self).__init__()
+        self.storage = storage
+        self.cache = MemoryStorage(max_items=max_items, time_to_live=time_to_live)
+        self.write_delay = write_delay
+        self._pending: Dict[str, object] = {}
+        self._flush_task: asyncio.Future = None
+        # Whether the delayed write is writing, rather than waiting for write_delay.
+        self._flush_started = False
+        # Whether items were held while the delayed write was writing, so another one is needed.
+        self._held_during_flush = False
+        # The first error of the delayed writes, raised by the next flush().
+        self._delayed_write_error: Exception = None
+
+    async def read(self, keys: List[str]):
+        if not keys:
+            return {}
+
+        items = {
+            key: deepcopy(self._pending[key]) for key in keys if key in self._pending
+        }
+
+        cached = await self.cache.read([key for key in keys if key not in items])
+        items.update({key: deepcopy(item) for key, item in cached.items()})
+
+        missing = [key for key in keys if key not in items]
+        if missing:
+            remote_items = await self.storage.read(missing)
+            await self._cache_items(remote_items)
+            items.update(remote_items)
+
+        return items
+
+    async def write(self, changes: Dict[str, object]):
+        if changes is None:
+            raise Exception("Changes are required when writing")
+        if not changes:
+            return
+
+        if self.write_delay is None:
+            await self._write_through(changes)
+            return
+
+        for key, change in changes.items():
+            self._pending[key] = deepcopy(change)
+        await self.cache.delete(list(changes.keys()))
+
+        if self._flush_task is None:
+            self._flush_task = asyncio.ensure_future(self._flush_later())
+        elif self._flush_started:
+            self._held_during_flush = True
+
+    async def delete(self, keys: List[str]):
+        for key in keys:
+            self._pending.pop(key, None)
+        await self.cache.delete(keys)
+        await self.storage.delete(keys)
+
+    async def flush(self):
+        """
+        Writes all held items to the underlying storage.
+
+        :raises Exception: The first error of the delayed writes since the last flush, or of this write.
+        """
+        while self._flush_task is not None:
+            task = self._flush_task
+            if self._flush_started:
+                # Wait for the write in progress; it records its own errors.
+                await asyncio.wait([task])
+            else:
+                task.cancel()
+                self._flush_task = None
+
+        error, self._delayed_write_error = self._delayed_write_error, None
+        await self._flush_pending()
+        if error is not None:
+            raise error
+
+    async def _flush_later(self):
+        try:
+            await asyncio.sleep(self.write_delay)
+            self._flush_started = True
+            await self._flush_pending()
+        except asyncio.CancelledError:
+            return
+        except Exception as error:  # pylint: disable=broad-except
+            if self._delayed_write_error is None:
+                self._delayed_write_error = error
+        finally:
+            if self._flush_task is asyncio.current_task():
+                self._flush_task = None
+                self._flush_started = False
+
+        if self._held_during_flush and self._flush_task is None:
+            self._held_during_flush = False
+            self._flush_task = asyncio.ensure_future(self._flush_later())
+
+    async def _flush_pending(self):
+        if not self._pending:
+            return
+
+        changes = self._pending
+        self._pending = {}
+        results = await asyncio.gather(
+            *[self._write_through({key: change}) for key, change in changes.items()],
+            return_exceptions=True,
+        )
+
+        errors = []
+        for (key, change), result in zip(changes.items(), results):
+            if not isinstance(result, Exception):
+                continue
+            errors.append(result)
+            # An item whose e_tag is out of date would keep failing and hide the stored item from reads.
+            # Otherwise hold it again, unless it was written again in the meantime.
+            if not CachingStorage._is_conflict(result):
+                self._pending.setdefault(key, change)
+
+        if errors:
+            raise errors[0]
+
+    async def _write_through(self, changes: Dict[str, object]):
+        try:
+            await self.storage.write(changes)
+        finally:
+            # The underlying storage assigns new e_tags on write, so the items are cached again on the next read.
+            await self.cache.delete(list(changes.keys()))
+
+    @staticmethod
+    def _is_conflict(error: Exception) -> bool:
+        # MemoryStorage raises a KeyError on an e_tag conflict, the Azure storages an HTTP 412 error.
+        return isinstance(error, KeyError) or getattr(error, "status_code", None) == 412
+
+    async def _cache_items(self, items: Dict[str, object]):
+        if not items:
+            return
+
+        # Removing the keys first keeps the cache from applying its own e_tag checks and numbering.
+        await self.cache.delete(list(items.keys()))
+        await self.cache.write(items)
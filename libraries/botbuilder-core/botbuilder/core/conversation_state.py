@@ -3,6 +3,7 @@
 
 from .turn_context import TurnContext
 from .bot_state import BotState
+from .state_fingerprint import StateHashFunction
 from .storage import Storage
 
 
@@ -17,15 +18,19 @@ class ConversationState(BotState):
 
     no_key_error_message = "ConversationState: channelId and/or conversation missing from context.activity."
 
-    def __init__(self, storage: Storage):
+    def __init__(self, storage: Storage, state_hash_function: StateHashFunction = None):
         """
         Creates a :class:`ConversationState` instance.
 
         Creates a new instance of the :class:`ConversationState` class.
         :param storage: The storage containing the conversation state.
         :type storage: :class:`Storage`
+        :param state_hash_function: Optional, the function used to detect changes to the cached state.
+        :type state_hash_function: Callable[[object], str]
         """
-        super(ConversationState, self).__init__(storage, "Internal.ConversationState")
+        super(ConversationState, self).__init__(
+            storage, "Internal.ConversationState", state_hash_function
+        )
 
     def get_storage_key(self, turn_context: TurnContext) -> object:
         """
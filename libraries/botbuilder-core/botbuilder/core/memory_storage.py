@@ -2,21 +2,55 @@
 # Licensed under the MIT License.
 
 from copy import deepcopy
+from time import monotonic
 from typing import Dict, List
 from .storage import Storage, StoreItem
 
 
 class MemoryStorage(Storage):
-    def __init__(self, dictionary=None):
+    """
+    A storage layer that uses an in-memory dictionary.
+
+    .. remarks::
+        Optionally, the number of items can be bounded with `max_items`, in which case the least recently
+        used items are evicted, and items can expire `time_to_live` seconds after they were last written.
+        The `hits`, `misses` and `evictions` counters report how well the storage is working as a cache.
+    """
+
+    def __init__(
+        self, dictionary=None, max_items: int = None, time_to_live: float = None
+    ):
+        """
+        Initializes a new instance of the :class:`MemoryStorage` class.
+
+        :param dictionary: Optional, the dictionary used to hold the items.
+        :type dictionary: dict
+        :param max_items: Optional, the maximum number of items to keep.
+        :type max_items: int
+        :param time_to_live: Optional, the number of seconds an item is kept after it was written.
+        :type time_to_live: float
+        """
         super(MemoryStorage, self).__init__()
+        if max_items is not None and max_items < 1:
+            raise ValueError("MemoryStorage: max_items must be at least 1.")
+        if time_to_live is not None and time_to_live <= 0:
+            raise ValueError("MemoryStorage: time_to_live must be positive.")
+
         self.memory = dictionary if dictionary is not None else {}
+        self.max_items = max_items
+        self.time_to_live = time_to_live
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
         self._e_tag = 0
+        self._expirations: Dict[str, float] = {}
 
     async def delete(self, keys: List[str]):
         try:
             for key in keys:
                 if key in self.memory:
                     del self.memory[key]
+                self._expirations.pop(key, None)
         except TypeError as error:
             raise error
 
@@ -26,8 +60,14 @@ class MemoryStorage(Storage):
             return data
         try:
             for key in keys:
-                if key in self.memory:
+                if key in self.memory and not self._expire(key):
+                    if self.max_items is not None:
+                        # Move the key to the end so eviction finds the least recently used items first.
+                        self.memory[key] = self.memory.pop(key)
                     data[key] = self.memory[key]
+                    self.hits += 1
+                else:
+                    self.misses += 1
         except TypeError as error:
             raise error
 
@@ -46,7 +86,7 @@ class MemoryStorage(Storage):
 
                 # Check if the a matching key already exists in self.memory
                 # If it exists then we want to cache its original value from memory
-                if key in self.memory:
+                if key in self.memory and not self._expire(key):
                     old_state = self.memory[key]
                     if isinstance(old_state, dict):
                         old_state_etag = old_state.get("e_tag", None)
@@ -82,11 +122,44 @@ class MemoryStorage(Storage):
                         new_state.e_tag = str(self._e_tag)
 
                 self._e_tag += 1
-                self.memory[key] = deepcopy(new_state)
+
+                # new_state is already a private copy of the change, so it can be stored as is.
+                if self.max_items is not None:
+                    self.memory.pop(key, None)
+                self.memory[key] = new_state
+                if self.time_to_live is not None:
+                    self._expirations[key] = monotonic() + self.time_to_live
+
+            self._evict()
 
         except Exception as error:
             raise error
 
+    def _expire(self, key: str) -> bool:
+        """
+        Removes the item if its time to live has passed.
+        :param key:
+        :return: True if the item expired.
+        """
+        expiration = self._expirations.get(key)
+        if expiration is None or expiration > monotonic():
+            return False
+
+        del self.memory[key]
+        del self._expirations[key]
+        self.evictions += 1
+        return True
+
+    def _evict(self):
+        if self.max_items is None:
+            return
+
+        while len(self.memory) > self.max_items:
+            key = next(iter(self.memory))
+            del self.memory[key]
+            self._expirations.pop(key, None)
+            self.evictions += 1
+
     # TODO: Check if needed, if not remove
     def __should_write_changes(
         self, old_value: StoreItem, new_value: StoreItem
@@ -2,41 +2,116 @@
 # Licensed under the MIT License.
 """The memory transcript store stores transcripts in volatile memory."""
 import datetime
-from typing import List, Dict
+from bisect import bisect_left, bisect_right, insort
+from typing import List, Dict, Tuple
 from botbuilder.schema import Activity
 from .transcript_logger import PagedResult, TranscriptInfo, TranscriptStore
 
+PAGE_SIZE = 20
+
+
+def _sort_time(timestamp: datetime.datetime) -> datetime.datetime:
+    # Naive and aware timestamps are compared in UTC; activities without one sort first.
+    if timestamp is None:
+        return datetime.datetime.min
+    if timestamp.tzinfo is not None:
+        return timestamp.astimezone(datetime.timezone.utc).replace(tzinfo=None)
+    return timestamp
+
+
+class _ConversationTranscript:
+    """The activities of a conversation, ordered by timestamp and then by the order they were logged."""
+
+    def __init__(self):
+        self.activities: List[Activity] = []
+        self.keys: List[Tuple[datetime.datetime, int]] = []
+        self.keys_by_id: Dict[str, Tuple[datetime.datetime, int]] = {}
+        self._logged = 0
+
+    @property
+    def created_key(self) -> datetime.datetime:
+        return self.keys[0][0] if self.keys else datetime.datetime.min
+
+    def append(self, activity: Activity):
+        key = (_sort_time(activity.timestamp), self._logged)
+        self._logged += 1
+
+        if not self.keys or key > self.keys[-1]:
+            self.activities.append(activity)
+            self.keys.append(key)
+        else:
+            # Activities logged out of order are inserted at their place.
+            index = bisect_right(self.keys, key)
+            self.activities.insert(index, activity)
+            self.keys.insert(index, key)
+
+        if activity.id is not None:
+            self.keys_by_id.setdefault(activity.id, key)
+
+    def page(
+        self, start_date: datetime.datetime, continuation_token: str
+    ) -> List[Activity]:
+        start = bisect_left(self.keys, (_sort_time(start_date),))
+
+        if continuation_token:
+            key = self.keys_by_id.get(continuation_token)
+            if key is None:
+                return []
+            start = max(start, bisect_right(self.keys, key))
+
+        return self.activities[start : start + PAGE_SIZE]
+
 
 # pylint: disable=line-too-long
 class MemoryTranscriptStore(TranscriptStore):
     """This provider is most useful for simulating production storage when running locally against the
     emulator or as part of a unit test.
+
+    Each conversation is kept ordered by timestamp with an index of its activity ids, so pages are found with
+    a binary search instead of sorting the transcript on every read.
     """
 
-    channels: Dict[str, Dict[str, Activity]] = {}
+    def __init__(self):
+        self.channels: Dict[str, Dict[str, List[Activity]]] = {}
+        self._transcripts: Dict[str, Dict[str, _ConversationTranscript]] = {}
+        # (created, conversation id) of each conversation of a channel, oldest first.
+        self._conversations: Dict[str, List[Tuple[datetime.datetime, str]]] = {}
 
     async def log_activity(self, activity: Activity) -> None:
         if not activity:
             raise TypeError("activity cannot be None for log_activity()")
 
+        channel_id = activity.channel_id
+        conversation_id = activity.conversation.id
+
         # get channel
-        channel = {}
-        if not activity.channel_id in self.channels:
-            channel = {}
-            self.channels[activity.channel_id] = channel
-        else:
-            channel = self.channels[activity.channel_id]
+        if channel_id not in self._transcripts:
+            self.channels[channel_id] = {}
+            self._transcripts[channel_id] = {}
+            self._conversations[channel_id] = []
 
         # Get conversation transcript.
-        transcript = []
-        if activity.conversation.id in channel:
-            transcript = channel[activity.conversation.id]
+        transcript = self._transcripts[channel_id].get(conversation_id)
+        created_key = None
+        if transcript is None:
+            transcript = _ConversationTranscript()
+            self._transcripts[channel_id][conversation_id] = transcript
+            self.channels[channel_id][conversation_id] = transcript.activities
         else:
-            transcript = []
-            channel[activity.conversation.id] = transcript
+            created_key = transcript.created_key
 
         transcript.append(activity)
 
+        if transcript.created_key != created_key:
+            if created_key is not None:
+                self._remove_conversation_entry(
+                    channel_id, conversation_id, created_key
+                )
+            insort(
+                self._conversations[channel_id],
+                (transcript.created_key, conversation_id),
+            )
+
     async def get_transcript_activities(
         self,
         channel_id: str,
@@ -51,38 +126,11 @@ class MemoryTranscriptStore(TranscriptStore):
             raise TypeError("Missing conversation_id")
 
         paged_result = PagedResult()
-        if channel_id in self.channels:
-            channel = self.channels[channel_id]
-            if conversation_id in channel:
-                transcript = channel[conversation_id]
-                if continuation_token:
-                    paged_result.items = (
-                        [
-                            x
-                            for x in sorted(
-                                transcript,
-                                key=lambda x: x.timestamp or str(datetime.datetime.min),
-                                reverse=False,
-                            )
-                            if x.timestamp >= start_date
-                        ]
-                        .dropwhile(lambda x: x.id != continuation_token)
-                        .Skip(1)[:20]
-                    )
-                    if paged_result.items.count == 20:
-                        paged_result.continuation_token = paged_result.items[-1].id
-                else:
-                    paged_result.items = [
-                        x
-                        for x in sorted(
-                            transcript,
-                            key=lambda x: x.timestamp or datetime.datetime.min,
-                            reverse=False,
-                        )
-                        if (x.timestamp or datetime.datetime.min) >= start_date
-                    ][:20]
-                    if paged_result.items.count == 20:
-                        paged_result.continuation_token = paged_result.items[-1].id
+        transcript = self._transcripts.get(channel_id, {}).get(conversation_id)
+        if transcript is not None:
+            paged_result.items = transcript.page(start_date, continuation_token)
+            if len(paged_result.items) == PAGE_SIZE:
+                paged_result.continuation_token = paged_result.items[-1].id
 
         return paged_result
 
@@ -93,9 +141,12 @@ class MemoryTranscriptStore(TranscriptStore):
         if not conversation_id:
             raise TypeError("conversation_id should not be None")
 
-        if channel_id in self.channels:
-            if conversation_id in self.channels[channel_id]:
-                del self.channels[channel_id][conversation_id]
+        transcript = self._transcripts.get(channel_id, {}).pop(conversation_id, None)
+        if transcript is not None:
+            del self.channels[channel_id][conversation_id]
+            self._remove_conversation_entry(
+                channel_id, conversation_id, transcript.created_key
+            )
 
     async def list_transcripts(
         self, channel_id: str, continuation_token: str = None
@@ -105,48 +156,44 @@ class MemoryTranscriptStore(TranscriptStore):
 
         paged_result = PagedResult()
 
-        if channel_id in self.channels:
-            channel: Dict[str, List[Activity]] = self.channels[channel_id]
+        if channel_id in self._transcripts:
+            transcripts = self._transcripts[channel_id]
+            conversations = self._conversations[channel_id]
 
+            # Newest conversations first.
+            end = len(conversations)
             if continuation_token:
-                paged_result.items = (
-                    sorted(
-                        [
-                            TranscriptInfo(
-                                channel_id,
-                                c.value()[0].timestamp if c.value() else None,
-                                c.id,
-                            )
-                            for c in channel
-                        ],
-                        key=lambda x: x.created,
-                        reverse=True,
+                transcript = transcripts.get(continuation_token)
+                end = (
+                    bisect_left(
+                        conversations, (transcript.created_key, continuation_token)
                     )
-                    .dropwhile(lambda x: x.id != continuation_token)
-                    .Skip(1)
-                    .Take(20)
+                    if transcript is not None
+                    else 0
                 )
-                if paged_result.items.count == 20:
-                    paged_result.continuation_token = paged_result.items[-1].id
-            else:
-                paged_result.items = (
-                    sorted(
-                        [
-                            TranscriptInfo(
-                                channel_id,
-                                c.value()[0].timestamp if c.value() else None,
-                                c.id,
-                            )
-                            for c in channel
-                        ],
-                        key=lambda x: x.created,
-                        reverse=True,
-                    )
-                    .dropwhile(lambda x: x.id != continuation_token)
-                    .Skip(1)
-                    .Take(20)
+
+            paged_result.items = [
+                TranscriptInfo(
+                    channel_id,
+                    transcripts[conversation_id].activities[0].timestamp,
+                    conversation_id,
+                )
+                for _, conversation_id in reversed(
+                    conversations[max(0, end - PAGE_SIZE) : end]
                 )
-                if paged_result.items.count == 20:
-                    paged_result.continuation_token = paged_result.items[-1].id
+            ]
+            if len(paged_result.items) == PAGE_SIZE:
+                paged_result.continuation_token = paged_result.items[-1].id
 
         return paged_result
+
+    def _remove_conversation_entry(
+        self,
+        channel_id: str,
+        conversation_id: str,
+        created_key: datetime.datetime,
+    ):
+        conversations = self._conversations[channel_id]
+        index = bisect_left(conversations, (created_key, conversation_id))
+        if index < len(conversations) and conversations[index][1] == conversation_id:
+            del conversations[index]
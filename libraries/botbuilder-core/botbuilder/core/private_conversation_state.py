@@ -4,16 +4,22 @@
 from .bot_state import BotState
 from .turn_context import TurnContext
 from .storage import Storage
+from .state_fingerprint import StateHashFunction
 
 
 class PrivateConversationState(BotState):
-    def __init__(self, storage: Storage, namespace: str = ""):
+    def __init__(
+        self,
+        storage: Storage,
+        namespace: str = "",
+        state_hash_function: StateHashFunction = None,
+    ):
         async def aux_func(context: TurnContext) -> str:
             nonlocal self
             return await self.get_storage_key(context)
 
         self.namespace = namespace
-        super().__init__(storage, aux_func)
+        super().__init__(storage, aux_func, state_hash_function)
 
     def get_storage_key(self, turn_context: TurnContext) -> str:
         activity = turn_context.activity
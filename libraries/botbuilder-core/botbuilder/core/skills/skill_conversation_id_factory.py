@@ -1,20 +1,69 @@
 # Copyright (c) Microsoft Corporation. All rights reserved.
 # Licensed under the MIT License.
 
-from uuid import uuid4 as uuid
+import time
+from collections import OrderedDict
+from uuid import UUID, uuid4 as uuid, uuid5
 from botbuilder.core import TurnContext, Storage
 from .conversation_id_factory import ConversationIdFactoryBase
 from .skill_conversation_id_factory_options import SkillConversationIdFactoryOptions
 from .skill_conversation_reference import SkillConversationReference
 from .skill_conversation_reference import ConversationReference
 
+# Namespace of the deterministic skill conversation ids.
+_SKILL_CONVERSATION_ID_NAMESPACE = UUID("6b0c4e0e-5a39-4d8e-9e0a-3c8f3c1f4b0d")
+
 
 class SkillConversationIdFactory(ConversationIdFactoryBase):
-    def __init__(self, storage: Storage):
+    """
+    Creates and stores the `SkillConversationReference` of the conversations with skills.
+
+    .. remarks::
+        By default every skill invocation stores a new reference under a random ID, and every skill callback
+        reads it back from storage. The optional arguments reduce that storage traffic:
+
+        - `max_cached_references` keeps up to that many references in memory, so callbacks for references
+          created or read by this instance don't read storage. The cache is per process; a reference deleted
+          by another instance may still be served from it.
+        - `deterministic_ids` derives the ID from the conversation, the skill and the caller's OAuth scope,
+          so invoking a skill again from the same conversation replaces its reference instead of adding a
+          new one. Two skill dialogs calling the same skill from the same conversation then share one ID and
+          one reference, so when either of them ends and deletes the reference, the other one's is deleted
+          too. It can't be combined with `max_cached_references`, as another instance replacing the
+          reference under the same ID would leave this instance serving its stale cached copy, nor with
+          `time_to_live`, as this instance would delete the reference another instance created again.
+        - `time_to_live` deletes the references this instance created once they are that many seconds old.
+          It must be longer than the longest conversation with a skill.
+    """
+
+    def __init__(
+        self,
+        storage: Storage,
+        *,
+        max_cached_references: int = 0,
+        deterministic_ids: bool = False,
+        time_to_live: float = None,
+    ):
         if not storage:
             raise TypeError("storage can't be None")
+        if max_cached_references is None or max_cached_references < 0:
+            raise ValueError("max_cached_references can't be negative")
+        if max_cached_references and deterministic_ids:
+            raise ValueError(
+                "max_cached_references can't be combined with deterministic_ids"
+            )
+        if time_to_live is not None and deterministic_ids:
+            raise ValueError("time_to_live can't be combined with deterministic_ids")
+        if time_to_live is not None and time_to_live <= 0:
+            raise ValueError("time_to_live must be positive")
 
         self._storage = storage
+        self._max_cached_references = max_cached_references
+        self._deterministic_ids = deterministic_ids
+        self._time_to_live = time_to_live
+        self._cache: "OrderedDict[str, SkillConversationReference]" = OrderedDict()
+        # When each reference created by this instance expires, oldest first.
+        self._expirations: "OrderedDict[str, float]" = OrderedDict()
 
     async def create_skill_conversation_id(  # pylint: disable=arguments-differ
         self, options: SkillConversationIdFactoryOptions
@@ -30,11 +79,17 @@ class SkillConversationIdFactory(ConversationIdFactoryBase):
         if not options:
             raise TypeError("options can't be None")
 
+        await self._delete_expired_references()
+
         conversation_reference = TurnContext.get_conversation_reference(
             options.activity
         )
 
-        skill_conversation_id = str(uuid())
+        skill_conversation_id = (
+            self._deterministic_id(options, conversation_reference)
+            if self._deterministic_ids
+            else str(uuid())
+        )
 
         # Create the SkillConversationReference instance.
         skill_conversation_reference = SkillConversationReference(
@@ -46,6 +101,13 @@ class SkillConversationIdFactory(ConversationIdFactoryBase):
         skill_conversation_info = {skill_conversation_id: skill_conversation_reference}
 
         await self._storage.write(skill_conversation_info)
+        self._cache_reference(skill_conversation_id, skill_conversation_reference)
+
+        if self._time_to_live:
+            self._expirations[skill_conversation_id] = (
+                time.monotonic() + self._time_to_live
+            )
+            self._expirations.move_to_end(skill_conversation_id)
 
         # Return the generated skill_conversation_id (that will be also used as the conversation ID to call the skill).
         return skill_conversation_id
@@ -69,10 +131,19 @@ class SkillConversationIdFactory(ConversationIdFactoryBase):
         if not skill_conversation_id:
             raise TypeError("skill_conversation_id can't be None")
 
+        cached = self._cache.get(skill_conversation_id)
+        if cached is not None:
+            self._cache.move_to_end(skill_conversation_id)
+            return cached
+
         # Get the SkillConversationReference from storage for the given skill_conversation_id.
         skill_conversation_reference = await self._storage.read([skill_conversation_id])
 
-        return skill_conversation_reference.get(skill_conversation_id)
+        result = skill_conversation_reference.get(skill_conversation_id)
+        if result is not None:
+            self._cache_reference(skill_conversation_id, result)
+
+        return result
 
     async def delete_conversation_reference(self, skill_conversation_id: str):
         """
@@ -82,5 +153,58 @@ class SkillConversationIdFactory(ConversationIdFactoryBase):
         :type skill_conversation_id: str
         """
 
+        self._cache.pop(skill_conversation_id, None)
+        self._expirations.pop(skill_conversation_id, None)
+
         # Delete the SkillConversationReference from storage.
         await self._storage.delete([skill_conversation_id])
+
+    def _cache_reference(
+        self,
+        skill_conversation_id: str,
+        skill_conversation_reference: SkillConversationReference,
+    ):
+        if not self._max_cached_references:
+            return
+
+        self._cache[skill_conversation_id] = skill_conversation_reference
+        self._cache.move_to_end(skill_conversation_id)
+        while len(self._cache) > self._max_cached_references:
+            self._cache.popitem(last=False)
+
+    async def _delete_expired_references(self):
+        now = time.monotonic()
+        expired = []
+        for skill_conversation_id, expires_at in self._expirations.items():
+            if expires_at > now:
+                break
+            expired.append(skill_conversation_id)
+
+        if expired:
+            for skill_conversation_id in expired:
+                del self._expirations[skill_conversation_id]
+                self._cache.pop(skill_conversation_id, None)
+
+            await self._storage.delete(expired)
+
+    @staticmethod
+    def _deterministic_id(
+        options: SkillConversationIdFactoryOptions,
+        conversation_reference: ConversationReference,
+    ) -> str:
+        skill = options.bot_framework_skill
+        name = "|".join(
+            value or ""
+            for value in (
+                conversation_reference.channel_id,
+                conversation_reference.service_url,
+                (
+                    conversation_reference.conversation.id
+                    if conversation_reference.conversation
+                    else None
+                ),
+                skill.id if skill else None,
+                options.from_bot_oauth_scope,
+            )
+        )
+        return str(uuid5(_SKILL_CONVERSATION_ID_NAMESPACE, name))
@@ -0,0 +1,123 @@
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License.
+
+from hashlib import blake2b
+from typing import Callable, Iterable, List, Set, Tuple
+
+from jsonpickle.pickler import Pickler
+
+_SCALAR_TYPES = (type(None), bool, int, float, complex, str, bytes)
+_SEQUENCE_TYPES = (list, tuple)
+_CONTAINER_TYPES = (dict, set, frozenset) + _SEQUENCE_TYPES
+
+
+def compute_state_fingerprint(obj: object) -> str:
+    """
+    Computes a compact digest of a state object graph.
+
+    .. remarks::
+        The object graph is walked once and written to a canonical flat form which is hashed
+        with blake2b. Two graphs with the same structure and values produce the same fingerprint,
+        whatever the order of the keys of their dicts and attributes or of the items of their sets,
+        so the result can be compared between the start and the end of a turn to detect changes.
+        This is considerably cheaper than flattening the graph through jsonpickle.
+
+    :param obj: The state object to fingerprint.
+    :type obj: object
+    :return: The hex digest of the state.
+    :rtype: str
+    """
+    parts: List[str] = []
+    _flatten(obj, parts, set())
+    return blake2b("\x1f".join(parts).encode("utf-8"), digest_size=16).hexdigest()
+
+
+def compute_pickle_hash(obj: object) -> str:
+    """
+    Computes a change hash by flattening the state object graph through jsonpickle.
+
+    .. remarks::
+        This is the change detection that :class:`BotState` used originally. It is kept for bots
+        that rely on custom jsonpickle handlers to decide what part of an object is persisted.
+
+    :param obj: The state object to hash.
+    :type obj: object
+    :return: The flattened representation of the state.
+    :rtype: str
+    """
+    return str(Pickler().flatten(obj))
+
+
+StateHashFunction = Callable[[object], str]
+
+
+def _flatten(obj: object, parts: List[str], path: Set[int]):
+    obj_type = type(obj)
+
+    if obj_type in _SCALAR_TYPES:
+        parts.append(obj_type.__name__)
+        parts.append(repr(obj))
+        return
+
+    obj_id = id(obj)
+    if obj_id in path:
+        # Cyclic reference back to an object currently being walked.
+        parts.append("ref")
+        return
+
+    path.add(obj_id)
+    try:
+        if isinstance(obj, dict):
+            parts.append("dict")
+            parts.append(str(len(obj)))
+            parts.extend(_flatten_unordered(obj.items(), path))
+        elif isinstance(obj, (set, frozenset)):
+            parts.append(obj_type.__name__)
+            parts.append(str(len(obj)))
+            parts.extend(_flatten_unordered(((value,) for value in obj), path))
+        elif isinstance(obj, _SEQUENCE_TYPES):
+            parts.append(obj_type.__name__)
+            parts.append(str(len(obj)))
+            for value in obj:
+                _flatten(value, parts, path)
+        else:
+            parts.append(f"{obj_type.__module__}.{obj_type.__qualname__}")
+            if not _flatten_attributes(obj, parts, path):
+                parts.append(repr(obj))
+            return
+
+        if obj_type not in _CONTAINER_TYPES:
+            # Subclasses of the containers can hold attributes besides their items.
+            parts.append(f"{obj_type.__module__}.{obj_type.__qualname__}")
+            _flatten_attributes(obj, parts, path)
+    finally:
+        path.discard(obj_id)
+
+
+def _flatten_attributes(obj: object, parts: List[str], path: Set[int]) -> bool:
+    attributes = getattr(obj, "__dict__", None)
+    slots = getattr(type(obj), "__slots__", None)
+
+    if attributes is None and not slots:
+        return False
+
+    if attributes is not None:
+        _flatten(attributes, parts, path)
+    if slots:
+        for slot in (slots,) if isinstance(slots, str) else slots:
+            parts.append(slot)
+            _flatten(getattr(obj, slot, None), parts, path)
+    return True
+
+
+def _flatten_unordered(entries: Iterable[Tuple], path: Set[int]) -> List[str]:
+    # Equal dicts and sets can iterate in different orders, e.g. once read back from storage,
+    # so their entries are flattened separately and sorted.
+    flattened = []
+    for entry in entries:
+        entry_parts: List[str] = []
+        for value in entry:
+            _flatten(value, entry_parts, path)
+        flattened.append("\x1e".join(entry_parts))
+    flattened.sort()
+    return flattened
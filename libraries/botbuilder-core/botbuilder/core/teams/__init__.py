@@ -7,6 +7,7 @@
 
 from .teams_activity_handler import TeamsActivityHandler
 from .teams_info import TeamsInfo
+from .teams_roster_cache import TeamsRosterCache
 from .teams_activity_extensions import (
     teams_get_channel_id,
     teams_get_selected_channel_id,
@@ -18,6 +19,7 @@ from .teams_sso_token_exchange_middleware import TeamsSSOTokenExchangeMiddleware
 __all__ = [
     "TeamsActivityHandler",
     "TeamsInfo",
+    "TeamsRosterCache",
     "TeamsSSOTokenExchangeMiddleware",
     "teams_get_channel_id",
     "teams_get_selected_channel_id",
@@ -1,7 +1,8 @@
 # Copyright (c) Microsoft Corporation. All rights reserved.
 # Licensed under the MIT License.
 
-from typing import List, Tuple
+import asyncio
+from typing import AsyncIterator, Iterable, List, Tuple
 
 from botframework.connector import Channels
 from botframework.connector.aio import ConnectorClient
@@ -28,6 +29,7 @@ from botbuilder.schema.teams import (
     MeetingNotificationBase,
     MeetingNotificationResponse,
 )
+from .teams_roster_cache import TeamsRosterCache
 
 
 class TeamsInfo:
@@ -169,7 +171,9 @@ class TeamsInfo:
 
     @staticmethod
     async def get_team_members(
-        turn_context: TurnContext, team_id: str = ""
+        turn_context: TurnContext,
+        team_id: str = "",
+        roster_cache: TeamsRosterCache = None,
     ) -> List[TeamsChannelAccount]:
         if not team_id:
             team_id = TeamsInfo.get_team_id(turn_context)
@@ -179,21 +183,63 @@ class TeamsInfo:
                 "TeamsInfo.get_team_members: method is only valid within the scope of MS Teams Team."
             )
 
-        connector_client = await TeamsInfo._get_connector_client(turn_context)
-        return await TeamsInfo._get_members(
-            connector_client,
-            turn_context.activity.conversation.id,
+        return await TeamsInfo._get_cached_members(
+            turn_context, turn_context.activity.conversation.id, roster_cache
         )
 
     @staticmethod
-    async def get_members(turn_context: TurnContext) -> List[TeamsChannelAccount]:
+    async def get_members(
+        turn_context: TurnContext, roster_cache: TeamsRosterCache = None
+    ) -> List[TeamsChannelAccount]:
         team_id = TeamsInfo.get_team_id(turn_context)
         if not team_id:
             conversation_id = turn_context.activity.conversation.id
-            connector_client = await TeamsInfo._get_connector_client(turn_context)
-            return await TeamsInfo._get_members(connector_client, conversation_id)
+            return await TeamsInfo._get_cached_members(
+                turn_context, conversation_id, roster_cache
+            )
 
-        return await TeamsInfo.get_team_members(turn_context, team_id)
+        return await TeamsInfo.get_team_members(turn_context, team_id, roster_cache)
+
+    @staticmethod
+    async def iter_members(
+        turn_context: TurnContext, page_size: int = None
+    ) -> AsyncIterator[TeamsChannelAccount]:
+        """
+        Iterates over the members of the team or conversation, a page at a time.
+
+        The next page is requested while the members of the current one are processed, so large rosters
+        can be enumerated without waiting on each page in turn.
+        """
+        conversation_id = (
+            TeamsInfo.get_team_id(turn_context) or turn_context.activity.conversation.id
+        )
+        connector_client = await TeamsInfo._get_connector_client(turn_context)
+
+        next_page = asyncio.ensure_future(
+            TeamsInfo._get_paged_members(
+                connector_client, conversation_id, None, page_size
+            )
+        )
+        try:
+            while next_page is not None:
+                page: TeamsPagedMembersResult = await next_page
+                next_page = None
+
+                if page.continuation_token:
+                    next_page = asyncio.ensure_future(
+                        TeamsInfo._get_paged_members(
+                            connector_client,
+                            conversation_id,
+                            page.continuation_token,
+                            page_size,
+                        )
+                    )
+
+                for member in page.members or []:
+                    yield member
+        finally:
+            if next_page is not None:
+                next_page.cancel()
 
     @staticmethod
     async def get_paged_team_members(
@@ -268,6 +314,33 @@ class TeamsInfo:
 
         return await TeamsInfo.get_team_member(turn_context, team_id, member_id)
 
+    @staticmethod
+    async def get_members_by_ids(
+        turn_context: TurnContext, member_ids: Iterable[str], max_concurrency: int = 10
+    ) -> List[TeamsChannelAccount]:
+        """
+        Gets several members of the team or conversation, with up to `max_concurrency` requests at a time.
+        The members are returned in the order of `member_ids`.
+        """
+        if max_concurrency <= 0:
+            raise ValueError(
+                "TeamsInfo.get_members_by_ids: max_concurrency must be positive."
+            )
+
+        conversation_id = turn_context.activity.conversation.id
+        connector_client = await TeamsInfo._get_connector_client(turn_context)
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def get_member(member_id: str) -> TeamsChannelAccount:
+            async with semaphore:
+                return await TeamsInfo._get_member(
+                    connector_client, conversation_id, member_id
+                )
+
+        return list(
+            await asyncio.gather(*[get_member(member_id) for member_id in member_ids])
+        )
+
     @staticmethod
     async def get_meeting_participant(
         turn_context: TurnContext,
@@ -359,6 +432,30 @@ class TeamsInfo:
 
         return connector_client
 
+    @staticmethod
+    async def _get_cached_members(
+        turn_context: TurnContext,
+        conversation_id: str,
+        roster_cache: TeamsRosterCache,
+    ) -> List[TeamsChannelAccount]:
+        connector_client = await TeamsInfo._get_connector_client(turn_context)
+        if roster_cache is None:
+            return await TeamsInfo._get_members(connector_client, conversation_id)
+
+        channel_data = teams_get_channel_data(turn_context.activity)
+        tenant_id = (
+            channel_data.tenant.id if channel_data and channel_data.tenant else None
+        )
+
+        # Cached under the conversation the roster is read from, which isn't the team when called
+        # from another conversation.
+        members = roster_cache.get(conversation_id, tenant_id)
+        if members is None:
+            members = await TeamsInfo._get_members(connector_client, conversation_id)
+            roster_cache.set(conversation_id, tenant_id, members)
+
+        return members
+
     @staticmethod
     async def _get_members(
         connector_client: ConnectorClient, conversation_id: str
@@ -0,0 +1,72 @@
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License.
+
+import time
+from collections import OrderedDict
+from typing import List, Tuple
+
+from botbuilder.schema.teams import TeamsChannelAccount
+
+
+class TeamsRosterCache:
+    """
+    A short-lived cache of Teams rosters.
+
+    .. remarks::
+        Pass it as the `roster_cache` of :meth:`TeamsInfo.get_members` or :meth:`TeamsInfo.get_team_members`
+        so turns that need the whole roster, such as notifications sent to every member, don't fetch it on
+        each turn. Rosters are cached per conversation they are read from and tenant for `time_to_live`
+        seconds, so members added or removed in the meantime are missed. The cached members are shared by the lists
+        returned from the cache, so they shouldn't be modified.
+    """
+
+    def __init__(self, time_to_live: float = 60.0, max_items: int = 100):
+        """
+        Initializes a new instance of the :class:`TeamsRosterCache` class.
+
+        :param time_to_live: The number of seconds a roster is kept.
+        :type time_to_live: float
+        :param max_items: The maximum number of rosters to keep.
+        :type max_items: int
+        """
+        if time_to_live is None or time_to_live <= 0:
+            raise ValueError("TeamsRosterCache(): time_to_live must be positive.")
+        if max_items is None or max_items <= 0:
+            raise ValueError("TeamsRosterCache(): max_items must be positive.")
+
+        self.time_to_live = time_to_live
+        self.max_items = max_items
+        self.hits = 0
+        self.misses = 0
+        self._items: "OrderedDict[Tuple[str, str], Tuple[float, List]]" = OrderedDict()
+
+    def get(self, team_id: str, tenant_id: str) -> List[TeamsChannelAccount]:
+        key = (team_id, tenant_id)
+        entry = self._items.get(key)
+        if entry is not None and entry[0] <= time.monotonic():
+            del self._items[key]
+            entry = None
+
+        if entry is None:
+            self.misses += 1
+            return None
+
+        self._items.move_to_end(key)
+        self.hits += 1
+        return list(entry[1])
+
+    def set(self, team_id: str, tenant_id: str, members: List[TeamsChannelAccount]):
+        key = (team_id, tenant_id)
+        self._items[key] = (time.monotonic() + self.time_to_live, list(members))
+        self._items.move_to_end(key)
+        while len(self._items) > self.max_items:
+            self._items.popitem(last=False)
+
+    def remove(self, team_id: str, tenant_id: str):
+        self._items.pop((team_id, tenant_id), None)
+
+    def clear(self):
+        self._items.clear()
+
+    def __len__(self) -> int:
+        return len(self._items)
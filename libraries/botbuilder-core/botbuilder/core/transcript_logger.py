@@ -30,9 +30,36 @@ class TranscriptLogger(ABC):
         """
         raise NotImplementedError
 
+    async def log_activities(self, activities: List[Activity]) -> None:
+        """Log activities to the transcript, in order.
+        Loggers that can append several activities at once should override this.
+        :param activities:Activities being logged.
+        """
+        for activity in activities:
+            await self.log_activity(activity)
+
+
+async def log_activities(logger: TranscriptLogger, activities: List[Activity]) -> None:
+    """Logs activities to a logger, in order.
+    Loggers that don't derive from :class:`TranscriptLogger` and only have `log_activity` get one call per
+    activity.
+    :param logger: Logger to log the activities to.
+    :param activities: Activities being logged.
+    """
+    if callable(getattr(logger, "log_activities", None)):
+        await logger.log_activities(activities)
+        return
+
+    for activity in activities:
+        await logger.log_activity(activity)
+
 
 class TranscriptLoggerMiddleware(Middleware):
-    """Logs incoming and outgoing activities to a TranscriptStore."""
+    """Logs incoming and outgoing activities to a TranscriptStore.
+
+    The activities of a turn are logged together at the end of the turn. To keep the turn from
+    waiting on the writes, wrap the logger in a :class:`BackgroundTranscriptLogger`.
+    """
 
     def __init__(self, logger: TranscriptLogger):
         if not logger:
@@ -134,13 +161,17 @@ class TranscriptLoggerMiddleware(Middleware):
             await logic()
 
         # Flush transcript at end of turn
+        activities = []
         while not transcript.empty():
             activity = transcript.get()
             if activity is None:
                 break
-            await self.logger.log_activity(activity)
+            activities.append(activity)
             transcript.task_done()
 
+        if activities:
+            await log_activities(self.logger, activities)
+
     async def log_activity(self, transcript: Queue, activity: Activity) -> None:
         """Logs the activity.
         :param transcript: transcript.
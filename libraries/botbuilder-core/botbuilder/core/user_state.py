@@ -3,6 +3,7 @@
 
 from .turn_context import TurnContext
 from .bot_state import BotState
+from .state_fingerprint import StateHashFunction
 from .storage import Storage
 
 
@@ -15,15 +16,23 @@ class UserState(BotState):
         "UserState: channel_id and/or conversation missing from context.activity."
     )
 
-    def __init__(self, storage: Storage, namespace=""):
+    def __init__(
+        self,
+        storage: Storage,
+        namespace="",
+        state_hash_function: StateHashFunction = None,
+    ):
         """
         Creates a new UserState instance.
         :param storage:
         :param namespace:
+        :param state_hash_function: Optional, the function used to detect changes to the cached state.
         """
         self.namespace = namespace
 
-        super(UserState, self).__init__(storage, "Internal.UserState")
+        super(UserState, self).__init__(
+            storage, "Internal.UserState", state_hash_function
+        )
 
     def get_storage_key(self, turn_context: TurnContext) -> str:
         """
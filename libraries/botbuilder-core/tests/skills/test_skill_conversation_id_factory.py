@@ -1,6 +1,8 @@
 # Copyright (c) Microsoft Corporation. All rights reserved.
 # Licensed under the MIT License.
 
+import asyncio
+from typing import List
 from uuid import uuid4 as uuid
 from aiounittest import AsyncTestCase
 from botbuilder.core import MemoryStorage
@@ -16,6 +18,16 @@ from botbuilder.core.skills import (
 )
 
 
+class CountingMemoryStorage(MemoryStorage):
+    def __init__(self):
+        super().__init__()
+        self.reads = 0
+
+    async def read(self, keys: List[str]):
+        self.reads += 1
+        return await super().read(keys)
+
+
 class SkillConversationIdFactoryForTest(AsyncTestCase):
     SERVICE_URL = "http://testbot.com/api/messages"
     SKILL_ID = "skill"
@@ -101,6 +113,71 @@ class SkillConversationIdFactoryForTest(AsyncTestCase):
         # Ensure that we get a different conversation_id each time we call create_skill_conversation_id
         self.assertNotEqual(first_id, second_id)
 
+    async def test_cached_references_are_not_read_from_storage(self):
+        storage = CountingMemoryStorage()
+        factory = SkillConversationIdFactory(storage, max_cached_references=1)
+
+        first_id = await factory.create_skill_conversation_id(self._build_options())
+        second_id = await factory.create_skill_conversation_id(self._build_options())
+
+        self.assertIsNotNone(await factory.get_skill_conversation_reference(second_id))
+        self.assertEqual(0, storage.reads)
+
+        # Only the last reference is cached.
+        self.assertIsNotNone(await factory.get_skill_conversation_reference(first_id))
+        self.assertEqual(1, storage.reads)
+
+        await factory.delete_conversation_reference(first_id)
+        self.assertIsNone(await factory.get_skill_conversation_reference(first_id))
+
+    async def test_deterministic_ids(self):
+        factory = SkillConversationIdFactory(MemoryStorage(), deterministic_ids=True)
+        conversation_reference = self._build_conversation_reference()
+
+        first_id = await factory.create_skill_conversation_id(
+            self._build_options(conversation_reference)
+        )
+        second_id = await factory.create_skill_conversation_id(
+            self._build_options(conversation_reference)
+        )
+        other_id = await factory.create_skill_conversation_id(self._build_options())
+
+        self.assertEqual(first_id, second_id)
+        self.assertNotEqual(first_id, other_id)
+
+    def test_deterministic_ids_are_not_cached_or_expired(self):
+        with self.assertRaises(ValueError):
+            SkillConversationIdFactory(
+                MemoryStorage(), max_cached_references=1, deterministic_ids=True
+            )
+        with self.assertRaises(ValueError):
+            SkillConversationIdFactory(
+                MemoryStorage(), time_to_live=60, deterministic_ids=True
+            )
+
+    async def test_expired_references_are_deleted(self):
+        storage = MemoryStorage()
+        factory = SkillConversationIdFactory(storage, time_to_live=0.01)
+
+        first_id = await factory.create_skill_conversation_id(self._build_options())
+        await asyncio.sleep(0.02)
+        second_id = await factory.create_skill_conversation_id(self._build_options())
+
+        self.assertIsNone(await factory.get_skill_conversation_reference(first_id))
+        self.assertIsNotNone(await factory.get_skill_conversation_reference(second_id))
+
+    def _build_options(
+        self, conversation_reference: ConversationReference = None
+    ) -> SkillConversationIdFactoryOptions:
+        return SkillConversationIdFactoryOptions(
+            activity=self._build_message_activity(
+                conversation_reference or self._build_conversation_reference()
+            ),
+            bot_framework_skill=self._build_bot_framework_skill(),
+            from_bot_id=self._bot_id,
+            from_bot_oauth_scope=self._bot_id,
+        )
+
     def _build_conversation_reference(self) -> ConversationReference:
         return ConversationReference(
             conversation=ConversationAccount(id=str(uuid())),
@@ -1,7 +1,11 @@
 # Copyright (c) Microsoft Corporation. All rights reserved.
 # Licensed under the MIT License.
 
+import asyncio
 import json
+from copy import copy
+from types import SimpleNamespace
+
 import aiounittest
 from botbuilder.schema.teams._models_py3 import (
     ContentType,
@@ -13,11 +17,13 @@ from botbuilder.schema.teams._models_py3 import (
     TargetedMeetingNotificationValue,
     TaskModuleContinueResponse,
     TaskModuleTaskInfo,
+    TeamsChannelAccount,
+    TeamsPagedMembersResult,
 )
 from botframework.connector import Channels
 
-from botbuilder.core import TurnContext, MessageFactory
-from botbuilder.core.teams import TeamsInfo, TeamsActivityHandler
+from botbuilder.core import BotAdapter, TurnContext, MessageFactory
+from botbuilder.core.teams import TeamsInfo, TeamsActivityHandler, TeamsRosterCache
 from botbuilder.schema import (
     Activity,
     ChannelAccount,
@@ -39,6 +45,56 @@ ACTIVITY = Activity(
 )
 
 
+class MockConversations:
+    def __init__(self, page_count: int = 1):
+        self.page_count = page_count
+        self.requested_tokens = []
+        self.roster_calls = 0
+        self.roster_conversation_ids = []
+        self.max_concurrent_member_calls = 0
+        self._concurrent_member_calls = 0
+
+    async def get_teams_conversation_paged_members(
+        self, conversation_id, page_size=None, continuation_token=None
+    ):
+        self.requested_tokens.append(continuation_token)
+        page = int(continuation_token.split("-")[1]) if continuation_token else 0
+        await asyncio.sleep(0)
+        return TeamsPagedMembersResult(
+            continuation_token=(
+                f"page-{page + 1}" if page + 1 < self.page_count else None
+            ),
+            members=[
+                TeamsChannelAccount(id=f"member-{page}-{index}")
+                for index in range(page_size)
+            ],
+        )
+
+    async def get_conversation_members(self, conversation_id):
+        self.roster_calls += 1
+        self.roster_conversation_ids.append(conversation_id)
+        return [ChannelAccount(id="member-0"), ChannelAccount(id="member-1")]
+
+    async def get_conversation_member(self, conversation_id, member_id):
+        self._concurrent_member_calls += 1
+        self.max_concurrent_member_calls = max(
+            self.max_concurrent_member_calls, self._concurrent_member_calls
+        )
+        await asyncio.sleep(0.01)
+        self._concurrent_member_calls -= 1
+        return ChannelAccount(id=member_id)
+
+
+def create_turn_context_with_connector(
+    conversations: MockConversations, activity: Activity = ACTIVITY
+):
+    turn_context = TurnContext(SimpleAdapterWithCreateConversation(), activity)
+    turn_context.turn_state[BotAdapter.BOT_CONNECTOR_CLIENT_KEY] = SimpleNamespace(
+        conversations=conversations
+    )
+    return turn_context
+
+
 class TestTeamsInfo(aiounittest.AsyncTestCase):
     async def test_send_message_to_teams_channels_without_activity(self):
         def create_conversation():
@@ -293,6 +349,73 @@ class TestTeamsInfo(aiounittest.AsyncTestCase):
             handler = TeamsActivityHandler()
             await handler.on_turn(turn_context)
 
+    async def test_iter_members_prefetches_the_next_page(self):
+        conversations = MockConversations(page_count=3)
+        turn_context = create_turn_context_with_connector(conversations)
+
+        member_ids = []
+        async for member in TeamsInfo.iter_members(turn_context, page_size=2):
+            member_ids.append(member.id)
+            if member.id == "member-0-0":
+                # The second page is requested while the first one is processed.
+                await asyncio.sleep(0)
+                assert conversations.requested_tokens == [None, "page-1"]
+
+        assert member_ids == [
+            "member-0-0",
+            "member-0-1",
+            "member-1-0",
+            "member-1-1",
+            "member-2-0",
+            "member-2-1",
+        ]
+        assert conversations.requested_tokens == [None, "page-1", "page-2"]
+
+    async def test_get_members_by_ids_limits_concurrency(self):
+        conversations = MockConversations()
+        turn_context = create_turn_context_with_connector(conversations)
+        member_ids = [f"member-{index}" for index in range(10)]
+
+        members = await TeamsInfo.get_members_by_ids(
+            turn_context, member_ids, max_concurrency=3
+        )
+
+        assert [member.id for member in members] == member_ids
+        assert conversations.max_concurrent_member_calls == 3
+
+    async def test_get_members_uses_the_roster_cache(self):
+        conversations = MockConversations()
+        turn_context = create_turn_context_with_connector(conversations)
+        roster_cache = TeamsRosterCache(time_to_live=60)
+
+        first = await TeamsInfo.get_members(turn_context, roster_cache)
+        second = await TeamsInfo.get_members(turn_context, roster_cache)
+
+        assert [member.id for member in first] == ["member-0", "member-1"]
+        assert [member.id for member in second] == ["member-0", "member-1"]
+        assert conversations.roster_calls == 1
+        assert roster_cache.hits == 1
+
+        roster_cache.clear()
+        await TeamsInfo.get_members(turn_context, roster_cache)
+        assert conversations.roster_calls == 2
+
+    async def test_roster_cache_is_keyed_by_the_conversation_read(self):
+        conversations = MockConversations()
+        roster_cache = TeamsRosterCache(time_to_live=60)
+
+        # Called from a personal chat, the roster of the chat is read.
+        turn_context = create_turn_context_with_connector(conversations)
+        await TeamsInfo.get_team_members(turn_context, "team-1", roster_cache)
+
+        # A turn in the team doesn't get the roster of the chat.
+        activity = copy(ACTIVITY)
+        activity.conversation = ConversationAccount(id="team-1")
+        turn_context = create_turn_context_with_connector(conversations, activity)
+        await TeamsInfo.get_team_members(turn_context, "team-1", roster_cache)
+
+        assert conversations.roster_conversation_ids == ["convo", "team-1"]
+
 
 class TestTeamsActivityHandler(TeamsActivityHandler):
     async def on_turn(self, turn_context: TurnContext):
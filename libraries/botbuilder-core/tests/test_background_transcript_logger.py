@@ -0,0 +1,155 @@
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License.
+
+import asyncio
+import unittest
+from typing import List
+
+import aiounittest
+
+from botbuilder.core import (
+    BackgroundTranscriptLogger,
+    TranscriptLogger,
+    TranscriptLoggerMiddleware,
+    TurnContext,
+)
+from botbuilder.core.adapters import TestAdapter, TestFlow
+from botbuilder.schema import Activity, ActivityTypes, ConversationAccount
+
+
+class RecordingTranscriptLogger(TranscriptLogger):
+    def __init__(self, fail: bool = False):
+        self.batches: List[List[Activity]] = []
+        self.fail = fail
+        self.release = asyncio.Event()
+        self.release.set()
+
+    async def log_activity(self, activity: Activity) -> None:
+        await self.log_activities([activity])
+
+    async def log_activities(self, activities: List[Activity]) -> None:
+        await self.release.wait()
+        if self.fail:
+            raise Exception("write failed")
+        self.batches.append(activities)
+
+
+def message(conversation_id: str, text: str) -> Activity:
+    return Activity(
+        type=ActivityTypes.message,
+        channel_id="test",
+        conversation=ConversationAccount(id=conversation_id),
+        text=text,
+    )
+
+
+class TestBackgroundTranscriptLogger(aiounittest.AsyncTestCase):
+    async def test_middleware_logs_in_the_background(self):
+        recorder = RecordingTranscriptLogger()
+        recorder.release.clear()
+        sut = BackgroundTranscriptLogger(recorder)
+
+        async def aux_logic(context: TurnContext):
+            await context.send_activity(f"echo:{context.activity.text}")
+
+        adapter = TestAdapter(aux_logic)
+        adapter.use(TranscriptLoggerMiddleware(sut))
+
+        # The turn completes while the logger is blocked.
+        await TestFlow(None, adapter).send("foo")
+        self.assertEqual(2, sut.queue_length)
+        self.assertEqual([], recorder.batches)
+
+        recorder.release.set()
+        await sut.close()
+
+        self.assertEqual(1, len(recorder.batches))
+        self.assertEqual(
+            ["foo", "echo:foo"], [activity.text for activity in recorder.batches[0]]
+        )
+        self.assertEqual(0, sut.queue_length)
+        self.assertGreater(sut.lag, 0)
+
+    async def test_batches_per_conversation(self):
+        recorder = RecordingTranscriptLogger()
+        recorder.release.clear()
+        sut = BackgroundTranscriptLogger(recorder, max_batch_size=2)
+
+        await sut.log_activities(
+            [message("a", "1"), message("b", "1"), message("a", "2"), message("a", "3")]
+        )
+        recorder.release.set()
+        await sut.flush()
+        await sut.close()
+
+        texts = sorted(
+            [(batch[0].conversation.id, [activity.text for activity in batch])]
+            for batch in recorder.batches
+        )
+        self.assertEqual(
+            [[("a", ["1", "2"])], [("a", ["3"])], [("b", ["1"])]],
+            texts,
+        )
+
+    async def test_drops_activities_when_the_queue_is_full(self):
+        recorder = RecordingTranscriptLogger()
+        recorder.release.clear()
+        sut = BackgroundTranscriptLogger(recorder, max_queued_activities=2)
+
+        await sut.log_activities([message("a", "1"), message("a", "2")])
+        await sut.log_activity(message("a", "3"))
+
+        self.assertEqual(1, sut.dropped)
+
+        recorder.release.set()
+        await sut.close()
+
+        self.assertEqual(
+            ["1", "2"], [activity.text for activity in recorder.batches[0]]
+        )
+
+        # Once closed, activities are written directly.
+        await sut.log_activity(message("a", "4"))
+        self.assertEqual("4", recorder.batches[1][0].text)
+
+    async def test_counts_failed_activities(self):
+        recorder = RecordingTranscriptLogger(fail=True)
+        sut = BackgroundTranscriptLogger(recorder)
+
+        await sut.log_activities([message("a", "1"), message("a", "2")])
+        await sut.close()
+
+        self.assertEqual(2, sut.failed)
+
+    async def test_flush_without_activities(self):
+        sut = BackgroundTranscriptLogger(RecordingTranscriptLogger())
+
+        await sut.flush()
+        await sut.close()
+
+        self.assertEqual(0, sut.queue_length)
+
+
+class TestBackgroundTranscriptLoggerOutsideLoop(unittest.TestCase):
+    def test_can_be_created_before_the_loop(self):
+        class ListTranscriptLogger(TranscriptLogger):
+            def __init__(self):
+                self.batches: List[List[Activity]] = []
+
+            async def log_activity(self, activity: Activity) -> None:
+                self.batches.append([activity])
+
+        recorder = ListTranscriptLogger()
+        sut = BackgroundTranscriptLogger(recorder)
+
+        async def log():
+            await sut.log_activity(message("a", "1"))
+            await sut.close()
+
+        loop = asyncio.new_event_loop()
+        try:
+            loop.run_until_complete(log())
+        finally:
+            loop.close()
+
+        self.assertEqual("1", recorder.batches[0][0].text)
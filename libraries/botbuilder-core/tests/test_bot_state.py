@@ -12,6 +12,7 @@ from botbuilder.core import (
     StoreItem,
     TurnContext,
     UserState,
+    compute_state_fingerprint,
 )
 from botbuilder.core.adapters import TestAdapter
 from botbuilder.schema import Activity, ConversationAccount
@@ -502,3 +503,66 @@ class TestBotState(aiounittest.AsyncTestCase):
 
         assert result is not None
         assert result == test_bot_state.get_cached_state(turn_context)
+
+    async def test_bot_state_only_hashes_accessed_properties(self):
+        # pylint: disable=unnecessary-lambda
+        turn_context = TestUtilities.create_empty_context()
+        turn_context.activity.conversation = ConversationAccount(id="1234")
+
+        storage = MemoryStorage({})
+        test_bot_state = BotStateForTest(storage)
+        await test_bot_state.create_property("read").set(
+            turn_context, TestPocoState("read")
+        )
+        await test_bot_state.create_property("unread").set(
+            turn_context, TestPocoState("unread")
+        )
+        await test_bot_state.save_changes(turn_context)
+
+        hashed = []
+
+        def hash_function(obj):
+            hashed.append(obj)
+            return compute_state_fingerprint(obj)
+
+        turn_context = TestUtilities.create_empty_context()
+        turn_context.activity.conversation = ConversationAccount(id="1234")
+        test_bot_state.state_hash_function = hash_function
+        storage.write = MagicMock(wraps=storage.write)
+
+        value = await test_bot_state.create_property("read").get(turn_context)
+        await test_bot_state.save_changes(turn_context)
+
+        assert value.value == "read"
+        assert all(obj is value for obj in hashed)
+        assert storage.write.call_count == 0
+
+        value.value = "changed"
+        await test_bot_state.save_changes(turn_context)
+
+        assert storage.write.call_count == 1
+
+    async def test_bot_state_detects_changes_to_raw_state(self):
+        turn_context = TestUtilities.create_empty_context()
+        turn_context.activity.conversation = ConversationAccount(id="1234")
+
+        storage = MemoryStorage({})
+        test_bot_state = BotStateForTest(storage)
+        await test_bot_state.create_property("test-name").set(turn_context, 1)
+        await test_bot_state.save_changes(turn_context)
+
+        storage.write = MagicMock(wraps=storage.write)
+
+        await test_bot_state.save_changes(turn_context)
+        assert storage.write.call_count == 0
+
+        test_bot_state.get(turn_context)["test-name"] = 2
+        await test_bot_state.save_changes(turn_context)
+        assert storage.write.call_count == 1
+
+        test_bot_state.get(turn_context)["other-name"] = TestPocoState()
+        await test_bot_state.save_changes(turn_context)
+        assert storage.write.call_count == 2
+
+        await test_bot_state.save_changes(turn_context)
+        assert storage.write.call_count == 2
@@ -0,0 +1,97 @@
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License.
+
+from unittest.mock import MagicMock
+
+import aiounittest
+
+from botbuilder.core import (
+    BotStateSet,
+    ConversationState,
+    MemoryStorage,
+    PrivateConversationState,
+    UserState,
+)
+
+from test_utilities import TestUtilities
+
+
+def create_storage() -> MemoryStorage:
+    storage = MemoryStorage()
+    storage.read = MagicMock(wraps=storage.read)
+    storage.write = MagicMock(wraps=storage.write)
+    return storage
+
+
+class TestBotStateSet(aiounittest.AsyncTestCase):
+    async def test_should_batch_states_sharing_a_storage(self):
+        storage = create_storage()
+        conversation_state = ConversationState(storage)
+        user_state = UserState(storage)
+        private_state = PrivateConversationState(storage)
+        bot_state_set = BotStateSet([conversation_state, user_state, private_state])
+        context = TestUtilities.create_empty_context()
+
+        await bot_state_set.load_all(context)
+
+        self.assertEqual(1, storage.read.call_count)
+        self.assertEqual(3, len(storage.read.call_args[0][0]))
+
+        await conversation_state.create_property("a").set(context, "a")
+        await user_state.create_property("b").set(context, "b")
+        await private_state.create_property("c").set(context, "c")
+        await bot_state_set.save_all_changes(context)
+
+        self.assertEqual(1, storage.write.call_count)
+        self.assertEqual(3, len(storage.write.call_args[0][0]))
+
+        await bot_state_set.save_all_changes(context)
+        self.assertEqual(1, storage.write.call_count)
+
+        context = TestUtilities.create_empty_context()
+        await bot_state_set.load_all(context)
+        self.assertEqual(
+            "a", await conversation_state.create_property("a").get(context)
+        )
+        self.assertEqual("b", await user_state.create_property("b").get(context))
+        self.assertEqual("c", await private_state.create_property("c").get(context))
+
+    async def test_should_only_write_changed_states(self):
+        storage = create_storage()
+        conversation_state = ConversationState(storage)
+        user_state = UserState(storage)
+        bot_state_set = BotStateSet([conversation_state, user_state])
+        context = TestUtilities.create_empty_context()
+
+        await conversation_state.create_property("a").set(context, "a")
+        await user_state.create_property("b").set(context, "b")
+        await bot_state_set.save_all_changes(context)
+
+        await user_state.create_property("b").set(context, "c")
+        await bot_state_set.save_all_changes(context)
+
+        self.assertEqual(2, storage.write.call_count)
+        self.assertEqual(
+            [user_state.get_storage_key(context)],
+            list(storage.write.call_args[0][0].keys()),
+        )
+
+    async def test_should_use_each_storage(self):
+        conversation_storage = create_storage()
+        user_storage = create_storage()
+        conversation_state = ConversationState(conversation_storage)
+        user_state = UserState(user_storage)
+        bot_state_set = BotStateSet([conversation_state, user_state])
+        context = TestUtilities.create_empty_context()
+
+        await bot_state_set.load_all(context)
+
+        self.assertEqual(1, conversation_storage.read.call_count)
+        self.assertEqual(1, user_storage.read.call_count)
+
+        await conversation_state.create_property("a").set(context, "a")
+        await user_state.create_property("b").set(context, "b")
+        await bot_state_set.save_all_changes(context)
+
+        self.assertEqual(1, conversation_storage.write.call_count)
+        self.assertEqual(1, user_storage.write.call_count)
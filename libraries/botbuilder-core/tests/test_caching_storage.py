@@ -0,0 +1,179 @@
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License.
+
+import asyncio
+from unittest.mock import MagicMock
+
+import aiounittest
+
+from botbuilder.core import CachingStorage, MemoryStorage, StoreItem
+
+
+class SimpleStoreItem(StoreItem):
+    def __init__(self, counter=1, e_tag="*"):
+        super(SimpleStoreItem, self).__init__()
+        self.counter = counter
+        self.e_tag = e_tag
+
+
+def create_remote() -> MemoryStorage:
+    remote = MemoryStorage()
+    remote.read = MagicMock(wraps=remote.read)
+    remote.write = MagicMock(wraps=remote.write)
+    return remote
+
+
+class TestCachingStorage(aiounittest.AsyncTestCase):
+    async def test_should_read_through_once(self):
+        remote = create_remote()
+        await remote.write({"a": {"counter": 1}, "b": {"counter": 2}})
+        storage = CachingStorage(remote)
+
+        first = await storage.read(["a", "b"])
+        second = await storage.read(["a", "b", "c"])
+
+        self.assertEqual(2, second["b"]["counter"])
+        self.assertEqual(first, second)
+        self.assertEqual(2, remote.read.call_count)
+        remote.read.assert_called_with(["c"])
+
+    async def test_should_not_share_cached_items(self):
+        storage = CachingStorage(create_remote())
+        await storage.write({"a": {"counter": 1}})
+        await storage.read(["a"])
+
+        item = (await storage.read(["a"]))["a"]
+        item["counter"] = 2
+
+        self.assertEqual(1, (await storage.read(["a"]))["a"]["counter"])
+
+    async def test_should_drop_items_after_write(self):
+        remote = create_remote()
+        await remote.write({"a": SimpleStoreItem(e_tag="1")})
+        storage = CachingStorage(remote)
+
+        item = (await storage.read(["a"]))["a"]
+        await storage.write({"a": item})
+
+        item = (await storage.read(["a"]))["a"]
+        self.assertEqual(remote.memory["a"].e_tag, item.e_tag)
+        self.assertEqual(2, remote.read.call_count)
+
+    async def test_should_invalidate_on_failed_write(self):
+        remote = create_remote()
+        await remote.write({"a": SimpleStoreItem(e_tag="1")})
+        storage = CachingStorage(remote)
+        await storage.read(["a"])
+
+        with self.assertRaises(KeyError):
+            await storage.write({"a": SimpleStoreItem(counter=2, e_tag="2")})
+
+        self.assertEqual({}, await storage.cache.read(["a"]))
+
+    async def test_should_delete_everywhere(self):
+        remote = create_remote()
+        storage = CachingStorage(remote)
+        await storage.write({"a": {"counter": 1}})
+
+        await storage.delete(["a"])
+
+        self.assertEqual({}, await storage.read(["a"]))
+        self.assertNotIn("a", remote.memory)
+
+    async def test_should_coalesce_delayed_writes(self):
+        remote = create_remote()
+        storage = CachingStorage(remote, write_delay=60)
+
+        await storage.write({"a": {"counter": 1}})
+        await storage.write({"a": {"counter": 2}, "b": {"counter": 3}})
+
+        self.assertEqual(2, (await storage.read(["a"]))["a"]["counter"])
+        self.assertEqual(0, remote.write.call_count)
+
+        await storage.flush()
+
+        self.assertEqual(2, remote.write.call_count)
+        self.assertEqual(2, remote.memory["a"]["counter"])
+        self.assertEqual(3, remote.memory["b"]["counter"])
+
+    async def test_flush_should_write_pending_items(self):
+        remote = create_remote()
+        storage = CachingStorage(remote, write_delay=60)
+
+        await storage.write({"a": {"counter": 1}})
+        await storage.flush()
+
+        self.assertEqual(1, remote.write.call_count)
+        self.assertEqual(1, remote.memory["a"]["counter"])
+
+    async def test_flush_should_wait_for_a_delayed_write_in_progress(self):
+        remote = MemoryStorage()
+        write_started = asyncio.Event()
+        release_write = asyncio.Event()
+        remote_write = remote.write
+
+        async def slow_write(changes):
+            write_started.set()
+            await release_write.wait()
+            await remote_write(changes)
+
+        remote.write = slow_write
+        storage = CachingStorage(remote, write_delay=0.001)
+
+        await storage.write({"a": {"counter": 1}})
+        await write_started.wait()
+        await storage.write({"b": {"counter": 2}})
+
+        flush = asyncio.ensure_future(storage.flush())
+        await asyncio.sleep(0)
+        self.assertFalse(flush.done())
+
+        release_write.set()
+        await flush
+
+        self.assertEqual(1, remote.memory["a"]["counter"])
+        self.assertEqual(2, remote.memory["b"]["counter"])
+
+    async def test_should_drop_items_of_a_conflicting_delayed_write(self):
+        remote = create_remote()
+        await remote.write({"a": SimpleStoreItem(e_tag="first")})
+        storage = CachingStorage(remote, write_delay=0.001)
+
+        item = (await storage.read(["a"]))["a"]
+        item.counter = 2
+        await storage.write({"a": item, "b": {"counter": 1}})
+        # Another process writes the item before the delayed write.
+        await remote.write({"a": SimpleStoreItem(counter=99, e_tag="*")})
+        await asyncio.sleep(0.05)
+
+        # The other key is written and the stored item is read again.
+        self.assertEqual(1, remote.memory["b"]["counter"])
+        self.assertEqual(99, (await storage.read(["a"]))["a"].counter)
+
+        # The error is raised by the next flush only.
+        with self.assertRaises(KeyError):
+            await storage.flush()
+        await storage.flush()
+
+    async def test_should_hold_items_of_a_failed_delayed_write(self):
+        remote = create_remote()
+        remote_write = remote.write
+        failures = [ConnectionError()]
+
+        async def failing_write(changes):
+            if failures:
+                raise failures.pop()
+            await remote_write(changes)
+
+        remote.write = failing_write
+        storage = CachingStorage(remote, write_delay=60)
+
+        await storage.write({"a": {"counter": 1}})
+        with self.assertRaises(ConnectionError):
+            await storage.flush()
+
+        # The item is still held and written by the next flush.
+        self.assertEqual(1, (await storage.read(["a"]))["a"]["counter"])
+        self.assertNotIn("a", remote.memory)
+        await storage.flush()
+        self.assertEqual(1, remote.memory["a"]["counter"])
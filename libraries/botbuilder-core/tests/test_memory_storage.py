@@ -198,3 +198,52 @@ class TestMemoryStorage:
         await storage.delete(["foo", "bar"])
         data = await storage.read(["test"])
         assert len(data.keys()) == 1
+
+    @pytest.mark.asyncio
+    async def test_memory_storage_write_should_not_alias_the_change(self):
+        storage = MemoryStorage()
+        item = SimpleStoreItem(counter=1)
+        await storage.write({"user": item})
+
+        item.counter = 2
+        data = await storage.read(["user"])
+        assert data["user"].counter == 1
+
+    @pytest.mark.asyncio
+    async def test_memory_storage_should_evict_least_recently_used_items(self):
+        storage = MemoryStorage(max_items=2)
+        await storage.write({"a": SimpleStoreItem(), "b": SimpleStoreItem()})
+
+        await storage.read(["a"])
+        await storage.write({"c": SimpleStoreItem()})
+
+        data = await storage.read(["a", "b", "c"])
+        assert set(data.keys()) == {"a", "c"}
+        assert storage.evictions == 1
+        assert storage.hits == 3
+        assert storage.misses == 1
+
+    @pytest.mark.asyncio
+    async def test_memory_storage_should_expire_items(self, monkeypatch):
+        now = [100.0]
+        monkeypatch.setattr("botbuilder.core.memory_storage.monotonic", lambda: now[0])
+        storage = MemoryStorage(time_to_live=10)
+        await storage.write({"user": SimpleStoreItem(e_tag="1")})
+
+        now[0] = 105.0
+        assert "user" in await storage.read(["user"])
+
+        now[0] = 111.0
+        assert not await storage.read(["user"])
+        assert storage.evictions == 1
+
+        # An expired item no longer takes part in e_tag checks.
+        await storage.write({"user": SimpleStoreItem(counter=3, e_tag="5")})
+        data = await storage.read(["user"])
+        assert data["user"].counter == 3
+
+    def test_memory_storage_should_validate_limits(self):
+        with pytest.raises(ValueError):
+            MemoryStorage(max_items=0)
+        with pytest.raises(ValueError):
+            MemoryStorage(time_to_live=0)
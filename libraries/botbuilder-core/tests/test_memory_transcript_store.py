@@ -89,6 +89,91 @@ class TestMemoryTranscriptStore(aiounittest.AsyncTestCase):
         )
         self.assertEqual(result.items, None)
 
+    async def test_get_activities_pages_with_continuation_token(self):
+        memory_transcript = MemoryTranscriptStore()
+        conversation_id = "_paging"
+        date = datetime.datetime(2020, 1, 1)
+        activities = self.create_activities(conversation_id, date, count=25)
+        for activity in activities:
+            await memory_transcript.log_activity(activity)
+
+        expected = sorted(activities, key=lambda activity: activity.timestamp)
+        pages = []
+        continuation_token = None
+        while True:
+            result = await memory_transcript.get_transcript_activities(
+                "test", conversation_id, continuation_token
+            )
+            pages.append(result.items)
+            continuation_token = result.continuation_token
+            if not continuation_token:
+                break
+
+        self.assertEqual([20, 20, 10], [len(page) for page in pages])
+        self.assertEqual(
+            [activity.id for activity in expected],
+            [activity.id for page in pages for activity in page],
+        )
+
+    async def test_get_activities_from_start_date(self):
+        memory_transcript = MemoryTranscriptStore()
+        conversation_id = "_start_date"
+        date = datetime.datetime(2020, 1, 1, tzinfo=datetime.timezone.utc)
+        activities = self.create_activities(conversation_id, date, count=3)
+        # logged out of order
+        for activity in reversed(activities):
+            await memory_transcript.log_activity(activity)
+
+        result = await memory_transcript.get_transcript_activities(
+            "test",
+            conversation_id,
+            start_date=date + datetime.timedelta(minutes=2),
+        )
+
+        self.assertEqual(
+            [activity.timestamp for activity in activities[2::2]],
+            [activity.timestamp for activity in result.items],
+        )
+        self.assertIsNone(result.continuation_token)
+
+    async def test_list_transcripts_newest_first(self):
+        memory_transcript = MemoryTranscriptStore()
+        date = datetime.datetime(2020, 1, 1)
+        for index in range(25):
+            await memory_transcript.log_activity(
+                self.create_activities(
+                    f"conversation{index:02}", date + datetime.timedelta(hours=index), 1
+                )[0]
+            )
+
+        first = await memory_transcript.list_transcripts("test")
+        second = await memory_transcript.list_transcripts(
+            "test", first.continuation_token
+        )
+
+        self.assertEqual(
+            [f"conversation{index:02}" for index in reversed(range(25))],
+            [transcript.id for transcript in first.items + second.items],
+        )
+        self.assertEqual(date, second.items[-1].created)
+        self.assertIsNone(second.continuation_token)
+
+        await memory_transcript.delete_transcript("test", "conversation24")
+        result = await memory_transcript.list_transcripts("test")
+        self.assertEqual("conversation23", result.items[0].id)
+
+    async def test_stores_do_not_share_transcripts(self):
+        memory_transcript = MemoryTranscriptStore()
+        date = datetime.datetime.now()
+        await memory_transcript.log_activity(
+            self.create_activities("_shared", date, 1)[0]
+        )
+
+        result = await MemoryTranscriptStore().get_transcript_activities(
+            "test", "_shared"
+        )
+        self.assertIsNone(result.items)
+
     def create_activities(self, conversation_id: str, date: datetime, count: int = 5):
         activities: List[Activity] = []
         time_stamp = date
@@ -0,0 +1,124 @@
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License.
+
+import aiounittest
+
+from botbuilder.core import (
+    ConversationState,
+    PrivateConversationState,
+    UserState,
+    MemoryStorage,
+    compute_pickle_hash,
+    compute_state_fingerprint,
+)
+
+from test_utilities import TestUtilities
+
+
+class SimpleObject:
+    def __init__(self, value=None, children=None):
+        self.value = value
+        self.children = children if children is not None else []
+
+
+class AttributeDict(dict):
+    pass
+
+
+class SlotObject:
+    __slots__ = ("value",)
+
+    def __init__(self, value=None):
+        self.value = value
+
+
+class TestStateFingerprint(aiounittest.AsyncTestCase):
+    def test_equal_graphs_have_equal_fingerprints(self):
+        first = {"a": SimpleObject(1, [SimpleObject("x")]), "b": [1, 2.5, None]}
+        second = {"a": SimpleObject(1, [SimpleObject("x")]), "b": [1, 2.5, None]}
+
+        self.assertEqual(
+            compute_state_fingerprint(first), compute_state_fingerprint(second)
+        )
+
+    def test_nested_change_is_detected(self):
+        state = {"a": SimpleObject(1, [SimpleObject("x")])}
+        before = compute_state_fingerprint(state)
+
+        state["a"].children[0].value = "y"
+
+        self.assertNotEqual(before, compute_state_fingerprint(state))
+
+    def test_dict_and_set_order_is_ignored(self):
+        first = {"a": 1, "b": SimpleObject({"x", "y", "z"})}
+        second = {"b": SimpleObject({"z", "y", "x"}), "a": 1}
+        second["b"].__dict__ = {"children": [], "value": second["b"].value}
+
+        self.assertEqual(
+            compute_state_fingerprint(first), compute_state_fingerprint(second)
+        )
+
+    def test_type_change_is_detected(self):
+        self.assertNotEqual(
+            compute_state_fingerprint({"a": 1}), compute_state_fingerprint({"a": "1"})
+        )
+        self.assertNotEqual(
+            compute_state_fingerprint({"a": 1}), compute_state_fingerprint({"a": True})
+        )
+
+    def test_slots_change_is_detected(self):
+        value = SlotObject(1)
+        before = compute_state_fingerprint(value)
+
+        value.value = 2
+
+        self.assertNotEqual(before, compute_state_fingerprint(value))
+
+    def test_dict_subclass_attribute_change_is_detected(self):
+        value = AttributeDict(a=1)
+        value.label = "first"
+        before = compute_state_fingerprint(value)
+
+        value.label = "second"
+
+        self.assertNotEqual(before, compute_state_fingerprint(value))
+        self.assertNotEqual(
+            compute_state_fingerprint({"a": 1}),
+            compute_state_fingerprint(AttributeDict(a=1)),
+        )
+
+    def test_cyclic_graph(self):
+        parent = SimpleObject("parent")
+        parent.children.append(parent)
+
+        self.assertTrue(compute_state_fingerprint(parent))
+
+    async def test_bot_state_uses_hash_function(self):
+        calls = []
+
+        def hash_function(obj):
+            calls.append(obj)
+            return compute_pickle_hash(obj)
+
+        user_state = UserState(MemoryStorage(), state_hash_function=hash_function)
+        context = TestUtilities.create_empty_context()
+        property_a = user_state.create_property("property_a")
+
+        await property_a.set(context, SimpleObject("hello"))
+        await user_state.save_changes(context)
+
+        self.assertTrue(calls)
+
+    def test_states_forward_hash_function(self):
+        storage = MemoryStorage()
+
+        self.assertIs(
+            compute_pickle_hash,
+            ConversationState(storage, compute_pickle_hash).state_hash_function,
+        )
+        self.assertIs(
+            compute_pickle_hash,
+            PrivateConversationState(
+                storage, state_hash_function=compute_pickle_hash
+            ).state_hash_function,
+        )
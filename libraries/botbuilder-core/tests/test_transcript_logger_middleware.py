@@ -42,3 +42,26 @@ class TestTranscriptLoggerMiddleware(aiounittest.AsyncTestCase):
             2,
             "only the two message activities should be logged",
         )
+
+    async def test_should_log_to_loggers_without_log_activities(self):
+        class ActivityOnlyLogger:
+            def __init__(self):
+                self.activities = []
+
+            async def log_activity(self, activity: Activity) -> None:
+                self.activities.append(activity)
+
+        logger = ActivityOnlyLogger()
+        sut = TranscriptLoggerMiddleware(logger)
+
+        async def aux_logic(context: TurnContext):
+            await context.send_activity(f"echo:{context.activity.text}")
+
+        adapter = TestAdapter(aux_logic)
+        adapter.use(sut)
+
+        await TestFlow(None, adapter).send("foo")
+
+        self.assertEqual(
+            ["foo", "echo:foo"], [activity.text for activity in logger.activities]
+        )
@@ -23,6 +23,7 @@ from .dialog import Dialog
 from .dialogs_component_registration import DialogsComponentRegistration
 from .persisted_state_keys import PersistedStateKeys
 from .persisted_state import PersistedState
+from .recognizer_models import RecognizerModels
 from .waterfall_dialog import WaterfallDialog
 from .waterfall_step_context import WaterfallStepContext
 from .dialog_extensions import DialogExtensions
@@ -61,6 +62,7 @@ __all__ = [
     "PromptValidatorContext",
     "Prompt",
     "PromptOptions",
+    "RecognizerModels",
     "TextPrompt",
     "DialogExtensions",
     "ObjectPath",
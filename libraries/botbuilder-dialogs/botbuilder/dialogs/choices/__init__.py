@@ -9,6 +9,7 @@ from .channel import Channel
 from .choice import Choice
 from .choice_factory_options import ChoiceFactoryOptions
 from .choice_factory import ChoiceFactory
+from .choice_index import ChoiceIndex
 from .choice_recognizers import ChoiceRecognizers
 from .find import Find
 from .find_choices_options import FindChoicesOptions, FindValuesOptions
@@ -25,6 +26,7 @@ __all__ = [
     "Choice",
     "ChoiceFactory",
     "ChoiceFactoryOptions",
+    "ChoiceIndex",
     "ChoiceRecognizers",
     "Find",
     "FindChoicesOptions",
@@ -0,0 +1,137 @@
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License.
+
+from typing import Dict, Hashable, List, Set, Union
+
+from .choice import Choice
+from .find_choices_options import FindChoicesOptions, FindValuesOptions
+from .sorted_value import SortedValue
+from .token import Token
+from .tokenizer import Tokenizer
+
+
+class ChoiceIndex:
+    """
+    A list of values prepared for `Find.find_values()` and `Find.find_choices()`.
+
+    The values are sorted and tokenized once, and each token maps to the values that contain it, so an
+    utterance is only matched against the values sharing a token with it. Build it once per list of choices
+    and reuse it across utterances; the results are the same as searching the list directly.
+    """
+
+    def __init__(
+        self,
+        values: List[SortedValue],
+        options: FindValuesOptions = None,
+        choices: List[Choice] = None,
+    ):
+        """
+        Parameters
+        -----------
+
+        values: The values to search over.
+
+        options: (Optional) The options the index will be searched with. Its `tokenizer` and `locale` are used to
+        tokenize the values.
+
+        choices: (Optional) The choices the values were built from, when used by `Find.find_choices()`.
+        """
+        opt = options if options else FindValuesOptions()
+
+        self.choices = choices
+        self.locale = opt.locale
+        self.tokenizer = opt.tokenizer if opt.tokenizer else Tokenizer.default_tokenizer
+
+        # Sort values in descending order by length, so that the longest value is searched over first.
+        self.values: List[SortedValue] = sorted(
+            values, key=lambda sorted_val: len(sorted_val.value), reverse=True
+        )
+        self.tokens: List[List[Token]] = [
+            self.tokenizer(entry.value.strip(), self.locale) for entry in self.values
+        ]
+
+        # Positions in `values` of the values containing each normalized token.
+        self._positions_by_token: Dict[str, List[int]] = {}
+        for position, tokens in enumerate(self.tokens):
+            for token in tokens:
+                positions = self._positions_by_token.setdefault(token.normalized, [])
+                if not positions or positions[-1] != position:
+                    positions.append(position)
+
+    @staticmethod
+    def from_choices(
+        choices: List[Union[str, Choice]], options: FindChoicesOptions = None
+    ) -> "ChoiceIndex":
+        """Builds the index of the values, action titles and synonyms of a list of choices."""
+        opt = options if options else FindChoicesOptions()
+
+        # Normalize list of choices
+        choices_list = [
+            Choice(value=choice) if isinstance(choice, str) else choice
+            for choice in choices
+        ]
+
+        # Build up full list of synonyms to search over.
+        # - Each entry in the list contains the index of the choice it belongs to which will later be
+        # used to map the search results back to their choice.
+        synonyms: List[SortedValue] = []
+
+        for index, choice in enumerate(choices_list):
+            if not opt.no_value:
+                synonyms.append(SortedValue(value=choice.value, index=index))
+
+            if (
+                getattr(choice, "action", False)
+                and getattr(choice.action, "title", False)
+                and not opt.no_value
+            ):
+                synonyms.append(SortedValue(value=choice.action.title, index=index))
+
+            if choice.synonyms is not None:
+                for synonym in choice.synonyms:
+                    synonyms.append(SortedValue(value=synonym, index=index))
+
+        return ChoiceIndex(synonyms, opt, choices_list)
+
+    @staticmethod
+    def key(
+        choices: List[Union[str, Choice]], options: FindChoicesOptions = None
+    ) -> Hashable:
+        """
+        A key identifying the index `from_choices()` builds, so equal lists of choices can share an index
+        even when they aren't the same objects, such as choices read back from dialog state.
+        """
+        opt = options if options else FindChoicesOptions()
+
+        return (
+            opt.locale,
+            opt.tokenizer,
+            bool(opt.no_value),
+            tuple(
+                (
+                    (choice, None, ())
+                    if isinstance(choice, str)
+                    else (
+                        choice.value,
+                        getattr(getattr(choice, "action", None), "title", None),
+                        tuple(choice.synonyms) if choice.synonyms else (),
+                    )
+                )
+                for choice in choices
+            ),
+        )
+
+    def is_compatible(self, options: FindValuesOptions) -> bool:
+        """Whether the values were tokenized the way the options tokenize the utterance."""
+        tokenizer = (
+            options.tokenizer if options.tokenizer else Tokenizer.default_tokenizer
+        )
+        return tokenizer is self.tokenizer and options.locale == self.locale
+
+    def candidates(self, tokens: List[Token]) -> List[int]:
+        """The positions in `values` of the values sharing a token with the utterance, in search order."""
+        positions: Set[int] = set()
+        for token in tokens:
+            positions.update(self._positions_by_token.get(token.normalized, ()))
+
+        return sorted(positions)
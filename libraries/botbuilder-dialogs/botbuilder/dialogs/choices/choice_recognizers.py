@@ -2,11 +2,12 @@
 # Licensed under the MIT License.
 
 from typing import List, Union
-from recognizers_number import NumberModel, NumberRecognizer, OrdinalModel
+from recognizers_number import NumberModel, OrdinalModel
 from recognizers_text import Culture
 
-
+from ..recognizer_models import RecognizerModels
 from .choice import Choice
+from .choice_index import ChoiceIndex
 from .find import Find
 from .find_choices_options import FindChoicesOptions
 from .found_choice import FoundChoice
@@ -19,7 +20,7 @@ class ChoiceRecognizers:
     @staticmethod
     def recognize_choices(
         utterance: str,
-        choices: List[Union[str, Choice]],
+        choices: Union[List[Union[str, Choice]], ChoiceIndex],
         options: FindChoicesOptions = None,
     ) -> List[ModelResult]:
         """
@@ -39,7 +40,7 @@ class ChoiceRecognizers:
 
         utterance: The input.
 
-        choices: The list of choices.
+        choices: The list of choices, or a `ChoiceIndex` built from it.
 
         options: (Optional) Options to control the recognition strategy.
 
@@ -51,17 +52,24 @@ class ChoiceRecognizers:
             utterance = ""
 
         # Normalize list of choices
-        choices_list = [
-            Choice(value=choice) if isinstance(choice, str) else choice
-            for choice in choices
-        ]
+        if isinstance(choices, ChoiceIndex):
+            choices_list = choices.choices
+        else:
+            choices_list = [
+                Choice(value=choice) if isinstance(choice, str) else choice
+                for choice in choices
+            ]
 
         # Try finding choices by text search first
         # - We only want to use a single strategy for returning results to avoid issues where utterances
         #   like the "the third one" or "the red one" or "the first division book" would miss-recognize as
         #   a numerical index or ordinal as well.
         locale = options.locale if (options and options.locale) else Culture.English
-        matched = Find.find_choices(utterance, choices_list, options)
+        matched = Find.find_choices(
+            utterance,
+            choices if isinstance(choices, ChoiceIndex) else choices_list,
+            options,
+        )
         if not matched:
             matches = []
 
@@ -90,7 +98,7 @@ class ChoiceRecognizers:
 
     @staticmethod
     def _recognize_ordinal(utterance: str, culture: str) -> List[ModelResult]:
-        model: OrdinalModel = NumberRecognizer(culture).get_ordinal_model(culture)
+        model: OrdinalModel = RecognizerModels.get_ordinal_model(culture)
 
         return list(
             map(ChoiceRecognizers._found_choice_constructor, model.parse(utterance))
@@ -122,7 +130,7 @@ class ChoiceRecognizers:
 
     @staticmethod
     def _recognize_number(utterance: str, culture: str) -> List[ModelResult]:
-        model: NumberModel = NumberRecognizer(culture).get_number_model(culture)
+        model: NumberModel = RecognizerModels.get_number_model(culture)
 
         return list(
             map(ChoiceRecognizers._found_choice_constructor, model.parse(utterance))
@@ -1,16 +1,17 @@
 # Copyright (c) Microsoft Corporation. All rights reserved.
 # Licensed under the MIT License.
 
-from typing import Callable, List, Union
+from bisect import bisect_left
+from typing import Dict, List, Union
 
 from .choice import Choice
+from .choice_index import ChoiceIndex
 from .find_choices_options import FindChoicesOptions, FindValuesOptions
 from .found_choice import FoundChoice
 from .found_value import FoundValue
 from .model_result import ModelResult
 from .sorted_value import SortedValue
 from .token import Token
-from .tokenizer import Tokenizer
 
 
 class Find:
@@ -19,43 +20,26 @@ class Find:
     @staticmethod
     def find_choices(
         utterance: str,
-        choices: [Union[str, Choice]],
+        choices: Union[List[Union[str, Choice]], ChoiceIndex],
         options: FindChoicesOptions = None,
     ):
-        """Matches user input against a list of choices"""
-
-        if not choices:
-            raise TypeError(
-                "Find: choices cannot be None. Must be a [str] or [Choice]."
-            )
-
-        opt = options if options else FindChoicesOptions()
-
-        # Normalize list of choices
-        choices_list = [
-            Choice(value=choice) if isinstance(choice, str) else choice
-            for choice in choices
-        ]
-
-        # Build up full list of synonyms to search over.
-        # - Each entry in the list contains the index of the choice it belongs to which will later be
-        # used to map the search results back to their choice.
-        synonyms: [SortedValue] = []
-
-        for index, choice in enumerate(choices_list):
-            if not opt.no_value:
-                synonyms.append(SortedValue(value=choice.value, index=index))
+        """
+        Matches user input against a list of choices.
+
+        Pass a `ChoiceIndex` built with `ChoiceIndex.from_choices()` to reuse it across utterances.
+        """
+
+        if isinstance(choices, ChoiceIndex):
+            index = choices
+        else:
+            if not choices:
+                raise TypeError(
+                    "Find: choices cannot be None. Must be a [str] or [Choice]."
+                )
 
-            if (
-                getattr(choice, "action", False)
-                and getattr(choice.action, "title", False)
-                and not opt.no_value
-            ):
-                synonyms.append(SortedValue(value=choice.action.title, index=index))
+            index = ChoiceIndex.from_choices(choices, options)
 
-            if choice.synonyms is not None:
-                for synonym in choice.synonyms:
-                    synonyms.append(SortedValue(value=synonym, index=index))
+        choices_list = index.choices
 
         def found_choice_constructor(value_model: ModelResult) -> ModelResult:
             choice = choices_list[value_model.resolution.index]
@@ -75,42 +59,52 @@ class Find:
 
         # Find synonyms in utterance and map back to their choices_list
         return list(
-            map(
-                found_choice_constructor, Find.find_values(utterance, synonyms, options)
-            )
+            map(found_choice_constructor, Find.find_values(utterance, index, options))
         )
 
     @staticmethod
     def find_values(
-        utterance: str, values: List[SortedValue], options: FindValuesOptions = None
+        utterance: str,
+        values: Union[List[SortedValue], ChoiceIndex],
+        options: FindValuesOptions = None,
     ) -> List[ModelResult]:
-        # Sort values in descending order by length, so that the longest value is searchd over first.
-        sorted_values = sorted(
-            values, key=lambda sorted_val: len(sorted_val.value), reverse=True
-        )
-
         # Search for each value within the utterance.
         matches: [ModelResult] = []
         opt = options if options else FindValuesOptions()
-        tokenizer: Callable[[str, str], List[Token]] = (
-            opt.tokenizer if opt.tokenizer else Tokenizer.default_tokenizer
-        )
-        tokens = tokenizer(utterance, opt.locale)
+
+        if isinstance(values, ChoiceIndex):
+            index = (
+                values
+                if values.is_compatible(opt)
+                else ChoiceIndex(values.values, opt, values.choices)
+            )
+        else:
+            index = ChoiceIndex(values, opt)
+
+        tokens = index.tokenizer(utterance, opt.locale)
         max_distance = (
             opt.max_token_distance if opt.max_token_distance is not None else 2
         )
 
-        for entry in sorted_values:
+        # Positions of each normalized token in the utterance.
+        token_positions: Dict[str, List[int]] = {}
+        for position, token in enumerate(tokens):
+            token_positions.setdefault(token.normalized, []).append(position)
+
+        # Only the values sharing a token with the utterance can match.
+        for position in index.candidates(tokens):
+            entry = index.values[position]
+
             # Find all matches for a value
             # - To match "last one" in "the last time I chose the last one" we need
             #   to re-search the string starting from the end of the previous match.
             # - The start & end position returned for the match are token positions.
             start_pos = 0
-            searched_tokens = tokenizer(entry.value.strip(), opt.locale)
+            searched_tokens = index.tokens[position]
 
             while start_pos < len(tokens):
                 match: Union[ModelResult, None] = Find._match_value(
-                    tokens,
+                    token_positions,
                     max_distance,
                     opt,
                     entry.index,
@@ -168,7 +162,7 @@ class Find:
 
     @staticmethod
     def _match_value(
-        source_tokens: List[Token],
+        token_positions: Dict[str, List[int]],
         max_distance: int,
         options: FindValuesOptions,
         index: int,
@@ -189,7 +183,7 @@ class Find:
 
         for token in searched_tokens:
             # Find the position of the token in the utterance.
-            pos = Find._index_of_token(source_tokens, token, start_pos)
+            pos = Find._index_of_token(token_positions, token, start_pos)
             if pos >= 0:
                 # Calculate the distance between the current token's position and the previous token's distance.
                 distance = pos - start_pos if matched > 0 else 0
@@ -239,9 +233,13 @@ class Find:
         return result
 
     @staticmethod
-    def _index_of_token(tokens: List[Token], token: Token, start_pos: int) -> int:
-        for i in range(start_pos, len(tokens)):
-            if tokens[i].normalized == token.normalized:
-                return i
+    def _index_of_token(
+        token_positions: Dict[str, List[int]], token: Token, start_pos: int
+    ) -> int:
+        positions = token_positions.get(token.normalized)
+        if positions:
+            i = bisect_left(positions, start_pos)
+            if i < len(positions):
+                return positions[i]
 
         return -1
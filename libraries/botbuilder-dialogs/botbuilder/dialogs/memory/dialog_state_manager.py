@@ -422,7 +422,7 @@ class DialogStateManager:
         for scope in [
             ms for ms in self.configuration.memory_scopes if ms.include_in_snapshot
         ]:
-            memory = scope.get_memory(self._dialog_context)
+            memory = scope.get_memory_snapshot(self._dialog_context)
             if memory:
                 result[scope.name] = memory
 
@@ -4,6 +4,7 @@
 from typing import Type
 
 from botbuilder.core import BotState
+from botbuilder.core.bot_state import CachedBotState
 
 from .memory_scope import MemoryScope
 
@@ -17,13 +18,19 @@ class BotStateMemoryScope(MemoryScope):
         if not dialog_context:
             raise TypeError(f"Expecting: DialogContext, but received None")
 
-        bot_state: BotState = self._get_bot_state(dialog_context)
-        cached_state = (
-            bot_state.get_cached_state(dialog_context.context) if bot_state else None
-        )
+        cached_state = self._get_cached_state(dialog_context)
 
         return cached_state.state if cached_state else None
 
+    def get_memory_snapshot(self, dialog_context: "DialogContext") -> object:
+        if not dialog_context:
+            raise TypeError(f"Expecting: DialogContext, but received None")
+
+        # The snapshot is only read, so the state doesn't need to be tracked.
+        cached_state = self._get_cached_state(dialog_context)
+
+        return cached_state.untracked_state if cached_state else None
+
     def set_memory(self, dialog_context: "DialogContext", memory: object):
         raise RuntimeError("You cannot replace the root BotState object")
 
@@ -41,3 +48,7 @@ class BotStateMemoryScope(MemoryScope):
 
     def _get_bot_state(self, dialog_context: "DialogContext") -> BotState:
         return dialog_context.context.turn_state.get(self.bot_state_type.__name__, None)
+
+    def _get_cached_state(self, dialog_context: "DialogContext") -> CachedBotState:
+        bot_state: BotState = self._get_bot_state(dialog_context)
+        return bot_state.get_cached_state(dialog_context.context) if bot_state else None
@@ -32,6 +32,14 @@ class MemoryScope(ABC):
     ) -> object:  # pylint: disable=unused-argument
         raise NotImplementedError()
 
+    # <summary>
+    # Get the memory for this scope to include in a memory snapshot, which is only read.
+    # </summary>
+    # <param name="dc">dc.</param>
+    # <returns>memory for the scope.</returns>
+    def get_memory_snapshot(self, dialog_context: "DialogContext") -> object:
+        return self.get_memory(dialog_context)
+
     # <summary>
     # Changes the backing object for the memory scope.
     # </summary>
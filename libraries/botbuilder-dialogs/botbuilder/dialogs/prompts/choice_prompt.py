@@ -1,12 +1,13 @@
 # Copyright (c) Microsoft Corporation. All rights reserved.
 # Licensed under the MIT License.
 
-from typing import Callable, Dict, List
+from typing import Callable, Dict, Hashable, List, Union
 
 from botbuilder.core import TurnContext
 from botbuilder.dialogs.choices import (
     Choice,
     ChoiceFactoryOptions,
+    ChoiceIndex,
     ChoiceRecognizers,
     FindChoicesOptions,
     ListStyle,
@@ -38,6 +39,9 @@ class ChoicePrompt(Prompt):
         for c in PromptCultureModels.get_supported_cultures()
     }
 
+    # Number of choice lists whose index is kept for recognizing later turns.
+    _max_choice_indexes = 32
+
     def __init__(
         self,
         dialog_id: str,
@@ -62,6 +66,7 @@ class ChoicePrompt(Prompt):
         self.default_locale = default_locale
         self.choice_options: ChoiceFactoryOptions = None
         self.recognizer_options: FindChoicesOptions = None
+        self._choice_indexes: Dict[Hashable, ChoiceIndex] = {}
 
         if choice_defaults is not None:
             self._default_choice_options = choice_defaults
@@ -129,7 +134,9 @@ class ChoicePrompt(Prompt):
                 else FindChoicesOptions()
             )
             opt.locale = self._determine_culture(turn_context.activity, opt)
-            results = ChoiceRecognizers.recognize_choices(utterance, choices, opt)
+            results = ChoiceRecognizers.recognize_choices(
+                utterance, self._get_choice_index(choices, opt), opt
+            )
 
             if results is not None and results:
                 result.succeeded = True
@@ -137,6 +144,24 @@ class ChoicePrompt(Prompt):
 
         return result
 
+    def _get_choice_index(
+        self, choices: List[Choice], opt: FindChoicesOptions
+    ) -> Union[ChoiceIndex, List[Choice]]:
+        # The choices are read back from dialog state on each turn, so the index is looked up by content.
+        if not choices:
+            return choices
+
+        key = ChoiceIndex.key(choices, opt)
+        index = self._choice_indexes.get(key)
+        if index is None:
+            if len(self._choice_indexes) >= self._max_choice_indexes:
+                del self._choice_indexes[next(iter(self._choice_indexes))]
+
+            index = ChoiceIndex.from_choices(choices, opt)
+            self._choice_indexes[key] = index
+
+        return index
+
     def _determine_culture(
         self, activity: Activity, opt: FindChoicesOptions = FindChoicesOptions()
     ) -> str:
@@ -2,9 +2,9 @@
 # Licensed under the MIT License.
 
 from typing import Dict
-from recognizers_date_time import recognize_datetime
 from botbuilder.core.turn_context import TurnContext
 from botbuilder.schema import ActivityTypes
+from ..recognizer_models import RecognizerModels
 from .datetime_resolution import DateTimeResolution
 from .prompt import Prompt
 from .prompt_options import PromptOptions
@@ -60,7 +60,7 @@ class DateTimePrompt(Prompt):
                 else "English"
             )
 
-            results = recognize_datetime(utterance, culture)
+            results = RecognizerModels.get_datetime_model(culture).parse(utterance)
             if results:
                 result.succeeded = True
                 result.value = []
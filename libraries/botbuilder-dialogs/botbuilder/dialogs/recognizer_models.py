@@ -0,0 +1,133 @@
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License.
+
+from threading import Lock
+from typing import Callable, Dict, FrozenSet, Iterable, Tuple
+
+from recognizers_choice import ChoiceRecognizer
+from recognizers_date_time import DateTimeRecognizer
+from recognizers_number import NumberRecognizer
+from recognizers_text import Culture, Model, Recognizer
+
+
+class RecognizerModels:
+    """
+    Process-wide cache of the Recognizers-Text models used by prompts and choice recognition.
+
+    .. remarks::
+        The module-level `recognize_*` functions of Recognizers-Text build a new recognizer on every call.
+        The models are cached here per (model type, culture) instead, so an utterance only pays for
+        parsing. Cultures Recognizers-Text doesn't support fall back to English, so they share its models
+        rather than each adding an entry to the cache. The first use of a culture still compiles its
+        models, which takes up to a few seconds; call :meth:`warm_up` at startup to do that before the
+        first turn.
+    """
+
+    NUMBER = "number"
+    ORDINAL = "ordinal"
+    DATETIME = "datetime"
+    BOOLEAN = "boolean"
+
+    # The recognizer of each model type, and the name it registers the model under.
+    _recognizers: Dict[str, Tuple[Callable[..., Recognizer], str]] = {
+        NUMBER: (NumberRecognizer, "NumberModel"),
+        ORDINAL: (NumberRecognizer, "OrdinalModel"),
+        DATETIME: (DateTimeRecognizer, "DateTimeModel"),
+        BOOLEAN: (ChoiceRecognizer, "BooleanModel"),
+    }
+
+    # Parsed once by warm_up, so the models compile their expressions before the first turn.
+    _warm_up_utterances: Dict[str, str] = {
+        NUMBER: "1",
+        ORDINAL: "first",
+        DATETIME: "tomorrow",
+        BOOLEAN: "yes",
+    }
+
+    _models: Dict[Tuple[str, str], Model] = {}
+    _cultures: Dict[str, FrozenSet[str]] = {}
+    _lock = Lock()
+
+    @classmethod
+    def get_model(cls, model_type: str, culture: str) -> Model:
+        """
+        Gets the model of a type for a culture, building it on first use.
+
+        :param model_type: One of `NUMBER`, `ORDINAL`, `DATETIME` or `BOOLEAN`.
+        :type model_type: str
+        :param culture: The culture of the model, such as "en-us". English is used for the cultures
+            Recognizers-Text doesn't support.
+        :type culture: str
+        :return: The model.
+        :rtype: :class:`recognizers_text.Model`
+        """
+        if model_type not in cls._recognizers:
+            raise ValueError(
+                f"RecognizerModels.get_model(): unknown model type '{model_type}'."
+            )
+
+        key = (model_type, cls._resolve_culture(model_type, culture))
+        model = cls._models.get(key)
+        if model is None:
+            with cls._lock:
+                model = cls._models.get(key)
+                if model is None:
+                    recognizer, model_name = cls._recognizers[model_type]
+                    model = recognizer(key[1]).get_model(model_name, key[1], True)
+                    cls._models[key] = model
+
+        return model
+
+    @classmethod
+    def get_number_model(cls, culture: str) -> Model:
+        return cls.get_model(cls.NUMBER, culture)
+
+    @classmethod
+    def get_ordinal_model(cls, culture: str) -> Model:
+        return cls.get_model(cls.ORDINAL, culture)
+
+    @classmethod
+    def get_datetime_model(cls, culture: str) -> Model:
+        return cls.get_model(cls.DATETIME, culture)
+
+    @classmethod
+    def get_boolean_model(cls, culture: str) -> Model:
+        return cls.get_model(cls.BOOLEAN, culture)
+
+    @classmethod
+    def warm_up(
+        cls,
+        cultures: Iterable[str] = (Culture.English,),
+        model_types: Iterable[str] = None,
+    ):
+        """
+        Builds the models for the cultures ahead of time.
+
+        :param cultures: The cultures to build the models for, English by default.
+        :type cultures: Iterable[str]
+        :param model_types: The model types to build, all of them by default.
+        :type model_types: Iterable[str]
+        """
+        model_types = list(model_types) if model_types else list(cls._recognizers)
+
+        for culture in cultures:
+            for model_type in model_types:
+                cls.get_model(model_type, culture).parse(
+                    cls._warm_up_utterances[model_type]
+                )
+
+    @classmethod
+    def _resolve_culture(cls, model_type: str, culture: str) -> str:
+        cultures = cls._cultures.get(model_type)
+        if cultures is None:
+            recognizer, model_name = cls._recognizers[model_type]
+            model_factory = recognizer(lazy_initialization=False).model_factory
+            cultures = frozenset(
+                key.culture
+                for key in model_factory.model_factories
+                if key.model_type == model_name
+            )
+            cls._cultures[model_type] = cultures
+
+        # Like Recognizers-Text, which only matches the cultures it registered the models for.
+        return culture if culture in cultures else Culture.English
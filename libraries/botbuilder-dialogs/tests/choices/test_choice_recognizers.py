@@ -5,10 +5,14 @@ from typing import List
 import aiounittest
 
 from botbuilder.dialogs.choices import (
+    Choice,
+    ChoiceIndex,
     ChoiceRecognizers,
     Find,
+    FindChoicesOptions,
     FindValuesOptions,
     SortedValue,
+    Tokenizer,
 )
 
 
@@ -195,3 +199,60 @@ class ChoiceRecognizersTest(aiounittest.AsyncTestCase):
     def test_should_accept_null_utterance_in_recognize_choices(self):
         found = ChoiceRecognizers.recognize_choices(None, _color_choices)
         assert not found
+
+    # ChoiceIndex
+
+    def test_should_find_the_same_values_with_a_choice_index(self):
+        index = ChoiceIndex(_overlapping_values)
+        for utterance in [
+            "bread",
+            "bread pudding and bread",
+            "I'll have the pudding please",
+            "nothing",
+        ]:
+            expected = Find.find_values(utterance, _overlapping_values)
+            found = Find.find_values(utterance, index)
+            assert [
+                (result.start, result.end, result.text, result.resolution.score)
+                for result in found
+            ] == [
+                (result.start, result.end, result.text, result.resolution.score)
+                for result in expected
+            ]
+
+    def test_should_reuse_a_choice_index_across_utterances(self):
+        index = ChoiceIndex.from_choices(_color_choices)
+
+        found = ChoiceRecognizers.recognize_choices("the red one please.", index)
+        assert len(found) == 1
+        assert_choice(found[0], "red", 0, 1.0, "red")
+
+        found = ChoiceRecognizers.recognize_choices("the third one please", index)
+        assert len(found) == 1
+        assert_choice(found[0], "blue", 2, 1.0)
+
+    def test_should_tokenize_again_for_other_options(self):
+        index = ChoiceIndex(_color_values)
+
+        def upper_tokenizer(text: str, locale: str = None):
+            tokens = Tokenizer.default_tokenizer(text, locale)
+            for token in tokens:
+                token.normalized = token.normalized.upper()
+            return tokens
+
+        found = Find.find_values(
+            "the RED one", index, FindValuesOptions(tokenizer=upper_tokenizer)
+        )
+        assert len(found) == 1
+        assert_value(found[0], "red", 0, 1.0)
+
+    def test_choice_index_key_depends_on_choice_content(self):
+        assert ChoiceIndex.key(["red", "blue"]) == ChoiceIndex.key(
+            [Choice("red"), Choice("blue")]
+        )
+        assert ChoiceIndex.key(
+            [Choice("red", synonyms=["crimson"])]
+        ) != ChoiceIndex.key([Choice("red")])
+        assert ChoiceIndex.key(["red"]) != ChoiceIndex.key(
+            ["red"], FindChoicesOptions(locale="fr-fr")
+        )
@@ -64,3 +64,13 @@ class AttachmentPromptTests(aiounittest.AsyncTestCase):
         _assert_token(tokens[1], 5, 5, "💥")
         _assert_token(tokens[2], 6, 6, "👍")
         _assert_token(tokens[3], 7, 7, "😀")
+
+    def test_should_break_on_unicode_punctuation(self):
+        tokens = Tokenizer.default_tokenizer("Naïve—café…ok")
+        assert len(tokens) == 3
+        _assert_token(tokens[0], 0, 4, "Naïve", "naïve")
+        _assert_token(tokens[1], 6, 9, "café")
+        _assert_token(tokens[2], 11, 12, "ok")
+
+    def test_should_return_no_tokens_for_none(self):
+        assert not Tokenizer.default_tokenizer(None)
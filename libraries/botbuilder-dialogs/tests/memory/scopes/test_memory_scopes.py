@@ -2,6 +2,7 @@
 # Licensed under the MIT License.
 # pylint: disable=pointless-string-statement
 
+import json
 from collections import namedtuple
 
 import aiounittest
@@ -565,3 +566,60 @@ class MemoryScopesTests(aiounittest.AsyncTestCase):
         memory = scope.get_memory(dialog_context)
         self.assertIsNotNone(memory, "state not returned")
         self.assertEqual(memory.foo, "bar")
+
+    async def test_conversation_memory_scope_snapshot_should_not_track_the_state(
+        self,
+    ):
+        storage = MemoryStorage()
+        conversation_state = ConversationState(storage)
+        dialog_state = conversation_state.create_property("dialogs")
+        dialogs = DialogSet(dialog_state)
+
+        # Persist two properties.
+        context = TurnContext(TestAdapter(), MemoryScopesTests.begin_message)
+        await conversation_state.create_property("counter").set(context, {"value": 1})
+        await conversation_state.create_property("history").set(
+            context, {"items": list(range(100))}
+        )
+        await conversation_state.save_changes(context)
+
+        context = TurnContext(TestAdapter(), MemoryScopesTests.begin_message)
+        context.turn_state["ConversationState"] = conversation_state
+        await conversation_state.load(context)
+        dialog_context = await dialogs.create_context(context)
+        scope = ConversationMemoryScope()
+
+        # The snapshot leaves the properties to be tracked individually.
+        snapshot = scope.get_memory_snapshot(dialog_context)
+        self.assertEqual(100, len(snapshot["history"]["items"]))
+        cached_state = conversation_state.get_cached_state(context)
+        self.assertNotIn("history", cached_state._property_hashes)
+
+        # The memory is the state dictionary, so changes through memory paths are saved.
+        memory = scope.get_memory(dialog_context)
+        self.assertIsInstance(memory, dict)
+        ObjectPath.set_path_value(memory, "counter.value", 2)
+        ObjectPath.set_path_value(memory, "topic", "weather")
+        await conversation_state.save_changes(context)
+
+        stored = await storage.read([conversation_state.get_storage_key(context)])
+        stored_state = stored[conversation_state.get_storage_key(context)]
+        self.assertEqual({"value": 2}, stored_state["counter"])
+        self.assertEqual("weather", stored_state["topic"])
+        self.assertEqual(100, len(stored_state["history"]["items"]))
+
+    async def test_user_memory_scope_value_should_be_serializable(self):
+        conversation_state = ConversationState(MemoryStorage())
+        user_state = UserState(MemoryStorage())
+        dialogs = DialogSet(conversation_state.create_property("dialogs"))
+
+        context = TurnContext(TestAdapter(), MemoryScopesTests.begin_message)
+        context.turn_state["UserState"] = user_state
+        await user_state.create_property("name").set(context, "bob")
+        dialog_context = await dialogs.create_context(context)
+
+        user = dialog_context.state.get_value(dict, "user")
+        self.assertEqual('{"name": "bob"}', json.dumps(user))
+        properties = []
+        ObjectPath.for_each_property(user, lambda key, _: properties.append(key))
+        self.assertEqual(["name"], properties)
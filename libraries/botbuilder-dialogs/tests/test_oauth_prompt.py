@@ -391,7 +391,7 @@ class OAuthPromptTests(aiounittest.AsyncTestCase):
         dialogs.add(
             OAuthPrompt(
                 "prompt",
-                OAuthPromptSettings(connection_name, "Login", None, 1),
+                OAuthPromptSettings(connection_name, "Login", None, 0),
             )
         )
 
@@ -0,0 +1,47 @@
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License.
+
+import unittest
+
+from recognizers_text import Culture
+
+from botbuilder.dialogs import RecognizerModels
+
+
+class RecognizerModelsTests(unittest.TestCase):
+    def test_models_are_cached_per_type_and_culture(self):
+        number_model = RecognizerModels.get_number_model(Culture.English)
+
+        self.assertIs(number_model, RecognizerModels.get_number_model(Culture.English))
+        self.assertIsNot(
+            number_model, RecognizerModels.get_ordinal_model(Culture.English)
+        )
+        self.assertEqual(
+            "3", number_model.parse("I want 3 apples")[0].resolution["value"]
+        )
+
+    def test_warm_up_builds_the_models(self):
+        RecognizerModels.warm_up(
+            [Culture.English], [RecognizerModels.BOOLEAN, RecognizerModels.DATETIME]
+        )
+
+        self.assertIn(
+            (RecognizerModels.BOOLEAN, Culture.English), RecognizerModels._models
+        )
+        self.assertIn(
+            (RecognizerModels.DATETIME, Culture.English), RecognizerModels._models
+        )
+
+    def test_unsupported_cultures_share_the_english_models(self):
+        number_model = RecognizerModels.get_number_model(Culture.English)
+
+        self.assertIs(number_model, RecognizerModels.get_number_model("xx-yy"))
+        self.assertIs(number_model, RecognizerModels.get_number_model(None))
+        self.assertIsNot(
+            number_model, RecognizerModels.get_number_model(Culture.Spanish)
+        )
+        self.assertNotIn((RecognizerModels.NUMBER, "xx-yy"), RecognizerModels._models)
+
+    def test_unknown_model_type(self):
+        with self.assertRaises(ValueError):
+            RecognizerModels.get_model("currency", Culture.English)
@@ -7,7 +7,8 @@
 
 from .aiohttp_channel_service import aiohttp_channel_service_routes
 from .aiohttp_channel_service_exception_middleware import aiohttp_error_middleware
-from .bot_framework_http_client import BotFrameworkHttpClient
+from .aiohttp_http_driver import AiohttpHttpDriver
+from .bot_framework_http_client import BotFrameworkHttpClient, SkillCallMetrics
 from .bot_framework_http_adapter import BotFrameworkHttpAdapter
 from .cloud_adapter import CloudAdapter
 from .configuration_service_client_credential_factory import (
@@ -20,9 +21,11 @@ from .configuration_bot_framework_authentication import (
 __all__ = [
     "aiohttp_channel_service_routes",
     "aiohttp_error_middleware",
+    "AiohttpHttpDriver",
     "BotFrameworkHttpClient",
     "BotFrameworkHttpAdapter",
     "CloudAdapter",
+    "SkillCallMetrics",
     "ConfigurationServiceClientCredentialFactory",
     "ConfigurationBotFrameworkAuthentication",
 ]
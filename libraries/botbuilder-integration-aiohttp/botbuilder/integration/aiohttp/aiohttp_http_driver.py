@@ -0,0 +1,162 @@
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License.
+
+from typing import Any
+
+import aiohttp
+from msrest.exceptions import ClientRequestError
+from msrest.universal_http import ClientRequest
+from msrest.universal_http.aiohttp import AioHttpClientResponse
+from msrest.universal_http.async_abc import AsyncClientResponse
+from msrest.universal_http.async_requests import (
+    AsyncRequestsHTTPSender as AsyncRequestsHTTPDriver,
+)
+
+
+class _AiohttpClientResponse(AioHttpClientResponse):
+    def body(self) -> bytes:
+        # Empty bodies are valid, e.g. for a 204 or for a deleted activity.
+        if self._body is None:
+            raise ValueError(
+                "Body is not available. Call async method load_body, or do your call with stream=False."
+            )
+        return self._body
+
+
+class AiohttpHttpDriver(AsyncRequestsHTTPDriver):
+    """
+    An HTTP driver for the connector clients that sends requests with aiohttp.
+
+    .. remarks::
+        The default driver runs a blocking requests call on the default thread pool for every
+        outbound call. This driver sends them on the event loop instead, over a pooled
+        :class:`aiohttp.ClientSession` that can be shared by every client of the bot.
+
+        The driver keeps the requests session of its base class so existing credentials can
+        still sign it; the signed headers are sent with each request.
+
+        Pass it as the `http_driver` of :class:`ConfigurationBotFrameworkAuthentication` for a
+        :class:`CloudAdapter`, or of :class:`BotFrameworkAdapterSettings` for a
+        :class:`BotFrameworkHttpAdapter`, so the connector clients the adapter creates use it.
+        The user token clients of a :class:`CloudAdapter` use it too:
+
+        .. code-block:: python
+
+            driver = AiohttpHttpDriver(limit=200)
+            adapter = CloudAdapter(
+                ConfigurationBotFrameworkAuthentication(config, http_driver=driver)
+            )
+
+        Clients created directly use it with :class:`AsyncBfPipeline`:
+
+        .. code-block:: python
+
+            client = ConnectorClient(
+                credentials, service_url, pipeline_type=AsyncBfPipeline, driver=driver
+            )
+    """
+
+    def __init__(
+        self,
+        session: aiohttp.ClientSession = None,
+        *,
+        config=None,
+        limit: int = 100,
+        limit_per_host: int = 0,
+        keepalive_timeout: float = 15.0,
+        ttl_dns_cache: int = 10,
+    ):
+        """
+        Initializes a new instance of the :class:`AiohttpHttpDriver` class.
+
+        :param session: Optional, the session to send requests with. When omitted, a session is
+            created on first use and closed by :meth:`close`.
+        :type session: :class:`aiohttp.ClientSession`
+        :param config: Optional, the msrest configuration of the requests.
+        :param limit: The maximum number of open connections.
+        :type limit: int
+        :param limit_per_host: The maximum number of open connections to a single host, 0 for no limit.
+        :type limit_per_host: int
+        :param keepalive_timeout: The number of seconds an idle connection is kept open.
+        :type keepalive_timeout: float
+        :param ttl_dns_cache: The number of seconds resolved host names are cached.
+        :type ttl_dns_cache: int
+        """
+        super().__init__(config)
+        self._client_session = session
+        self._owns_client_session = session is None
+        self._limit = limit
+        self._limit_per_host = limit_per_host
+        self._keepalive_timeout = keepalive_timeout
+        self._ttl_dns_cache = ttl_dns_cache
+
+    @property
+    def client_session(self) -> aiohttp.ClientSession:
+        if self._client_session is None or self._client_session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self._limit,
+                limit_per_host=self._limit_per_host,
+                keepalive_timeout=self._keepalive_timeout,
+                ttl_dns_cache=self._ttl_dns_cache,
+            )
+            self._client_session = aiohttp.ClientSession(connector=connector)
+            self._owns_client_session = True
+        return self._client_session
+
+    async def send(self, request: ClientRequest, **kwargs: Any) -> AsyncClientResponse:
+        session = kwargs.get("session", self.session)
+        requests_kwargs = self._configure_send(request, **kwargs)
+
+        if "files" in requests_kwargs or requests_kwargs.get("cert"):
+            # Multipart uploads and client certificates are left to requests.
+            return await super().send(request, **kwargs)
+
+        # The credentials sign the requests session, so its headers are sent first.
+        headers = dict(session.headers)
+        headers.update(requests_kwargs["headers"])
+
+        aiohttp_kwargs = {
+            "headers": headers,
+            "data": requests_kwargs.get("data"),
+            "allow_redirects": requests_kwargs.get("allow_redirects", True),
+            "max_redirects": session.max_redirects,
+        }
+
+        timeout = requests_kwargs.get("timeout")
+        if isinstance(timeout, tuple):
+            aiohttp_kwargs["timeout"] = aiohttp.ClientTimeout(
+                sock_connect=timeout[0], sock_read=timeout[1]
+            )
+        elif timeout is not None:
+            aiohttp_kwargs["timeout"] = aiohttp.ClientTimeout(total=timeout)
+
+        if requests_kwargs.get("verify") is False:
+            aiohttp_kwargs["ssl"] = False
+
+        proxies = requests_kwargs.get("proxies")
+        if proxies:
+            scheme = request.url.split(":", 1)[0].lower()
+            aiohttp_kwargs["proxy"] = proxies.get(scheme)
+
+        try:
+            result = await self.client_session.request(
+                request.method, request.url, **aiohttp_kwargs
+            )
+            response = _AiohttpClientResponse(request, result)
+            if not kwargs.get("stream", False):
+                await response.load_body()
+            return response
+        except aiohttp.ClientError as err:
+            raise ClientRequestError("Error occurred in request.") from err
+
+    async def close(self):
+        """
+        Closes the aiohttp session if it was created by this driver.
+        """
+        if self._owns_client_session and self._client_session is not None:
+            await self._client_session.close()
+        self._client_session = None
+
+    async def __aexit__(self, *exc_details):  # pylint: disable=arguments-differ
+        await self.close()
+        return await super().__aexit__(*exc_details)
@@ -3,6 +3,7 @@
 # pylint: disable=no-member
 
 import json
+import time
 from typing import Dict, List, Tuple
 from logging import Logger
 
@@ -26,10 +27,35 @@ from botframework.connector.auth import (
 )
 
 
+class SkillCallMetrics:
+    """Running totals for the activities posted to one skill endpoint."""
+
+    def __init__(self):
+        self.count = 0
+        self.failures = 0
+        self.duration = 0.0
+
+    def record(self, duration: float, succeeded: bool):
+        """Record a completed call.
+
+        :param duration: The seconds between sending the request and reading the response.
+        :param succeeded: False if the call raised or the skill returned an error status.
+        :return:
+        """
+        self.count += 1
+        self.duration += duration
+        if not succeeded:
+            self.failures += 1
+
+
 class BotFrameworkHttpClient(BotFrameworkClient):
     """
     A skill host adapter that implements the API to forward activity to a skill and
     implements routing ChannelAPI calls from the skill up through the bot/adapter.
+
+    Activities are posted over a single pooled :class:`aiohttp.ClientSession`, so connections
+    to a skill are kept alive between calls. The session is created on first use and closed
+    by :meth:`close`. The time spent on each skill endpoint is tracked in skill_metrics.
     """
 
     INVOKE_ACTIVITY_NAME = "SkillEvents.ChannelApiInvoke"
@@ -41,13 +67,54 @@ class BotFrameworkHttpClient(BotFrameworkClient):
         credential_provider: CredentialProvider,
         channel_provider: ChannelProvider = None,
         logger: Logger = None,
+        *,
+        http_client: aiohttp.ClientSession = None,
+        limit: int = 100,
+        limit_per_host: int = 0,
+        keepalive_timeout: float = 15.0,
+        timeout: aiohttp.ClientTimeout = None,
     ):
+        """
+        Initializes a new instance of the :class:`BotFrameworkHttpClient` class.
+
+        :param credential_provider: The credential provider of the bot.
+        :param channel_provider: Optional, the channel provider of the bot.
+        :param logger: Optional, the logger.
+        :param http_client: Optional, the session to post activities with. It is not closed by
+            :meth:`close`; the pool settings below only apply to the session the client creates.
+        :param limit: The maximum number of open connections.
+        :param limit_per_host: The maximum number of open connections to a single skill host,
+            0 for no limit.
+        :param keepalive_timeout: The number of seconds an idle connection is kept open.
+        :param timeout: Optional, the timeouts of a skill call. Defaults to the aiohttp timeouts.
+        """
         if not credential_provider:
             raise TypeError("credential_provider can't be None")
 
         self._credential_provider = credential_provider
         self._channel_provider = channel_provider
         self._logger = logger
+        self._http_client = http_client
+        self._owns_http_client = http_client is None
+        self._limit = limit
+        self._limit_per_host = limit_per_host
+        self._keepalive_timeout = keepalive_timeout
+        self._timeout = timeout
+        self.skill_metrics: Dict[str, SkillCallMetrics] = {}
+
+    async def close(self):
+        """
+        Closes the session created by the client. A session passed to the constructor is left open.
+        """
+        if self._owns_http_client and self._http_client is not None:
+            await self._http_client.close()
+            self._http_client = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_details):
+        await self.close()
 
     async def post_activity(
         self,
@@ -127,17 +194,42 @@ class BotFrameworkHttpClient(BotFrameworkClient):
 
         json_content = json.dumps(activity.serialize())
 
-        async with aiohttp.ClientSession() as session:
-            resp = await session.post(
+        metrics = self.skill_metrics.get(to_url)
+        if metrics is None:
+            metrics = self.skill_metrics[to_url] = SkillCallMetrics()
+
+        succeeded = False
+        start = time.perf_counter()
+        try:
+            async with self._get_http_client().post(
                 to_url,
                 data=json_content.encode("utf-8"),
                 headers=headers_dict,
-            )
+            ) as resp:
+                resp.raise_for_status()
+                data = (await resp.read()).decode()
+                succeeded = True
+        finally:
+            metrics.record(time.perf_counter() - start, succeeded)
 
-        resp.raise_for_status()
-        data = (await resp.read()).decode()
         return resp.status, json.loads(data) if data else None
 
+    def _get_http_client(self) -> aiohttp.ClientSession:
+        if self._http_client is None or (
+            self._owns_http_client and self._http_client.closed
+        ):
+            connector = aiohttp.TCPConnector(
+                limit=self._limit,
+                limit_per_host=self._limit_per_host,
+                keepalive_timeout=self._keepalive_timeout,
+            )
+            session_kwargs = {"connector": connector}
+            if self._timeout is not None:
+                session_kwargs["timeout"] = self._timeout
+            self._http_client = aiohttp.ClientSession(**session_kwargs)
+            self._owns_http_client = True
+        return self._http_client
+
     async def post_buffered_activity(
         self,
         from_bot_id: str,
@@ -4,6 +4,8 @@
 from logging import Logger
 from typing import Any
 
+from msrest.universal_http.async_abc import AsyncHTTPSender as AsyncHttpDriver
+
 from botbuilder.integration.aiohttp import ConfigurationServiceClientCredentialFactory
 from botbuilder.schema import Activity
 from botframework.connector import HttpClientFactory
@@ -28,7 +30,8 @@ class ConfigurationBotFrameworkAuthentication(BotFrameworkAuthentication):
         credentials_factory: ServiceClientCredentialsFactory = None,
         auth_configuration: AuthenticationConfiguration = None,
         http_client_factory: HttpClientFactory = None,
-        logger: Logger = None
+        logger: Logger = None,
+        http_driver: AsyncHttpDriver = None
     ):
         self._inner: BotFrameworkAuthentication = (
             BotFrameworkAuthenticationFactory.create(
@@ -63,6 +66,7 @@ class ConfigurationBotFrameworkAuthentication(BotFrameworkAuthentication):
                 ),
                 http_client_factory=http_client_factory,
                 logger=logger,
+                http_driver=http_driver,
             )
         )
 
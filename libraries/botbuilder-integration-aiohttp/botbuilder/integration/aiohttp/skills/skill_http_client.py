@@ -3,6 +3,7 @@
 
 from logging import Logger
 
+import aiohttp
 from botbuilder.core import InvokeResponse
 from botbuilder.integration.aiohttp import BotFrameworkHttpClient
 from botbuilder.core.skills import (
@@ -26,16 +27,30 @@ class SkillHttpClient(BotFrameworkHttpClient):
         skill_conversation_id_factory: ConversationIdFactoryBase,
         channel_provider: ChannelProvider = None,
         logger: Logger = None,
+        *,
+        http_client: aiohttp.ClientSession = None,
+        limit: int = 100,
+        limit_per_host: int = 0,
+        keepalive_timeout: float = 15.0,
+        timeout: aiohttp.ClientTimeout = None,
     ):
         if not skill_conversation_id_factory:
             raise TypeError(
                 "SkillHttpClient(): skill_conversation_id_factory can't be None"
             )
 
-        super().__init__(credential_provider)
+        super().__init__(
+            credential_provider,
+            channel_provider,
+            logger,
+            http_client=http_client,
+            limit=limit,
+            limit_per_host=limit_per_host,
+            keepalive_timeout=keepalive_timeout,
+            timeout=timeout,
+        )
 
         self._skill_conversation_id_factory = skill_conversation_id_factory
-        self._channel_provider = channel_provider
 
     async def post_activity_to_skill(
         self,
@@ -43,11 +43,11 @@ class AiohttpWebSocket(WebSocket):
             message_data = None
 
             if message.type == WSMsgType.TEXT:
-                message_data = list(str(message.data).encode("ascii"))
+                message_data = str(message.data).encode("ascii")
             elif message.type == WSMsgType.BINARY:
-                message_data = list(message.data)
+                message_data = message.data
             elif isinstance(message.data, int):
-                message_data = []
+                message_data = b""
 
             # async for message in self._aiohttp_ws:
             return WebSocketMessage(
@@ -63,9 +63,7 @@ class AiohttpWebSocket(WebSocket):
         is_closing = self._aiohttp_ws.closed
         try:
             if message_type == WebSocketMessageType.BINARY:
-                # TODO: The clening buffer line should be removed, just for bypassing bug in POC
-                clean_buffer = bytes([byte for byte in buffer if byte is not None])
-                await self._aiohttp_ws.send_bytes(clean_buffer)
+                await self._aiohttp_ws.send_bytes(buffer)
             elif message_type == WebSocketMessageType.TEXT:
                 await self._aiohttp_ws.send_str(buffer)
             else:
@@ -0,0 +1,171 @@
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License.
+
+import aiounittest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+from msrest.authentication import BasicTokenAuthentication
+from msrest.exceptions import ClientRequestError
+
+from botbuilder.core import BotFrameworkAdapterSettings
+from botbuilder.integration.aiohttp import (
+    AiohttpHttpDriver,
+    BotFrameworkHttpAdapter,
+    ConfigurationBotFrameworkAuthentication,
+)
+from botbuilder.schema import Activity, ConversationAccount
+from botframework.connector import AsyncBfPipeline
+from botframework.connector.aio import ConnectorClient
+from botframework.connector.auth import ClaimsIdentity, MicrosoftAppCredentials
+from botframework.connector.token_api.aio import TokenApiClient
+
+
+class TestAiohttpHttpDriver(aiounittest.AsyncTestCase):
+    async def test_sends_activities_to_the_channel(self):
+        requests = []
+
+        async def reply_to_activity(request: web.Request):
+            requests.append(
+                (request.headers.get("Authorization"), await request.json())
+            )
+            return web.json_response({"id": "reply-id"})
+
+        async def delete_activity(request: web.Request):
+            requests.append((request.headers.get("Authorization"), None))
+            return web.Response(status=200)
+
+        app = web.Application()
+        app.router.add_post(
+            "/v3/conversations/{conversation_id}/activities/{activity_id}",
+            reply_to_activity,
+        )
+        app.router.add_delete(
+            "/v3/conversations/{conversation_id}/activities/{activity_id}",
+            delete_activity,
+        )
+
+        async with TestServer(app) as server:
+            driver = AiohttpHttpDriver(limit=10)
+            credentials = BasicTokenAuthentication({"access_token": "token"})
+            client = ConnectorClient(
+                credentials,
+                str(server.make_url("/")),
+                pipeline_type=AsyncBfPipeline,
+                driver=driver,
+            )
+
+            try:
+                response = await client.conversations.reply_to_activity(
+                    "conversation-id",
+                    "activity-id",
+                    Activity(type="message", text="hello"),
+                )
+                await client.conversations.delete_activity(
+                    "conversation-id", "reply-id"
+                )
+            finally:
+                await driver.close()
+
+        self.assertEqual("reply-id", response.id)
+        self.assertEqual(2, len(requests))
+        self.assertEqual("Bearer token", requests[0][0])
+        self.assertEqual("hello", requests[0][1]["text"])
+        self.assertEqual("Bearer token", requests[1][0])
+
+    async def test_token_api_client_uses_driver(self):
+        async def get_token(request: web.Request):
+            return web.json_response(
+                {
+                    "connectionName": request.query["connectionName"],
+                    "token": "user-token",
+                }
+            )
+
+        app = web.Application()
+        app.router.add_get("/api/usertoken/GetToken", get_token)
+
+        async with TestServer(app) as server:
+            driver = AiohttpHttpDriver()
+            client = TokenApiClient(
+                MicrosoftAppCredentials.empty(),
+                str(server.make_url("/")),
+                driver=driver,
+            )
+
+            try:
+                response = await client.user_token.get_token("user-id", "connection")
+            finally:
+                await driver.close()
+
+        self.assertEqual("connection", response.connection_name)
+        self.assertEqual("user-token", response.token)
+
+    async def test_connection_errors_are_client_request_errors(self):
+        driver = AiohttpHttpDriver()
+        client = ConnectorClient(
+            MicrosoftAppCredentials.empty(),
+            "http://127.0.0.1:1/",
+            pipeline_type=AsyncBfPipeline,
+            driver=driver,
+        )
+
+        try:
+            with self.assertRaises(ClientRequestError):
+                await client.conversations.get_conversations()
+        finally:
+            await driver.close()
+
+    async def test_adapters_create_connector_clients_with_the_driver(self):
+        requests = []
+
+        async def send_to_conversation(request: web.Request):
+            requests.append(request.match_info["conversation_id"])
+            return web.json_response({"id": "activity-id"})
+
+        app = web.Application()
+        app.router.add_post(
+            "/v3/conversations/{conversation_id}/activities", send_to_conversation
+        )
+
+        class CountingDriver(AiohttpHttpDriver):
+            sent = 0
+
+            async def send(self, request, **kwargs):
+                CountingDriver.sent += 1
+                return await super().send(request, **kwargs)
+
+        async with TestServer(app) as server:
+            service_url = str(server.make_url("/"))
+            driver = CountingDriver()
+
+            adapter = BotFrameworkHttpAdapter(
+                BotFrameworkAdapterSettings("", "", http_driver=driver)
+            )
+            authentication = ConfigurationBotFrameworkAuthentication(
+                object(), http_driver=driver
+            )
+            connector_factory = authentication.create_connector_factory(
+                ClaimsIdentity({}, True)
+            )
+
+            try:
+                clients = [
+                    await adapter.create_connector_client(service_url),
+                    await connector_factory.create(service_url),
+                ]
+                for index, client in enumerate(clients):
+                    await client.conversations.send_to_conversation(
+                        f"conversation-{index}",
+                        Activity(
+                            type="message",
+                            text="hello",
+                            conversation=ConversationAccount(
+                                id=f"conversation-{index}"
+                            ),
+                        ),
+                    )
+            finally:
+                await driver.close()
+
+        self.assertEqual(["conversation-0", "conversation-1"], requests)
+        self.assertEqual(2, CountingDriver.sent)
@@ -1,6 +1,8 @@
 from unittest.mock import Mock
 
 import aiounittest
+from aiohttp import ClientResponseError, web
+from aiohttp.test_utils import TestServer
 from botbuilder.schema import ConversationAccount, ChannelAccount, RoleTypes
 from botbuilder.integration.aiohttp import BotFrameworkHttpClient
 from botframework.connector.auth import CredentialProvider, Activity
@@ -70,3 +72,64 @@ class TestBotFrameworkHttpClient(aiounittest.AsyncTestCase):
 
         assert activity.recipient.id == skill_recipient_id
         assert activity.recipient.role is RoleTypes.skill
+
+    async def test_reuses_the_connection_to_a_skill(self):
+        peers = []
+
+        async def messages(request: web.Request):
+            peers.append(request.transport.get_extra_info("peername"))
+            body = await request.json()
+            return web.json_response({"text": body["text"]})
+
+        async def failure(request: web.Request):  # pylint: disable=unused-argument
+            return web.Response(status=500)
+
+        app = web.Application()
+        app.router.add_post("/api/messages", messages)
+        app.router.add_post("/api/failure", failure)
+
+        async with TestServer(app) as server:
+            to_url = str(server.make_url("/api/messages"))
+            async with BotFrameworkHttpClient(
+                Mock(spec=CredentialProvider), limit_per_host=1
+            ) as client:
+                for text in ["one", "two"]:
+                    response = await client.post_activity(
+                        None,
+                        None,
+                        to_url,
+                        "https://parentbot.com/api/messages",
+                        "NewConversationId",
+                        Activity(
+                            type="message",
+                            text=text,
+                            conversation=ConversationAccount(),
+                        ),
+                    )
+                    self.assertEqual(200, response.status)
+                    self.assertEqual({"text": text}, response.body)
+
+                failure_url = str(server.make_url("/api/failure"))
+                with self.assertRaises(ClientResponseError):
+                    await client.post_activity(
+                        None,
+                        None,
+                        failure_url,
+                        "https://parentbot.com/api/messages",
+                        "NewConversationId",
+                        Activity(type="message", conversation=ConversationAccount()),
+                    )
+
+                session = client._get_http_client()  # pylint: disable=protected-access
+
+            self.assertTrue(session.closed)
+
+        self.assertEqual(2, len(peers))
+        self.assertEqual(peers[0], peers[1])
+
+        metrics = client.skill_metrics[to_url]
+        self.assertEqual(2, metrics.count)
+        self.assertEqual(0, metrics.failures)
+        self.assertGreater(metrics.duration, 0)
+        self.assertEqual(1, client.skill_metrics[failure_url].count)
+        self.assertEqual(1, client.skill_metrics[failure_url].failures)
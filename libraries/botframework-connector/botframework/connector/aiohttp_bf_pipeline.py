@@ -28,7 +28,8 @@ class AsyncBfPipeline(AsyncPipeline):
                 # Assume this is the old credentials class, and then requests. Wrap it.
                 policies.insert(1, AsyncRequestsCredentialsPolicy(creds))
 
-        sender = config.sender or AsyncPipelineRequestsHTTPSender(
-            config.driver or Driver(config)
+        # Configurations other than BotFrameworkConnectorConfiguration may not define a sender or driver.
+        sender = getattr(config, "sender", None) or AsyncPipelineRequestsHTTPSender(
+            getattr(config, "driver", None) or Driver(config)
         )
         super().__init__(policies, sender)
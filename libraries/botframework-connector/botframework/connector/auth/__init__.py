@@ -25,6 +25,7 @@ from .credential_provider import *
 from .channel_validation import *
 from .emulator_validation import *
 from .jwt_token_extractor import *
+from .validated_token_cache import *
 from .password_service_client_credential_factory import *
 from .service_client_credentials_factory import *
 from .user_token_client import *
@@ -4,6 +4,8 @@
 from logging import Logger
 from typing import Optional
 
+from msrest.universal_http.async_abc import AsyncHTTPSender as AsyncHttpDriver
+
 from botbuilder.schema import Activity
 
 from ..bot_framework_sdk_client_async import BotFrameworkConnectorConfiguration
@@ -41,6 +43,7 @@ class _BuiltinBotFrameworkAuthentication(BotFrameworkAuthentication):
         http_client_factory: HttpClientFactory,
         connector_client_configuration: BotFrameworkConnectorConfiguration,
         logger: Logger,
+        http_driver: AsyncHttpDriver = None,
     ):
         self._to_channel_from_bot_oauth_scope = to_channel_from_bot_oauth_scope
         self._login_endpoint = login_endpoint
@@ -52,6 +55,7 @@ class _BuiltinBotFrameworkAuthentication(BotFrameworkAuthentication):
         self._http_client_factory = http_client_factory
         self._connector_client_configuration = connector_client_configuration
         self._logger = logger
+        self._http_driver = http_driver
 
     @staticmethod
     def get_app_id(claims_identity: ClaimsIdentity) -> str:
@@ -98,6 +102,7 @@ class _BuiltinBotFrameworkAuthentication(BotFrameworkAuthentication):
             credential_factory=self._credentials_factory,
             connector_client_configuration=self._connector_client_configuration,
             logger=self._logger,
+            http_driver=self._http_driver,
         )
 
         result = AuthenticateRequestResult()
@@ -157,6 +162,7 @@ class _BuiltinBotFrameworkAuthentication(BotFrameworkAuthentication):
             credential_factory=self._credentials_factory,
             connector_client_configuration=self._connector_client_configuration,
             logger=self._logger,
+            http_driver=self._http_driver,
         )
 
     async def create_user_token_client(
@@ -171,7 +177,9 @@ class _BuiltinBotFrameworkAuthentication(BotFrameworkAuthentication):
             validate_authority=True,
         )
 
-        return _UserTokenClientImpl(app_id, credentials, self._oauth_endpoint)
+        return _UserTokenClientImpl(
+            app_id, credentials, self._oauth_endpoint, http_driver=self._http_driver
+        )
 
     def create_bot_framework_client(self) -> BotFrameworkClient:
         return _BotFrameworkClientImpl(
@@ -3,9 +3,12 @@
 
 from logging import Logger
 
+from msrest.universal_http.async_abc import AsyncHTTPSender as AsyncHttpDriver
+
 from botframework.connector.aio import ConnectorClient
 
 from ..about import __version__
+from ..aiohttp_bf_pipeline import AsyncBfPipeline
 from ..bot_framework_sdk_client_async import BotFrameworkConnectorConfiguration
 from .connector_factory import ConnectorFactory
 from .service_client_credentials_factory import ServiceClientCredentialsFactory
@@ -23,6 +26,7 @@ class _ConnectorFactoryImpl(ConnectorFactory):
         credential_factory: ServiceClientCredentialsFactory,
         connector_client_configuration: BotFrameworkConnectorConfiguration = None,
         logger: Logger = None,
+        http_driver: AsyncHttpDriver = None,
     ) -> None:
         self._app_id = app_id
         self._to_channel_from_bot_oauth_scope = to_channel_from_bot_oauth_scope
@@ -31,6 +35,7 @@ class _ConnectorFactoryImpl(ConnectorFactory):
         self._credential_factory = credential_factory
         self._connector_client_configuration = connector_client_configuration
         self._logger = logger
+        self._http_driver = http_driver
 
     async def create(self, service_url: str, audience: str = None) -> ConnectorClient:
         # Use the credentials factory to create credentails specific to this particular cloud environment.
@@ -49,6 +54,13 @@ class _ConnectorFactoryImpl(ConnectorFactory):
                 base_url=service_url,
                 custom_configuration=self._connector_client_configuration,
             )
+        elif self._http_driver:
+            client = ConnectorClient(
+                credentials,
+                base_url=service_url,
+                pipeline_type=AsyncBfPipeline,
+                driver=self._http_driver,
+            )
         else:
             client = ConnectorClient(credentials, base_url=service_url)
         client.config.add_user_agent(USER_AGENT)
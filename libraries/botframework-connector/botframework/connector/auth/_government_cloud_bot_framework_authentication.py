@@ -3,6 +3,8 @@
 
 from logging import Logger
 
+from msrest.universal_http.async_abc import AsyncHTTPSender as AsyncHttpDriver
+
 from botbuilder.schema import CallerIdConstants
 
 from ..bot_framework_sdk_client_async import BotFrameworkConnectorConfiguration
@@ -21,6 +23,7 @@ class _GovernmentCloudBotFrameworkAuthentication(_BuiltinBotFrameworkAuthenticat
         http_client_factory: HttpClientFactory,
         connector_client_configuration: BotFrameworkConnectorConfiguration = None,
         logger: Logger = None,
+        http_driver: AsyncHttpDriver = None,
     ):
         super(_GovernmentCloudBotFrameworkAuthentication, self).__init__(
             GovernmentConstants.TO_CHANNEL_FROM_BOT_OAUTH_SCOPE,
@@ -33,4 +36,5 @@ class _GovernmentCloudBotFrameworkAuthentication(_BuiltinBotFrameworkAuthenticat
             http_client_factory,
             connector_client_configuration,
             logger,
+            http_driver,
         )
@@ -4,6 +4,8 @@
 from logging import Logger
 from typing import Dict, Optional
 
+from msrest.universal_http.async_abc import AsyncHTTPSender as AsyncHttpDriver
+
 from botbuilder.schema import Activity, RoleTypes
 
 from ..bot_framework_sdk_client_async import BotFrameworkConnectorConfiguration
@@ -46,6 +48,7 @@ class _ParameterizedBotFrameworkAuthentication(BotFrameworkAuthentication):
         http_client_factory: HttpClientFactory,
         connector_client_configuration: BotFrameworkConnectorConfiguration = None,
         logger: Logger = None,
+        http_driver: AsyncHttpDriver = None,
     ):
         self._validate_authority = validate_authority
         self._to_channel_from_bot_login_url = to_channel_from_bot_login_url
@@ -64,6 +67,7 @@ class _ParameterizedBotFrameworkAuthentication(BotFrameworkAuthentication):
         self._http_client_factory = http_client_factory
         self._connector_client_configuration = connector_client_configuration
         self._logger = logger
+        self._http_driver = http_driver
 
     async def authenticate_request(
         self, activity: Activity, auth_header: str
@@ -92,6 +96,7 @@ class _ParameterizedBotFrameworkAuthentication(BotFrameworkAuthentication):
             credential_factory=self._credentials_factory,
             connector_client_configuration=self._connector_client_configuration,
             logger=self._logger,
+            http_driver=self._http_driver,
         )
 
         result = AuthenticateRequestResult()
@@ -146,6 +151,7 @@ class _ParameterizedBotFrameworkAuthentication(BotFrameworkAuthentication):
             credential_factory=self._credentials_factory,
             connector_client_configuration=self._connector_client_configuration,
             logger=self._logger,
+            http_driver=self._http_driver,
         )
 
     async def create_user_token_client(
@@ -160,7 +166,9 @@ class _ParameterizedBotFrameworkAuthentication(BotFrameworkAuthentication):
             validate_authority=self._validate_authority,
         )
 
-        return _UserTokenClientImpl(app_id, credentials, self._oauth_url)
+        return _UserTokenClientImpl(
+            app_id, credentials, self._oauth_url, http_driver=self._http_driver
+        )
 
     def create_bot_framework_client(self) -> BotFrameworkClient:
         return _BotFrameworkClientImpl(
@@ -3,6 +3,8 @@
 
 from logging import Logger
 
+from msrest.universal_http.async_abc import AsyncHTTPSender as AsyncHttpDriver
+
 from botbuilder.schema import CallerIdConstants
 
 from ..bot_framework_sdk_client_async import BotFrameworkConnectorConfiguration
@@ -22,6 +24,7 @@ class _PublicCloudBotFrameworkAuthentication(_BuiltinBotFrameworkAuthentication)
         http_client_factory: HttpClientFactory,
         connector_client_configuration: BotFrameworkConnectorConfiguration = None,
         logger: Logger = None,
+        http_driver: AsyncHttpDriver = None,
     ):
         super(_PublicCloudBotFrameworkAuthentication, self).__init__(
             AuthenticationConstants.TO_CHANNEL_FROM_BOT_OAUTH_SCOPE,
@@ -34,4 +37,5 @@ class _PublicCloudBotFrameworkAuthentication(_BuiltinBotFrameworkAuthentication)
             http_client_factory,
             connector_client_configuration,
             logger,
+            http_driver,
         )
@@ -3,6 +3,8 @@
 
 from typing import Dict, List
 
+from msrest.universal_http.async_abc import AsyncHTTPSender as AsyncHttpDriver
+
 from botbuilder.schema import Activity, TokenResponse
 
 from botframework.connector.token_api import TokenApiClientConfiguration
@@ -24,10 +26,11 @@ class _UserTokenClientImpl(UserTokenClient):
         credentials: AppCredentials,
         oauth_endpoint: str,
         client_configuration: TokenApiClientConfiguration = None,
+        http_driver: AsyncHttpDriver = None,
     ) -> None:
         super().__init__()
         self._app_id = app_id
-        self._client = TokenApiClient(credentials, oauth_endpoint)
+        self._client = TokenApiClient(credentials, oauth_endpoint, driver=http_driver)
         if client_configuration:
             self._client.config = client_configuration
 
@@ -2,6 +2,8 @@
 # Licensed under the MIT License.
 from logging import Logger
 
+from msrest.universal_http.async_abc import AsyncHTTPSender as AsyncHttpDriver
+
 from ..bot_framework_sdk_client_async import BotFrameworkConnectorConfiguration
 from ..http_client_factory import HttpClientFactory
 
@@ -41,7 +43,8 @@ class BotFrameworkAuthenticationFactory:
         auth_configuration: AuthenticationConfiguration = AuthenticationConfiguration(),
         http_client_factory: HttpClientFactory = None,
         connector_client_configuration: BotFrameworkConnectorConfiguration = None,
-        logger: Logger = None
+        logger: Logger = None,
+        http_driver: AsyncHttpDriver = None
     ) -> BotFrameworkAuthentication:
         """
         Creates the appropriate BotFrameworkAuthentication instance.
@@ -60,6 +63,8 @@ class BotFrameworkAuthenticationFactory:
         :param http_client_factory: The HttpClientFactory to use for a skill BotFrameworkClient.
         :param connector_client_configuration: Configuration to use custom http pipeline for the connector
         :param logger: The Logger to use.
+        :param http_driver: The HTTP driver the connector clients send their requests with, when
+            connector_client_configuration isn't set.
         :return: A new BotFrameworkAuthentication instance.
         """
         # pylint: disable=too-many-boolean-expressions
@@ -87,6 +92,7 @@ class BotFrameworkAuthenticationFactory:
                 http_client_factory,
                 connector_client_configuration,
                 logger,
+                http_driver,
             )
         # else apply the built in default behavior, which is either the public cloud or the gov cloud
         # depending on whether we have a channelService value present
@@ -97,6 +103,7 @@ class BotFrameworkAuthenticationFactory:
                 http_client_factory,
                 connector_client_configuration,
                 logger,
+                http_driver,
             )
         if channel_service == GovernmentConstants.CHANNEL_SERVICE:
             return _GovernmentCloudBotFrameworkAuthentication(
@@ -105,6 +112,7 @@ class BotFrameworkAuthenticationFactory:
                 http_client_factory,
                 connector_client_configuration,
                 logger,
+                http_driver,
             )
 
         # The ChannelService value is used an indicator of which built in set of constants to use.
@@ -1,19 +1,22 @@
 # Copyright (c) Microsoft Corporation. All rights reserved.
 # Licensed under the MIT License.
 
+import asyncio
 import json
 from datetime import datetime, timedelta
-from typing import List
+from typing import Dict, List
 import requests
 from jwt.algorithms import RSAAlgorithm
 import jwt
 from .claims_identity import ClaimsIdentity
 from .verify_options import VerifyOptions
 from .endorsements_validator import EndorsementsValidator
+from .validated_token_cache import ValidatedToken, ValidatedTokenCache
 
 
 class JwtTokenExtractor:
     metadataCache = {}
+    validated_token_cache = ValidatedTokenCache()
 
     def __init__(
         self,
@@ -56,6 +59,22 @@ class JwtTokenExtractor:
         if schema != "Bearer" or not parameter:
             return None
 
+        validated_token = JwtTokenExtractor.validated_token_cache.get(
+            self.open_id_metadata.url, parameter
+        )
+        if validated_token:
+            if not self._is_allowed_issuer(validated_token.payload.get("iss", None)):
+                return None
+
+            # The signature was checked before, everything else is checked again.
+            await self._get_signing_key(
+                validated_token.key_id,
+                validated_token.algorithm,
+                channel_id,
+                required_endorsements,
+            )
+            return ClaimsIdentity(dict(validated_token.payload), True)
+
         # Issuer isn't allowed? No need to check signature
         if not self._has_allowed_issuer(parameter):
             return None
@@ -69,7 +88,9 @@ class JwtTokenExtractor:
 
     def _has_allowed_issuer(self, jwt_token: str) -> bool:
         decoded = jwt.decode(jwt_token, options={"verify_signature": False})
-        issuer = decoded.get("iss", None)
+        return self._is_allowed_issuer(decoded.get("iss", None))
+
+    def _is_allowed_issuer(self, issuer: str) -> bool:
         if issuer in self.validation_parameters.issuer:
             return True
 
@@ -78,12 +99,50 @@ class JwtTokenExtractor:
     async def _validate_token(
         self, jwt_token: str, channel_id: str, required_endorsements: List[str] = None
     ) -> ClaimsIdentity:
-        required_endorsements = required_endorsements or []
         headers = jwt.get_unverified_header(jwt_token)
+        key_id = headers.get("kid", None)
+        algorithm = headers.get("alg", None)
+
+        metadata = await self._get_signing_key(
+            key_id, algorithm, channel_id, required_endorsements
+        )
+
+        options = {
+            "verify_aud": False,
+            "verify_exp": not self.validation_parameters.ignore_expiration,
+        }
+
+        decoded_payload = jwt.decode(
+            jwt_token,
+            metadata.public_key,
+            leeway=self.validation_parameters.clock_tolerance,
+            options=options,
+            algorithms=["RS256"],
+        )
+
+        JwtTokenExtractor.validated_token_cache.add(
+            self.open_id_metadata.url,
+            jwt_token,
+            ValidatedToken(key_id, algorithm, decoded_payload),
+        )
+
+        claims = ClaimsIdentity(dict(decoded_payload), True)
+
+        return claims
+
+    async def _get_signing_key(
+        self,
+        key_id: str,
+        algorithm: str,
+        channel_id: str,
+        required_endorsements: List[str] = None,
+    ) -> "_OpenIdConfig":
+        required_endorsements = required_endorsements or []
 
         # Update the signing tokens from the last refresh
-        key_id = headers.get("kid", None)
         metadata = await self.open_id_metadata.get(key_id)
+        if not metadata:
+            raise Exception("Could not find the token signing key")
 
         if key_id and metadata.endorsements:
             # Verify that channelId is included in endorsements
@@ -98,61 +157,91 @@ class JwtTokenExtractor:
                 ):
                     raise Exception("Could not validate endorsement key")
 
-        if headers.get("alg", None) not in self.validation_parameters.algorithms:
+        if algorithm not in self.validation_parameters.algorithms:
             raise Exception("Token signing algorithm not in allowed list")
 
-        options = {
-            "verify_aud": False,
-            "verify_exp": not self.validation_parameters.ignore_expiration,
-        }
-
-        decoded_payload = jwt.decode(
-            jwt_token,
-            metadata.public_key,
-            leeway=self.validation_parameters.clock_tolerance,
-            options=options,
-            algorithms=["RS256"],
-        )
-
-        claims = ClaimsIdentity(decoded_payload, True)
-
-        return claims
+        return metadata
 
 
 class _OpenIdMetadata:
+    # Keys expire after a day. Once they are older than REFRESH_AHEAD they are refreshed in the
+    # background while the current keys keep being served.
+    EXPIRATION = timedelta(days=1)
+    REFRESH_AHEAD = timedelta(hours=23)
+    MISSING_KEY_REFRESH = timedelta(hours=1)
+
     def __init__(self, url):
         self.url = url
         self.keys = []
         self.last_updated = datetime.min
+        self._configs: Dict[str, _OpenIdConfig] = {}
+        self._refresh_task: asyncio.Future = None
+        # The metadata is shared by the whole process, but the refresh belongs to the loop it runs on.
+        self._refresh_loop: asyncio.AbstractEventLoop = None
 
     async def get(self, key_id: str):
-        # If keys are more than 1 day old, refresh them
-        if self.last_updated < (datetime.now() - timedelta(days=1)):
+        age = datetime.now() - self.last_updated
+        if age > self.EXPIRATION:
             await self._refresh()
+        elif age > self.REFRESH_AHEAD:
+            self._start_refresh()
 
         key = self._find(key_id)
-        if not key and self.last_updated < (datetime.now() - timedelta(hours=1)):
+        if not key and datetime.now() - self.last_updated > self.MISSING_KEY_REFRESH:
             # Refresh the cache if a key is not found (max once per hour)
             await self._refresh()
             key = self._find(key_id)
         return key
 
     async def _refresh(self):
-        response = requests.get(self.url)
+        # A cancelled caller doesn't cancel the refresh for the others.
+        await asyncio.shield(self._start_refresh())
+
+    def _start_refresh(self) -> asyncio.Future:
+        # Concurrent callers on the same loop share the refresh in progress instead of starting their
+        # own. A refresh started on another loop, which may be closed, is not awaited.
+        loop = asyncio.get_running_loop()
+        if (
+            self._refresh_task is None
+            or self._refresh_task.done()
+            or self._refresh_loop is not loop
+        ):
+            self._refresh_task = asyncio.ensure_future(self._fetch_keys())
+            self._refresh_task.add_done_callback(_OpenIdMetadata._on_refreshed)
+            self._refresh_loop = loop
+        return self._refresh_task
+
+    async def _fetch_keys(self):
+        loop = asyncio.get_event_loop()
+        response = await loop.run_in_executor(None, requests.get, self.url)
         response.raise_for_status()
         keys_url = response.json()["jwks_uri"]
-        response_keys = requests.get(keys_url)
+        response_keys = await loop.run_in_executor(None, requests.get, keys_url)
         response_keys.raise_for_status()
-        self.last_updated = datetime.now()
         self.keys = response_keys.json()["keys"]
+        self._configs = {}
+        self.last_updated = datetime.now()
+
+    @staticmethod
+    def _on_refreshed(task: asyncio.Future):
+        # Failed background refreshes are retried on the next call, with the current keys kept.
+        if not task.cancelled():
+            task.exception()
 
     def _find(self, key_id: str):
-        if not self.keys:
+        config = self._configs.get(key_id)
+        if config:
+            return config
+
+        key = next((x for x in self.keys if x["kid"] == key_id), None)
+        if not key:
             return None
-        key = [x for x in self.keys if x["kid"] == key_id][0]
+
         public_key = RSAAlgorithm.from_jwk(json.dumps(key))
         endorsements = key.get("endorsements", [])
-        return _OpenIdConfig(public_key, endorsements)
+        config = _OpenIdConfig(public_key, endorsements)
+        self._configs[key_id] = config
+        return config
 
 
 class _OpenIdConfig:
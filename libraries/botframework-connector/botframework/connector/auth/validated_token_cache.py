@@ -0,0 +1,83 @@
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License.
+
+import time
+from collections import OrderedDict
+from hashlib import sha256
+from typing import Tuple
+
+
+class ValidatedToken:
+    def __init__(self, key_id: str, algorithm: str, payload: dict):
+        self.key_id = key_id
+        self.algorithm = algorithm
+        self.payload = payload
+
+
+class ValidatedTokenCache:
+    """
+    A bounded cache of tokens whose signature has already been validated.
+
+    .. remarks::
+        Channels send the same bearer token with many requests. The cache lets
+        :class:`JwtTokenExtractor` skip decoding the token and checking its signature again. Only the
+        signature check is skipped: issuer, algorithm, signing key and endorsements are checked on every
+        request. Items are kept until the token's `exp` claim; tokens without one are not cached.
+    """
+
+    def __init__(self, max_items: int = 1000):
+        """
+        Initializes a new instance of the :class:`ValidatedTokenCache` class.
+
+        :param max_items: The maximum number of tokens to keep, 0 to disable the cache.
+        :type max_items: int
+        """
+        if max_items < 0:
+            raise ValueError("ValidatedTokenCache(): max_items cannot be negative.")
+
+        self.max_items = max_items
+        self.hits = 0
+        self.misses = 0
+        self._items: "OrderedDict[Tuple[str, str], ValidatedToken]" = OrderedDict()
+
+    def get(self, metadata_url: str, jwt_token: str) -> ValidatedToken:
+        key = ValidatedTokenCache._key(metadata_url, jwt_token)
+        item = self._items.get(key)
+
+        if item is not None and time.time() >= item.payload["exp"]:
+            del self._items[key]
+            item = None
+
+        if item is None:
+            self.misses += 1
+            return None
+
+        self._items.move_to_end(key)
+        self.hits += 1
+        return item
+
+    def add(self, metadata_url: str, jwt_token: str, item: ValidatedToken):
+        expiration = item.payload.get("exp")
+        if (
+            not self.max_items
+            or not isinstance(expiration, (int, float))
+            or time.time() >= expiration
+        ):
+            return
+
+        key = ValidatedTokenCache._key(metadata_url, jwt_token)
+        self._items[key] = item
+        self._items.move_to_end(key)
+        while len(self._items) > self.max_items:
+            self._items.popitem(last=False)
+
+    def clear(self):
+        self._items.clear()
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    @staticmethod
+    def _key(metadata_url: str, jwt_token: str) -> Tuple[str, str]:
+        # Tokens are validated against the keys of a metadata url, so they are cached per url.
+        return metadata_url, sha256(jwt_token.encode("utf-8")).hexdigest()
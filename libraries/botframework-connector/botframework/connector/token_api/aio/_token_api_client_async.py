@@ -5,13 +5,17 @@
 # license information.
 # --------------------------------------------------------------------------
 
+from typing import Optional
+
 from msrest.async_client import SDKClientAsync
+from msrest.universal_http.async_abc import AsyncHTTPSender as AsyncHttpDriver
 from msrest import Serializer, Deserializer
 
 from .._configuration import TokenApiClientConfiguration
 from .operations_async._bot_sign_in_operations_async import BotSignInOperations
 from .operations_async._user_token_operations_async import UserTokenOperations
 from .. import models
+from ...aiohttp_bf_pipeline import AsyncBfPipeline
 
 
 class TokenApiClient(SDKClientAsync):
@@ -29,12 +33,23 @@ class TokenApiClient(SDKClientAsync):
      client subscription.
     :type credentials: None
     :param str base_url: Service URL
+    :param driver: Optional, the HTTP driver to send requests with.
     """
 
-    def __init__(self, credentials, base_url=None):
+    def __init__(
+        self,
+        credentials,
+        base_url=None,
+        *,
+        driver: Optional[AsyncHttpDriver] = None,
+    ):
         self.config = TokenApiClientConfiguration(credentials, base_url)
         super(TokenApiClient, self).__init__(self.config)
 
+        if driver:
+            self.config.driver = driver
+            self._client.config.pipeline = AsyncBfPipeline(self.config)
+
         client_models = {
             k: v for k, v in models.__dict__.items() if isinstance(v, type)
         }
@@ -0,0 +1,221 @@
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License.
+
+import asyncio
+import json
+import time
+from datetime import datetime, timedelta
+from unittest.mock import Mock, patch
+
+import aiounittest
+import jwt
+from cryptography.hazmat.primitives.asymmetric import rsa
+from jwt.algorithms import RSAAlgorithm
+
+from botframework.connector.auth import (
+    JwtTokenExtractor,
+    ValidatedTokenCache,
+    VerifyOptions,
+)
+from botframework.connector.auth.jwt_token_extractor import _OpenIdMetadata
+
+METADATA_URL = "https://login.test/.well-known/openidconfiguration"
+KEYS_URL = "https://login.test/keys"
+
+
+PRIVATE_KEY = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+
+
+def create_jwk(key_id: str, endorsements=None) -> dict:
+    jwk = json.loads(RSAAlgorithm.to_jwk(PRIVATE_KEY.public_key()))
+    jwk["kid"] = key_id
+    jwk["endorsements"] = endorsements or []
+    return jwk
+
+
+def create_token(key_id: str, issuer: str = "issuer", expires_in: int = 3600) -> str:
+    payload = {"iss": issuer, "aud": "app-id", "exp": int(time.time()) + expires_in}
+    return jwt.encode(payload, PRIVATE_KEY, algorithm="RS256", headers={"kid": key_id})
+
+
+class FakeMetadataEndpoint:
+    def __init__(self, keys):
+        self.keys = keys
+        self.calls = []
+
+    def get(self, url):
+        self.calls.append(url)
+        # Slow enough for concurrent callers to overlap.
+        time.sleep(0.05)
+
+        body = {"jwks_uri": KEYS_URL} if url == METADATA_URL else {"keys": self.keys}
+        response = Mock()
+        response.json.return_value = body
+        return response
+
+
+class FakeMetadataTestCase(aiounittest.AsyncTestCase):
+    def setUp(self):
+        self.endpoint = FakeMetadataEndpoint(
+            [create_jwk("key1", ["msteams"]), create_jwk("key2")]
+        )
+        self.patcher = patch(
+            "botframework.connector.auth.jwt_token_extractor.requests.get",
+            side_effect=self.endpoint.get,
+        )
+        self.patcher.start()
+
+    def tearDown(self):
+        self.patcher.stop()
+
+
+class TestOpenIdMetadata(FakeMetadataTestCase):
+    async def test_concurrent_gets_share_one_refresh(self):
+        metadata = _OpenIdMetadata(METADATA_URL)
+
+        keys = await asyncio.gather(*[metadata.get("key1") for _ in range(10)])
+
+        self.assertEqual([METADATA_URL, KEYS_URL], self.endpoint.calls)
+        self.assertTrue(all(key is keys[0] for key in keys))
+        self.assertEqual(["msteams"], keys[0].endorsements)
+
+    async def test_keys_are_parsed_once(self):
+        metadata = _OpenIdMetadata(METADATA_URL)
+
+        with patch(
+            "botframework.connector.auth.jwt_token_extractor.RSAAlgorithm.from_jwk",
+            wraps=RSAAlgorithm.from_jwk,
+        ) as from_jwk:
+            first = await metadata.get("key2")
+            second = await metadata.get("key2")
+
+        self.assertIs(first, second)
+        self.assertEqual(1, from_jwk.call_count)
+
+    async def test_unknown_key_returns_none(self):
+        metadata = _OpenIdMetadata(METADATA_URL)
+
+        self.assertIsNone(await metadata.get("unknown"))
+        self.assertEqual(2, len(self.endpoint.calls))
+
+    async def test_keys_are_refreshed_in_background_before_expiring(self):
+        metadata = _OpenIdMetadata(METADATA_URL)
+        first = await metadata.get("key1")
+        metadata.last_updated = datetime.now() - timedelta(hours=23, minutes=30)
+
+        # The current keys are served while the refresh runs.
+        self.assertIs(first, await metadata.get("key1"))
+        self.assertEqual(2, len(self.endpoint.calls))
+
+        await metadata._refresh_task  # pylint: disable=protected-access
+
+        self.assertEqual(4, len(self.endpoint.calls))
+        self.assertIsNot(first, await metadata.get("key1"))
+
+    def test_refresh_started_on_a_closed_loop_is_not_awaited(self):
+        metadata = _OpenIdMetadata(METADATA_URL)
+
+        async def start_refresh():
+            metadata._start_refresh()  # pylint: disable=protected-access
+
+        # The loop is closed while its refresh is in progress.
+        loop = asyncio.new_event_loop()
+        loop.run_until_complete(start_refresh())
+        loop.close()
+
+        loop = asyncio.new_event_loop()
+        try:
+            key = loop.run_until_complete(metadata.get("key1"))
+        finally:
+            loop.close()
+
+        self.assertEqual(["msteams"], key.endorsements)
+
+
+class TestValidatedTokenCache(FakeMetadataTestCase):
+    def setUp(self):
+        super().setUp()
+        JwtTokenExtractor.metadataCache.pop(METADATA_URL, None)
+        self.cache_patcher = patch.object(
+            JwtTokenExtractor, "validated_token_cache", ValidatedTokenCache()
+        )
+        self.cache_patcher.start()
+
+    def tearDown(self):
+        self.cache_patcher.stop()
+        JwtTokenExtractor.metadataCache.pop(METADATA_URL, None)
+        super().tearDown()
+
+    @staticmethod
+    def create_extractor() -> JwtTokenExtractor:
+        return JwtTokenExtractor(
+            VerifyOptions(["issuer"], None, 300, False), METADATA_URL, ["RS256"]
+        )
+
+    async def test_validated_token_is_not_decoded_again(self):
+        token = create_token("key1")
+
+        with patch(
+            "botframework.connector.auth.jwt_token_extractor.jwt.decode",
+            wraps=jwt.decode,
+        ) as decode:
+            first = await self.create_extractor().get_identity(
+                "Bearer", token, "msteams"
+            )
+            second = await self.create_extractor().get_identity(
+                "Bearer", token, "msteams"
+            )
+            decode_count = decode.call_count
+
+        self.assertEqual(first.claims, second.claims)
+        self.assertTrue(second.is_authenticated)
+        self.assertEqual(2, decode_count)
+        self.assertEqual(1, JwtTokenExtractor.validated_token_cache.hits)
+        self.assertEqual(1, JwtTokenExtractor.validated_token_cache.misses)
+
+    async def test_endorsements_are_checked_for_cached_tokens(self):
+        token = create_token("key1")
+        await self.create_extractor().get_identity("Bearer", token, "msteams")
+
+        with self.assertRaises(Exception):
+            await self.create_extractor().get_identity("Bearer", token, "webchat")
+        with self.assertRaises(Exception):
+            await self.create_extractor().get_identity(
+                "Bearer", token, "msteams", ["other"]
+            )
+
+    async def test_issuer_is_checked_for_cached_tokens(self):
+        token = create_token("key2")
+        await self.create_extractor().get_identity("Bearer", token, "msteams")
+
+        extractor = JwtTokenExtractor(
+            VerifyOptions(["other-issuer"], None, 300, False), METADATA_URL, ["RS256"]
+        )
+
+        self.assertIsNone(await extractor.get_identity("Bearer", token, "msteams"))
+
+    async def test_expired_tokens_are_not_served(self):
+        cache = JwtTokenExtractor.validated_token_cache
+        token = create_token("key2", expires_in=-1)
+
+        extractor = JwtTokenExtractor(
+            VerifyOptions(["issuer"], None, 300, True), METADATA_URL, ["RS256"]
+        )
+        await extractor.get_identity("Bearer", token, "msteams")
+        await extractor.get_identity("Bearer", token, "msteams")
+
+        self.assertEqual(0, cache.hits)
+        self.assertEqual(0, len(cache))
+
+    def test_cache_is_bounded(self):
+        cache = ValidatedTokenCache(max_items=2)
+        for index in range(3):
+            cache.add(
+                METADATA_URL,
+                f"token{index}",
+                Mock(payload={"exp": time.time() + 60}),
+            )
+
+        self.assertEqual(2, len(cache))
+        self.assertIsNone(cache.get(METADATA_URL, "token0"))
+        self.assertIsNotNone(cache.get(METADATA_URL, "token2"))
@@ -1,77 +1,121 @@
 # Copyright (c) Microsoft Corporation. All rights reserved.
 # Licensed under the MIT License.
 
-from asyncio import Lock, Semaphore
-from typing import List
+from asyncio import Semaphore
+from collections import deque
+from typing import Deque, Union
 
 from botframework.streaming.payloads.assemblers import PayloadStreamAssembler
 
 
 class PayloadStream:
+    """
+    The content of a stream, as its packets are received.
+
+    Read it with :meth:`read`, :meth:`read_until_end`, or iterate over it to process each received
+    chunk without assembling the whole content:
+
+    .. code-block:: python
+
+        async for chunk in stream:
+            file.write(chunk)
+
+    The chunks are memoryviews of the received buffers, so they aren't copied.
+    """
+
     def __init__(self, assembler: PayloadStreamAssembler):
         self._assembler = assembler
-        self._buffer_queue: List[List[int]] = []
-        self._lock = Lock()
+        self._buffer_queue: Deque[memoryview] = deque()
         self._data_available = Semaphore(0)
         self._producer_length = 0  # total length
         self._consumer_position = 0  # read position
-        self._active: List[int] = []
+        self._active: memoryview = memoryview(b"")
         self._active_offset = 0
         self._end = False
 
     def __len__(self):
         return self._producer_length
 
-    def give_buffer(self, buffer: List[int]):
-        self._buffer_queue.append(buffer)
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self) -> memoryview:
+        if not await self._activate():
+            raise StopAsyncIteration
+
+        return self._consume(len(self._active) - self._active_offset)
+
+    def give_buffer(self, buffer: Union[bytes, bytearray]):
+        self._buffer_queue.append(memoryview(buffer))
         self._producer_length += len(buffer)
 
         self._data_available.release()
 
     def done_producing(self):
-        self.give_buffer([])
+        self.give_buffer(b"")
 
-    def write(self, buffer: List[int], offset: int, count: int):
-        buffer_copy = buffer[offset : offset + count]
+    def write(self, buffer: Union[bytes, bytearray], offset: int, count: int):
+        # The caller may reuse its buffer, so the written bytes are copied once.
+        if isinstance(buffer, (bytes, bytearray, memoryview)):
+            buffer = memoryview(buffer)
+        buffer_copy = bytes(buffer[offset : offset + count])
         self.give_buffer(buffer_copy)
 
-    async def read(self, buffer: List[int], offset: int, count: int):
-        if self._end:
+    async def read(self, buffer: bytearray, offset: int, count: int):
+        if not await self._activate():
             return 0
 
+        chunk = self._consume(count)
+        buffer[offset : offset + len(chunk)] = chunk
+
+        return len(chunk)
+
+    async def read_until_end(self):
+        result = bytearray(self._assembler.content_length)
+        current_size = 0
+
+        while not self._end:
+            count = await self.read(
+                result, current_size, self._assembler.content_length
+            )
+            current_size += count
+
+        return result
+
+    async def _activate(self) -> bool:
+        # Waits for the next buffer once the active one is consumed, False at the end of the stream.
+        if self._end:
+            return False
+
         if not self._active:
             await self._data_available.acquire()
-            async with self._lock:
-                self._active = self._buffer_queue.pop(0)
+            self._active = self._buffer_queue.popleft()
 
-        available_count = min(len(self._active) - self._active_offset, count)
+            if not self._active:
+                # done_producing
+                self._end = True
+                return False
+
+        return True
 
-        for index in range(available_count):
-            buffer[offset + index] = self._active[self._active_offset]
-            self._active_offset += 1
+    def _consume(self, count: int) -> memoryview:
+        available_count = min(len(self._active) - self._active_offset, count)
+        chunk = self._active[
+            self._active_offset : self._active_offset + available_count
+        ]
 
+        self._active_offset += available_count
         self._consumer_position += available_count
 
         if self._active_offset >= len(self._active):
-            self._active = []
+            self._active = memoryview(b"")
             self._active_offset = 0
 
         if (
             self._assembler
+            and self._assembler.content_length is not None
             and self._consumer_position >= self._assembler.content_length
         ):
             self._end = True
 
-        return available_count
-
-    async def read_until_end(self):
-        result = [None] * self._assembler.content_length
-        current_size = 0
-
-        while not self._end:
-            count = await self.read(
-                result, current_size, self._assembler.content_length
-            )
-            current_size += count
-
-        return result
+        return chunk
@@ -4,7 +4,7 @@
 import traceback
 
 from asyncio import iscoroutinefunction, isfuture
-from typing import Callable, List
+from typing import Callable
 
 import botframework.streaming as streaming
 from botframework.streaming.payloads import HeaderSerializer
@@ -18,17 +18,13 @@ from botframework.streaming.transport import (
 
 class PayloadReceiver:
     def __init__(self):
-        self._get_stream: Callable[[Header], List[int]] = None
-        self._receive_action: Callable[[Header, List[int], int], None] = None
+        self._get_stream: Callable[[Header], bytearray] = None
+        self._receive_action: Callable[[Header, bytearray, int], None] = None
         self._receiver: TransportReceiverBase = None
         self._is_disconnecting = False
 
-        self._receive_header_buffer: List[int] = [
-            None
-        ] * TransportConstants.MAX_HEADER_LENGTH
-        self._receive_content_buffer: List[int] = [
-            None
-        ] * TransportConstants.MAX_PAYLOAD_LENGTH
+        self._receive_header_buffer = bytearray(TransportConstants.MAX_HEADER_LENGTH)
+        self._receive_content_buffer = bytearray(TransportConstants.MAX_PAYLOAD_LENGTH)
 
         self.disconnected: Callable[[object, DisconnectedEventArgs], None] = None
 
@@ -48,8 +44,8 @@ class PayloadReceiver:
 
     def subscribe(
         self,
-        get_stream: Callable[[Header], List[int]],
-        receive_action: Callable[[Header, List[int]], int],
+        get_stream: Callable[[Header], bytearray],
+        receive_action: Callable[[Header, bytearray, int], None],
     ):
         self._get_stream = get_stream
         self._receive_action = receive_action
@@ -119,8 +115,9 @@ class PayloadReceiver:
                 # read the payload
                 content_stream = self._get_stream(header)
 
+                # stream payloads are handed to the stream, so they get their own buffer
                 buffer = (
-                    [None] * header.payload_length
+                    bytearray(header.payload_length)
                     if PayloadTypes.is_stream(header)
                     else self._receive_content_buffer
                 )
@@ -143,10 +140,10 @@ class PayloadReceiver:
 
                         if content_stream is not None:
                             # write chunks to the content_stream if it's not a stream type
-                            # TODO: this has to be improved in custom buffer class (validate buffer ended)
                             if not PayloadTypes.is_stream(header):
-                                for index in range(offset, offset + length):
-                                    content_stream[index] = buffer[index]
+                                content_stream[offset : offset + length] = memoryview(
+                                    buffer
+                                )[offset : offset + length]
 
                         offset += length
 
@@ -2,7 +2,7 @@
 # Licensed under the MIT License.
 
 from asyncio import Event, ensure_future, iscoroutinefunction, isfuture
-from typing import Awaitable, Callable, List
+from typing import Awaitable, Callable
 
 from botframework.streaming.transport import (
     DisconnectedEventArgs,
@@ -15,21 +15,37 @@ from botframework.streaming.payloads.models import Header
 from .send_queue import SendQueue
 from .send_packet import SendPacket
 
+_MAX_PACKET_LENGTH = (
+    TransportConstants.MAX_HEADER_LENGTH + TransportConstants.MAX_PAYLOAD_LENGTH
+)
+
 
 # TODO: consider interface this class
 class PayloadSender:
-    def __init__(self):
+    """
+    Sends payloads over a transport.
+
+    Packets of different payloads are interleaved, one packet per payload at a time. The header
+    and the content of a packet are sent separately, as receivers may read one frame per header
+    or content. Producers can await
+    :meth:`wait_for_capacity` to hold back new packets while max_bytes_in_flight bytes are
+    queued and not sent yet.
+
+    Once a connected sender disconnects, the queued packets and the packets sent afterwards are
+    dropped: their failed_callback runs instead of their sent_callback, and their bytes no longer
+    count as in flight.
+    """
+
+    def __init__(self, max_bytes_in_flight: int = 16 * _MAX_PACKET_LENGTH):
         self._connected_event = Event()
         self._sender: TransportSenderBase = None
         self._is_disconnecting: bool = False
-        self._send_header_buffer: List[int] = [
-            None
-        ] * TransportConstants.MAX_HEADER_LENGTH
-        self._send_content_buffer: List[int] = [
-            None
-        ] * TransportConstants.MAX_PAYLOAD_LENGTH
+        self._is_disconnected: bool = False
 
         self._send_queue = SendQueue(action=self._write_packet)
+        self.max_bytes_in_flight = max_bytes_in_flight
+        self._bytes_in_flight = 0
+        self._capacity_available = Event()
 
         self.disconnected: Callable[[object, DisconnectedEventArgs], None] = None
 
@@ -37,11 +53,22 @@ class PayloadSender:
     def is_connected(self) -> bool:
         return self._sender is not None
 
+    @property
+    def queue_depth(self) -> int:
+        """The number of packets waiting to be sent."""
+        return len(self._send_queue)
+
+    @property
+    def bytes_in_flight(self) -> int:
+        """The number of bytes of the packets that are queued or being sent."""
+        return self._bytes_in_flight
+
     def connect(self, sender: TransportSenderBase):
         if self._sender:
             raise RuntimeError(f"{self.__class__.__name__} instance already connected.")
 
         self._sender = sender
+        self._is_disconnected = False
         self._connected_event.set()
 
     # TODO: check 'stream' for payload
@@ -51,15 +78,35 @@ class PayloadSender:
         payload: object,
         is_length_known: bool,
         sent_callback: Callable[[Header], Awaitable],
+        failed_callback: Callable[[Header], Awaitable] = None,
     ):
         packet = SendPacket(
             header=header,
             payload=payload,
             is_length_known=is_length_known,
             sent_callback=sent_callback,
+            failed_callback=failed_callback,
         )
 
-        self._send_queue.post(packet)
+        if self._is_disconnected:
+            self._fail_packet(packet)
+            return
+
+        self._bytes_in_flight += self._packet_length(packet)
+        self._send_queue.post(packet, header.id)
+
+    async def wait_for_capacity(self, payload_length: int):
+        """
+        Waits until a packet with the given payload length fits in max_bytes_in_flight.
+        A packet always fits when nothing is in flight.
+        """
+        length = TransportConstants.MAX_HEADER_LENGTH + payload_length
+        while (
+            self._bytes_in_flight
+            and self._bytes_in_flight + length > self.max_bytes_in_flight
+        ):
+            self._capacity_available.clear()
+            await self._capacity_available.wait()
 
     async def disconnect(self, event_args: DisconnectedEventArgs = None):
         did_disconnect = False
@@ -78,7 +125,14 @@ class PayloadSender:
                 self._sender = None
 
                 if did_disconnect:
+                    self._is_disconnected = True
                     self._connected_event.clear()
+
+                    # Nothing will send the queued packets anymore
+                    for packet in self._send_queue.clear():
+                        self._release_packet(packet)
+                        self._fail_packet(packet)
+
                     if callable(self.disconnected):
                         # pylint: disable=not-callable
                         if iscoroutinefunction(self.disconnected) or isfuture(
@@ -95,59 +149,47 @@ class PayloadSender:
                 self._is_disconnecting = False
 
     async def _write_packet(self, packet: SendPacket):
-        await self._connected_event.wait()
-
+        sent = False
         try:
+            if self._is_disconnected:
+                return
+
+            await self._connected_event.wait()
+
             # determine if we know the payload length and end
             if not packet.is_length_known:
                 count = packet.header.payload_length
                 packet.header.end = count == 0
 
-            header_length = HeaderSerializer.serialize(
-                packet.header, self._send_header_buffer, 0
-            )
+            # Each packet gets its own header buffer, as transports may still hold on to it once
+            # send() returns.
+            header_buffer = bytearray(TransportConstants.MAX_HEADER_LENGTH)
+            header_length = HeaderSerializer.serialize(packet.header, header_buffer, 0)
 
-            # Send: Packet Header
-            length = await self._sender.send(self._send_header_buffer, 0, header_length)
-            if not length:
+            # Send: Packet header
+            if not await self._sender.send(header_buffer, 0, header_length):
                 # TODO: make custom exception
                 raise Exception("TransportDisconnectedException")
 
-            offset = 0
-
-            # Send content in chunks
-            if packet.header.payload_length and packet.payload:
-                # If we already read the buffer, send that
-                # If we did not, read from the stream until we've sent that amount
-                if not packet.is_length_known:
-                    # Send: Packet content
-                    length = await self._sender.send(
-                        self._send_content_buffer, 0, packet.header.payload_length
-                    )
-                    if length == 0:
-                        # TODO: make custom exception
-                        raise Exception("TransportDisconnectedException")
-                else:
-                    while offset < packet.header.payload_length:
-                        count = min(
-                            packet.header.payload_length - offset,
-                            TransportConstants.MAX_PAYLOAD_LENGTH,
-                        )
-
-                        # copy the stream to the buffer
-                        # TODO: this has to be improved in custom buffer class (validate buffer ended)
-                        for index in range(count):
-                            self._send_content_buffer[index] = packet.payload[index]
-
-                        # Send: Packet content
-                        length = await self._sender.send(
-                            self._send_content_buffer, 0, count
-                        )
-                        if length == 0:
-                            # TODO: make custom exception
-                            raise Exception("TransportDisconnectedException")
-
-                        offset += count
+            payload_length = packet.header.payload_length if packet.payload else 0
+            if payload_length:
+                if self._is_disconnected:
+                    # Disconnected while the header was sent
+                    return
+
+                # The content is sent from its own buffer, without copying it.
+                payload = (
+                    packet.payload
+                    if isinstance(packet.payload, (bytes, bytearray, memoryview))
+                    else bytes(packet.payload[:payload_length])
+                )
+
+                # Send: Packet content
+                if not await self._sender.send(payload, 0, payload_length):
+                    # TODO: make custom exception
+                    raise Exception("TransportDisconnectedException")
+
+            sent = True
 
             if packet.sent_callback:
                 # TODO: should this really run in the background?
@@ -155,3 +197,22 @@ class PayloadSender:
         except Exception as exception:
             disconnected_args = DisconnectedEventArgs(reason=str(exception))
             await self.disconnect(disconnected_args)
+        finally:
+            self._release_packet(packet)
+            if not sent:
+                self._fail_packet(packet)
+
+    def _release_packet(self, packet: SendPacket):
+        self._bytes_in_flight -= self._packet_length(packet)
+        self._capacity_available.set()
+
+    @staticmethod
+    def _fail_packet(packet: SendPacket):
+        if packet.failed_callback:
+            ensure_future(packet.failed_callback(packet.header))
+
+    @staticmethod
+    def _packet_length(packet: SendPacket) -> int:
+        return TransportConstants.MAX_HEADER_LENGTH + (
+            packet.header.payload_length or 0
+        )
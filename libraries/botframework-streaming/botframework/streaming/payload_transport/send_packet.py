@@ -13,9 +13,11 @@ class SendPacket:
         header: Header,
         payload: object,
         is_length_known: bool,
-        sent_callback: Callable[[Header], Awaitable]
+        sent_callback: Callable[[Header], Awaitable],
+        failed_callback: Callable[[Header], Awaitable] = None
     ):
         self.header = header
         self.payload = payload
         self.is_length_known = is_length_known
         self.sent_callback = sent_callback
+        self.failed_callback = failed_callback
@@ -3,37 +3,83 @@
 
 import traceback
 
-from asyncio import Queue, ensure_future
-from typing import Awaitable, Callable
+from asyncio import Event, ensure_future
+from collections import deque
+from typing import Awaitable, Callable, Deque, Dict, Hashable, List
 
 
 class SendQueue:
+    """
+    Runs an action on the posted items, one at a time.
+
+    Items posted with the same key run in order. Items with different keys are taken
+    round-robin, so a key with many items doesn't hold back the others.
+    """
+
     def __init__(self, action: Callable[[object], Awaitable], timeout: int = 30):
         self._action = action
 
-        self._queue = Queue()
+        self._queues: Dict[Hashable, Deque[object]] = {}
+        self._ready_keys: Deque[Hashable] = deque()
+        self._item_available = Event()
+        self._length = 0
         self._timeout_seconds = timeout
 
         # TODO: this have to be abstracted so can remove asyncio dependency
         ensure_future(self._process())
 
-    def post(self, item: object):
-        self._post_internal(item)
+    def __len__(self) -> int:
+        return self._length
+
+    def post(self, item: object, key: Hashable = None):
+        self._post_internal(item, key)
+
+    def clear(self) -> List[object]:
+        """Removes the items that are waiting to run and returns them."""
+        items = [item for queue in self._queues.values() for item in queue]
+
+        self._queues.clear()
+        self._ready_keys.clear()
+        self._length = 0
+        return items
 
-    def _post_internal(self, item: object):
-        self._queue.put_nowait(item)
+    def _post_internal(self, item: object, key: Hashable):
+        queue = self._queues.get(key)
+        if queue is None:
+            queue = self._queues[key] = deque()
+            self._ready_keys.append(key)
+
+        queue.append(item)
+        self._length += 1
+        self._item_available.set()
+
+    def _next_item(self) -> object:
+        key = self._ready_keys.popleft()
+        queue = self._queues[key]
+        item = queue.popleft()
+
+        if queue:
+            self._ready_keys.append(key)
+        else:
+            del self._queues[key]
+
+        self._length -= 1
+        return item
 
     async def _process(self):
         while True:
             try:
                 while True:
-                    item = await self._queue.get()
+                    if not self._ready_keys:
+                        self._item_available.clear()
+                        await self._item_available.wait()
+                        continue
+
+                    item = self._next_item()
                     try:
                         await self._action(item)
                     except Exception:
                         traceback.print_exc()
-                    finally:
-                        self._queue.task_done()
             except Exception:
                 # AppInsights.TrackException(e)
                 traceback.print_exc()
@@ -5,8 +5,6 @@
 from abc import ABC
 from uuid import UUID
 
-from typing import List
-
 from botframework.streaming.payloads.models import Header
 
 
@@ -18,13 +16,13 @@ class Assembler(ABC):
     def close(self):
         raise NotImplementedError()
 
-    def create_stream_from_payload(self) -> List[int]:
+    def create_stream_from_payload(self) -> bytearray:
         raise NotImplementedError()
 
-    def get_payload_as_stream(self) -> List[int]:
+    def get_payload_as_stream(self) -> bytearray:
         raise NotImplementedError()
 
     def on_receive(
-        self, header: Header, stream: List[int], content_length: int
-    ) -> List[int]:
+        self, header: Header, stream: bytearray, content_length: int
+    ) -> bytearray:
         raise NotImplementedError()
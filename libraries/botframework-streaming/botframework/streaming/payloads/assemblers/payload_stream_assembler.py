@@ -2,7 +2,6 @@
 # Licensed under the MIT License.
 
 from uuid import UUID
-from typing import List
 
 import botframework.streaming as streaming
 import botframework.streaming.payloads as payloads
@@ -37,7 +36,9 @@ class PayloadStreamAssembler(Assembler):
 
         return self._stream
 
-    def on_receive(self, header: Header, stream: List[int], content_length: int):
+    def on_receive(
+        self, header: Header, stream: "streaming.PayloadStream", content_length: int
+    ):
         if header.end:
             self.end = True
             self._stream.done_producing()
@@ -3,7 +3,7 @@
 
 import asyncio
 from uuid import UUID
-from typing import Awaitable, Callable, List
+from typing import Awaitable, Callable
 
 import botframework.streaming as streaming
 import botframework.streaming.payloads as payloads
@@ -31,18 +31,18 @@ class ReceiveResponseAssembler(Assembler):
         self._on_completed = on_completed
         self.identifier = header.id
         self._length = header.payload_length if header.end else None
-        self._stream: List[int] = None
+        self._stream: bytearray = None
 
-    def create_stream_from_payload(self) -> List[int]:
-        return [None] * (self._length or 0)
+    def create_stream_from_payload(self) -> bytearray:
+        return bytearray(self._length or 0)
 
-    def get_payload_as_stream(self) -> List[int]:
+    def get_payload_as_stream(self) -> bytearray:
         if self._stream is None:
             self._stream = self.create_stream_from_payload()
 
         return self._stream
 
-    def on_receive(self, header: Header, stream: List[int], content_length: int):
+    def on_receive(self, header: Header, stream: bytearray, content_length: int):
         if header.end:
             self.end = header.end
 
@@ -54,7 +54,7 @@ class ReceiveResponseAssembler(Assembler):
     def close(self):
         self._stream_manager.close_stream(self.identifier)
 
-    async def process_response(self, stream: List[int]):
+    async def process_response(self, stream: bytearray):
         response_payload = ResponsePayload().from_json(bytes(stream).decode("utf8"))
 
         response = streaming.ReceiveResponse(
@@ -5,7 +5,7 @@ import json
 from asyncio import Future
 from abc import ABC, abstractmethod
 from uuid import UUID
-from typing import List
+from typing import List, Union
 
 from botframework.streaming.transport import TransportConstants
 from botframework.streaming.payload_transport import PayloadSender
@@ -23,7 +23,7 @@ class PayloadDisassembler(ABC):
         self.identifier = identifier
         self._task_completion_source = Future()
 
-        self._stream: List[int] = None
+        self._stream: memoryview = None
         self._stream_length: int = None
         self._send_offset: int = None
         self._is_end: bool = False
@@ -34,11 +34,14 @@ class PayloadDisassembler(ABC):
     def type(self) -> str:
         return self._type
 
-    async def get_stream(self) -> List[int]:
+    async def get_stream(self) -> Union[bytes, bytearray]:
         raise NotImplementedError()
 
     async def disassemble(self):
-        self._stream = await self.get_stream()
+        stream = await self.get_stream()
+        if not isinstance(stream, (bytes, bytearray, memoryview)):
+            stream = bytes(stream)
+        self._stream = memoryview(stream)
         self._stream_length = len(self._stream)
         self._send_offset = 0
 
@@ -71,40 +74,63 @@ class PayloadDisassembler(ABC):
         return description
 
     @staticmethod
-    def serialize(item: Serializable, stream: List[int], length: List[int]):
+    def serialize(item: Serializable, stream: bytearray, length: List[int]):
         encoded_json = item.to_json().encode()
-        stream.clear()
-        stream.extend(list(encoded_json))
+        stream[:] = encoded_json
 
         length.clear()
         length.append(len(stream))
 
     async def _send(self):
-        # determine if we know the length we can send and whether we can tell if this is the end
-        is_length_known = self._is_end
-
-        header = Header(type=self.type, id=self.identifier, end=self._is_end)
-
-        header.payload_length = 0
-
-        if self._stream_length is not None:
-            # determine how many bytes we can send and if we are at the end
-            header.payload_length = min(
-                self._stream_length - self._send_offset,
-                TransportConstants.MAX_PAYLOAD_LENGTH,
+        # Queue the packets as fast as the sender takes them; it interleaves them with the
+        # packets of the other payloads.
+        while True:
+            # determine if we know the length we can send and whether we can tell if this is the end
+            is_length_known = self._is_end
+
+            header = Header(type=self.type, id=self.identifier, end=self._is_end)
+
+            header.payload_length = 0
+
+            if self._stream_length is not None:
+                # determine how many bytes we can send and if we are at the end
+                header.payload_length = min(
+                    self._stream_length - self._send_offset,
+                    TransportConstants.MAX_PAYLOAD_LENGTH,
+                )
+                header.end = (
+                    self._send_offset + header.payload_length >= self._stream_length
+                )
+                is_length_known = True
+
+            await self.sender.wait_for_capacity(header.payload_length)
+
+            # a packet was dropped, the rest of the stream can't be delivered
+            if self._task_completion_source.done():
+                return
+
+            # each packet carries its own slice of the stream
+            payload = self._stream[
+                self._send_offset : self._send_offset + header.payload_length
+            ]
+            self.sender.send_payload(
+                header,
+                payload,
+                is_length_known,
+                self._on_send,
+                failed_callback=self._on_send_failed,
             )
-            header.end = (
-                self._send_offset + header.payload_length >= self._stream_length
-            )
-            is_length_known = True
+            self._send_offset += header.payload_length
 
-        self.sender.send_payload(header, self._stream, is_length_known, self._on_send)
+            if header.end or not is_length_known:
+                return
 
     async def _on_send(self, header: Header):
-        self._send_offset += header.payload_length
-        self._is_end = header.end
-
-        if self._is_end:
-            self._task_completion_source.set_result(True)
-        else:
-            await self._send()
+        if header.end:
+            self._is_end = True
+            if not self._task_completion_source.done():
+                self._task_completion_source.set_result(True)
+
+    async def _on_send_failed(self, header: Header):  # pylint: disable=unused-argument
+        if not self._task_completion_source.done():
+            self._task_completion_source.set_result(False)
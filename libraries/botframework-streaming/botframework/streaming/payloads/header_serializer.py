@@ -1,8 +1,9 @@
 # Copyright (c) Microsoft Corporation. All rights reserved.
 # Licensed under the MIT License.
 
+from struct import Struct
 from uuid import UUID
-from typing import List
+from typing import List, Union
 
 from botframework.streaming.transport import TransportConstants
 
@@ -10,8 +11,14 @@ from .models import Header
 
 _CHAR_TO_BINARY_INT = {val.decode(): list(val)[0] for val in [b".", b"\n", b"1", b"0"]}
 
+# type "." length "." id "." end terminator
+_HEADER_STRUCT = Struct("cc6sc36sccc")
+_DELIMITER = b"."
+_TERMINATOR = b"\n"
+_END = b"1"
+_NOT_END = b"0"
+
 
-# TODO: consider abstracting the binary int list logic into a class for easier handling
 class HeaderSerializer:
     DELIMITER = _CHAR_TO_BINARY_INT["."]
     TERMINATOR = _CHAR_TO_BINARY_INT["\n"]
@@ -31,139 +38,83 @@ class HeaderSerializer:
     @staticmethod
     def serialize(
         header: Header,
-        buffer: List[int],
-        offset: int,  # pylint: disable=unused-argument
+        buffer: Union[bytearray, memoryview, List[int]],
+        offset: int,
     ) -> int:
-        # write type
-        buffer[HeaderSerializer.TYPE_OFFSET] = HeaderSerializer._char_to_binary_int(
-            header.type
-        )
-        buffer[HeaderSerializer.TYPE_DELIMITER_OFFSET] = HeaderSerializer.DELIMITER
-
-        # write length
-        length_binary_array: List[int] = list(
-            HeaderSerializer._int_to_formatted_encoded_str(
-                header.payload_length, "{:06d}"
-            )
-        )
-        HeaderSerializer._write_in_buffer(
-            length_binary_array, buffer, HeaderSerializer.LENGTH_OFFSET
-        )
-        buffer[HeaderSerializer.LENGTH_DELIMETER_OFFSET] = HeaderSerializer.DELIMITER
+        try:
+            type_byte = header.type.encode("ascii")
+        except UnicodeEncodeError:
+            raise ValueError("Char to cast should be in the ASCII domain")
+        if len(type_byte) != 1:
+            raise ValueError("Char to cast should be a str of exactly length 1")
 
-        # write id
-        id_binary_array: List[int] = list(
-            HeaderSerializer._uuid_to_numeric_encoded_str(header.id)
-        )
-        HeaderSerializer._write_in_buffer(
-            id_binary_array, buffer, HeaderSerializer.ID_OFFSET
+        values = (
+            type_byte,
+            _DELIMITER,
+            b"%06d" % header.payload_length,
+            _DELIMITER,
+            str(header.id).encode("ascii"),
+            _DELIMITER,
+            _END if header.end else _NOT_END,
+            _TERMINATOR,
         )
-        buffer[HeaderSerializer.ID_DELIMETER_OFFSET] = HeaderSerializer.DELIMITER
 
-        # write terminator
-        buffer[HeaderSerializer.END_OFFSET] = (
-            HeaderSerializer.END if header.end else HeaderSerializer.NOT_END
-        )
-        buffer[HeaderSerializer.TERMINATOR_OFFSET] = HeaderSerializer.TERMINATOR
+        if isinstance(buffer, (bytearray, memoryview)):
+            _HEADER_STRUCT.pack_into(buffer, offset, *values)
+        else:
+            buffer[offset : offset + _HEADER_STRUCT.size] = _HEADER_STRUCT.pack(*values)
 
         return TransportConstants.MAX_HEADER_LENGTH
 
     @staticmethod
     def deserialize(
-        buffer: List[int], offset: int, count: int  # pylint: disable=unused-argument
+        buffer: Union[bytes, bytearray, memoryview, List[int]], offset: int, count: int
     ) -> Header:
         if count != TransportConstants.MAX_HEADER_LENGTH:
             raise ValueError("Cannot deserialize header, incorrect length")
 
-        header = Header(
-            type=HeaderSerializer._binary_int_to_char(
-                buffer[HeaderSerializer.TYPE_OFFSET]
-            )
-        )
+        if not isinstance(buffer, (bytes, bytearray, memoryview)):
+            buffer = bytes(buffer[offset : offset + count])
+            offset = 0
 
-        if buffer[HeaderSerializer.TYPE_DELIMITER_OFFSET] != HeaderSerializer.DELIMITER:
-            raise ValueError("Header type delimeter is malformed")
+        (
+            type_byte,
+            type_delimiter,
+            length_bytes,
+            length_delimiter,
+            id_bytes,
+            id_delimiter,
+            end_byte,
+            terminator,
+        ) = _HEADER_STRUCT.unpack_from(buffer, offset)
 
-        length_str = HeaderSerializer._binary_array_to_str(
-            buffer[
-                HeaderSerializer.LENGTH_OFFSET : HeaderSerializer.LENGTH_OFFSET
-                + HeaderSerializer.LENGTH_LENGTH
-            ]
-        )
+        header = Header(type=type_byte.decode("ascii"))
+
+        if type_delimiter != _DELIMITER:
+            raise ValueError("Header type delimeter is malformed")
 
         try:
-            length = int(length_str)
+            header.payload_length = int(length_bytes.decode("ascii"))
         except Exception:
             raise ValueError("Header length is malformed")
 
-        header.payload_length = length
-
-        if (
-            buffer[HeaderSerializer.LENGTH_DELIMETER_OFFSET]
-            != HeaderSerializer.DELIMITER
-        ):
+        if length_delimiter != _DELIMITER:
             raise ValueError("Header length delimeter is malformed")
 
-        identifier_str = HeaderSerializer._binary_array_to_str(
-            buffer[
-                HeaderSerializer.ID_OFFSET : HeaderSerializer.ID_OFFSET
-                + HeaderSerializer.ID_LENGTH
-            ]
-        )
-
         try:
-            identifier = UUID(identifier_str)
+            header.id = UUID(id_bytes.decode("ascii"))
         except Exception:
             raise ValueError("Header id is malformed")
 
-        header.id = identifier
-
-        if buffer[HeaderSerializer.ID_DELIMETER_OFFSET] != HeaderSerializer.DELIMITER:
+        if id_delimiter != _DELIMITER:
             raise ValueError("Header id delimeter is malformed")
 
-        if buffer[HeaderSerializer.END_OFFSET] not in [
-            HeaderSerializer.END,
-            HeaderSerializer.NOT_END,
-        ]:
+        if end_byte not in (_END, _NOT_END):
             raise ValueError("Header end is malformed")
 
-        header.end = buffer[HeaderSerializer.END_OFFSET] == HeaderSerializer.END
+        header.end = end_byte == _END
 
-        if buffer[HeaderSerializer.TERMINATOR_OFFSET] != HeaderSerializer.TERMINATOR:
+        if terminator != _TERMINATOR:
             raise ValueError("Header terminator is malformed")
 
         return header
-
-    @staticmethod
-    def _char_to_binary_int(char: str) -> int:
-        if len(char) != 1:
-            raise ValueError("Char to cast should be a str of exactly length 1")
-
-        unicode_list = list(char.encode())
-
-        if len(unicode_list) != 1:
-            raise ValueError("Char to cast should be in the ASCII domain")
-
-        return unicode_list[0]
-
-    @staticmethod
-    def _int_to_formatted_encoded_str(value: int, str_format: str) -> bytes:
-        return str_format.format(value).encode("ascii")
-
-    @staticmethod
-    def _uuid_to_numeric_encoded_str(value: UUID) -> bytes:
-        return str(value).encode("ascii")
-
-    @staticmethod
-    def _binary_int_to_char(binary_int: int) -> str:
-        return bytes([binary_int]).decode("ascii")
-
-    @staticmethod
-    def _binary_array_to_str(binary_array: List[int]) -> str:
-        return bytes(binary_array).decode("ascii")
-
-    @staticmethod
-    def _write_in_buffer(data: List[int], buffer: List[int], insert_index: int):
-        for byte_int in data:
-            buffer[insert_index] = byte_int
-            insert_index += 1
@@ -28,8 +28,8 @@ class PayloadAssemblerManager:
 
     def get_payload_stream(
         self, header: Header
-    ) -> Union[List[int], "streaming.PayloadStream"]:
-        # TODO: The return value SHOULDN'T be a union, we should interface List[int] into a BFStream class
+    ) -> Union[bytearray, "streaming.PayloadStream"]:
+        # TODO: The return value SHOULDN'T be a union, we should interface bytearray into a BFStream class
         if self._is_stream_payload(header):
             return self._stream_manager.get_payload_stream(header)
         if not self._active_assemblers.get(header.id):
@@ -42,7 +42,10 @@ class PayloadAssemblerManager:
         return None
 
     def on_receive(
-        self, header: Header, content_stream: List[int], content_length: int
+        self,
+        header: Header,
+        content_stream: Union[bytearray, "streaming.PayloadStream"],
+        content_length: int,
     ):
         if self._is_stream_payload(header):
             self._stream_manager.on_receive(header, content_stream, content_length)
@@ -2,7 +2,7 @@
 # Licensed under the MIT License.
 
 from uuid import UUID
-from typing import Callable, Dict, List
+from typing import Callable, Dict
 
 from botframework.streaming.payloads.assemblers import PayloadStreamAssembler
 from botframework.streaming.payloads.models import Header
@@ -28,7 +28,10 @@ class StreamManager:
         return assembler.get_payload_as_stream()
 
     def on_receive(
-        self, header: Header, content_stream: List[int], content_length: int
+        self,
+        header: Header,
+        content_stream: "streaming.PayloadStream",
+        content_length: int,
     ):
         assembler = self._active_assemblers.get(header.id)
 
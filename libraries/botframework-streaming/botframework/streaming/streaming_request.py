@@ -75,7 +75,7 @@ class StreamingRequest:
 
             body = body.encode("ascii")
 
-        self.add_stream(list(body))
+        self.add_stream(body)
 
     def add_stream(self, content: object, stream_id: UUID = None):
         if not content:
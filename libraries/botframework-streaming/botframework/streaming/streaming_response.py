@@ -39,7 +39,7 @@ class StreamingResponse:
         elif isinstance(body, Model):
             body = json.dumps(body.as_dict())
 
-        self.add_stream(list(body.encode()))
+        self.add_stream(body.encode())
 
     @staticmethod
     def create_response(status_code: int, body: object) -> "StreamingResponse":
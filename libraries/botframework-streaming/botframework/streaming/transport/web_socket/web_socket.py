@@ -2,7 +2,7 @@
 # Licensed under the MIT License.
 
 from abc import ABC
-from typing import List, Any
+from typing import Any
 
 from .web_socket_close_status import WebSocketCloseStatus
 from .web_socket_state import WebSocketState
@@ -10,7 +10,7 @@ from .web_socket_message_type import WebSocketMessageType
 
 
 class WebSocketMessage:
-    def __init__(self, *, message_type: WebSocketMessageType, data: List[int]):
+    def __init__(self, *, message_type: WebSocketMessageType, data: bytes):
         self.message_type = message_type
         self.data = data
 
@@ -2,7 +2,7 @@
 # Licensed under the MIT License.
 
 import traceback
-from typing import List
+from typing import Union
 
 from botframework.streaming.transport import TransportReceiverBase, TransportSenderBase
 
@@ -15,6 +15,7 @@ from .web_socket_state import WebSocketState
 class WebSocketTransport(TransportReceiverBase, TransportSenderBase):
     def __init__(self, web_socket: WebSocket):
         self._socket = web_socket
+        self._unread = memoryview(b"")
 
     @property
     def is_connected(self):
@@ -43,16 +44,21 @@ class WebSocketTransport(TransportReceiverBase, TransportSenderBase):
     # TODO: considering to create a BFTransportBuffer class to abstract the logic of binary buffers adapting to
     #  current interfaces
     async def receive(
-        self, buffer: List[int], offset: int = 0, count: int = None
+        self, buffer: bytearray, offset: int = 0, count: int = None
     ) -> int:
         try:
             if self._socket:
+                # A message can hold more than one read, e.g. a packet header and its content,
+                # so what isn't read yet is kept for the next call.
+                if self._unread:
+                    return self._read_unread(buffer, offset, count)
+
                 result = await self._socket.receive()
-                buffer_index = offset
-                result_length = count if count is not None else len(result.data)
-                for result_index in range(result_length):
-                    buffer[buffer_index] = result.data[result_index]
-                    buffer_index += 1
+                data = result.data or b""
+                if not isinstance(data, (bytes, bytearray, memoryview)):
+                    data = bytes(data)
+                self._unread = memoryview(data)
+                result_length = self._read_unread(buffer, offset, count)
                 if result.message_type == WebSocketMessageType.CLOSE:
                     await self._socket.close(
                         WebSocketCloseStatus.NORMAL_CLOSURE, "Socket closed"
@@ -70,15 +76,22 @@ class WebSocketTransport(TransportReceiverBase, TransportSenderBase):
             raise error
 
     # TODO: might need to remove offset and count if no segmentation possible (or put them in BFTransportBuffer)
-    async def send(self, buffer: List[int], offset: int = 0, count: int = None) -> int:
+    async def send(
+        self,
+        buffer: Union[bytes, bytearray, memoryview],
+        offset: int = 0,
+        count: int = None,
+    ) -> int:
         try:
             if self._socket:
+                if count is None:
+                    count = len(buffer) - offset
                 await self._socket.send(
-                    buffer[offset:count] if count is not None else buffer,
+                    memoryview(buffer)[offset : offset + count],
                     WebSocketMessageType.BINARY,
                     True,
                 )
-                return count or len(buffer)
+                return count
         except Exception as error:
             # Exceptions of the three types below will also have set the socket's state to closed, which fires an
             # event consumers of this class are subscribed to and have handling around. Any other exception needs to
@@ -87,3 +100,11 @@ class WebSocketTransport(TransportReceiverBase, TransportSenderBase):
             raise error
 
         return 0
+
+    def _read_unread(self, buffer: bytearray, offset: int, count: int) -> int:
+        result_length = (
+            len(self._unread) if count is None else min(count, len(self._unread))
+        )
+        buffer[offset : offset + result_length] = self._unread[:result_length]
+        self._unread = self._unread[result_length:]
+        return result_length
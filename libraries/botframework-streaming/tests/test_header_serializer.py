@@ -134,3 +134,28 @@ class TestHeaderSerializer(TestCase):
 
         with pytest.raises(ValueError):
             HeaderSerializer.deserialize(buffer, 0, len(buffer))
+
+    def test_serializes_into_bytearray_at_offset(self):
+        header = Header()
+        header.type = PayloadTypes.STREAM
+        header.payload_length = 4096
+        header.id = uuid4()
+        header.end = False
+
+        buffer = bytearray(b"x" * 60)
+
+        length = HeaderSerializer.serialize(header, buffer, 10)
+
+        self.assertEqual(TransportConstants.MAX_HEADER_LENGTH, length)
+        self.assertEqual(b"x" * 10, buffer[:10])
+        self.assertEqual(
+            f"S.004096.{str(header.id)}.0\n",
+            buffer[10 : 10 + length].decode("ascii"),
+        )
+
+        result = HeaderSerializer.deserialize(memoryview(buffer), 10, length)
+
+        self.assertEqual(header.type, result.type)
+        self.assertEqual(header.payload_length, result.payload_length)
+        self.assertEqual(header.id, result.id)
+        self.assertFalse(result.end)
@@ -1,6 +1,8 @@
 from unittest import TestCase
 from uuid import UUID, uuid4
 
+import aiounittest
+
 from botframework.streaming.payloads import StreamManager
 from botframework.streaming.payloads.assemblers import PayloadStreamAssembler
 from botframework.streaming.payloads.models import Header
@@ -55,3 +57,41 @@ class TestPayloadAssembler(TestCase):
         assembler.close()
 
         self.assertFalse(assembler.end)
+
+
+class TestPayloadStream(aiounittest.AsyncTestCase):
+    async def test_read_until_end_joins_buffers(self):
+        assembler = PayloadStreamAssembler(StreamManager(), uuid4(), length=6)
+        stream = assembler.get_payload_as_stream()
+
+        stream.give_buffer(bytearray(b"abc"))
+        stream.write(b"xxdefxx", 2, 3)
+        stream.done_producing()
+
+        self.assertEqual(b"abcdef", bytes(await stream.read_until_end()))
+
+    async def test_read_splits_buffers(self):
+        assembler = PayloadStreamAssembler(StreamManager(), uuid4(), length=6)
+        stream = assembler.get_payload_as_stream()
+
+        stream.give_buffer(b"abcd")
+        stream.give_buffer(b"ef")
+
+        buffer = bytearray(6)
+        self.assertEqual(3, await stream.read(buffer, 0, 3))
+        self.assertEqual(1, await stream.read(buffer, 3, 3))
+        self.assertEqual(2, await stream.read(buffer, 4, 3))
+        self.assertEqual(0, await stream.read(buffer, 0, 3))
+        self.assertEqual(b"abcdef", bytes(buffer))
+
+    async def test_async_iteration_yields_each_buffer(self):
+        assembler = PayloadStreamAssembler(StreamManager(), uuid4())
+        stream = assembler.get_payload_as_stream()
+
+        stream.give_buffer(b"abc")
+        stream.give_buffer(bytearray(b"def"))
+        stream.done_producing()
+
+        chunks = [bytes(chunk) async for chunk in stream]
+
+        self.assertEqual([b"abc", b"def"], chunks)
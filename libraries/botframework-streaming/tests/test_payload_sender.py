@@ -1,4 +1,11 @@
-from asyncio import Semaphore
+from asyncio import (
+    Event,
+    Semaphore,
+    ensure_future,
+    sleep,
+    TimeoutError as AsyncTimeoutError,
+    wait_for,
+)
 from typing import List
 from uuid import UUID, uuid4
 
@@ -25,6 +32,7 @@ class MockTransportSender(TransportSenderBase):
         else:  # Payload
             print("Validating Payload...")
             assert count == 3
+            assert bytes(buffer[offset : offset + count]) == bytes([1, 2, 3])
             self.send_called.release()
 
         return count
@@ -58,3 +66,134 @@ class TestPayloadSender(aiounittest.AsyncTestCase):
         # Assert
         await sender.send_called.acquire()
         await sut.disconnect()
+
+    async def test_holds_back_packets_over_the_in_flight_budget(self):
+        sut = PayloadSender(max_bytes_in_flight=100)
+
+        header = Header(type="A", id=uuid4(), end=True)
+        header.payload_length = 3
+        sut.send_payload(header, [1, 2, 3], is_length_known=True, sent_callback=None)
+
+        self.assertEqual(1, sut.queue_depth)
+        self.assertEqual(51, sut.bytes_in_flight)
+
+        with self.assertRaises(AsyncTimeoutError):
+            await wait_for(sut.wait_for_capacity(3), 0.1)
+
+        sender = MockTransportSender()
+        sut.connect(sender)
+        await wait_for(sut.wait_for_capacity(3), 1)
+
+        self.assertEqual(0, sut.queue_depth)
+        self.assertEqual(0, sut.bytes_in_flight)
+        await sut.disconnect()
+
+    async def test_drops_queued_packets_on_disconnect(self):
+        sut = PayloadSender(max_bytes_in_flight=100)
+        sender = BlockingTransportSender()
+        sut.connect(sender)
+
+        failed: List[Header] = []
+        sent: List[Header] = []
+
+        async def sent_callback(header: Header):
+            sent.append(header)
+
+        async def failed_callback(header: Header):
+            failed.append(header)
+
+        headers = []
+        for _ in range(3):
+            header = Header(type="A", id=uuid4(), end=True)
+            header.payload_length = 3
+            headers.append(header)
+            sut.send_payload(header, [1, 2, 3], True, sent_callback, failed_callback)
+
+        # The first packet is being sent, the other two are queued
+        await sender.send_started.wait()
+        self.assertEqual(2, sut.queue_depth)
+
+        waiter = ensure_future(sut.wait_for_capacity(3))
+        await sleep(0)
+        self.assertFalse(waiter.done())
+
+        await sut.disconnect()
+        sender.release.set()
+        await wait_for(waiter, 1)
+
+        self.assertEqual(0, sut.queue_depth)
+        self.assertEqual(0, sut.bytes_in_flight)
+
+        # Packets sent after the disconnect are dropped right away
+        late = Header(type="A", id=uuid4(), end=True)
+        late.payload_length = 3
+        sut.send_payload(late, [1, 2, 3], True, sent_callback, failed_callback)
+        self.assertEqual(0, sut.bytes_in_flight)
+
+        # The packet being sent is dropped too, as its content can't follow its header
+        await sleep(0)
+        self.assertEqual(0, len(sent))
+        self.assertCountEqual(
+            [header.id for header in headers] + [late.id],
+            [header.id for header in failed],
+        )
+
+    async def test_each_packet_gets_its_own_buffer(self):
+        sut = PayloadSender()
+        sender = RecordingTransportSender()
+        sut.connect(sender)
+
+        headers = []
+        for content in ([1, 2, 3], [4, 5, 6]):
+            header = Header(type="A", id=uuid4(), end=True)
+            header.payload_length = 3
+            headers.append(header)
+            sut.send_payload(header, content, True, None)
+
+        await wait_for(sender.sent(4), 1)
+
+        # The header and the content of each packet are sent separately
+        self.assertEqual(
+            headers[0].id, HeaderSerializer.deserialize(sender.buffers[0], 0, 48).id
+        )
+        self.assertEqual(bytes([1, 2, 3]), bytes(sender.buffers[1]))
+        self.assertEqual(
+            headers[1].id, HeaderSerializer.deserialize(sender.buffers[2], 0, 48).id
+        )
+        self.assertEqual(bytes([4, 5, 6]), bytes(sender.buffers[3]))
+        await sut.disconnect()
+
+
+class BlockingTransportSender(TransportSenderBase):
+    def __init__(self):
+        super().__init__()
+        self.send_started = Event()
+        self.release = Event()
+
+    async def send(self, buffer: List[int], offset: int, count: int) -> int:
+        self.send_started.set()
+        await self.release.wait()
+        return count
+
+    def close(self):
+        pass
+
+
+class RecordingTransportSender(TransportSenderBase):
+    def __init__(self):
+        super().__init__()
+        self.buffers = []
+        self._send_called = Semaphore(0)
+
+    async def send(self, buffer: List[int], offset: int, count: int) -> int:
+        # Keeps the buffer itself, as a transport queueing the frame would
+        self.buffers.append(memoryview(buffer)[offset : offset + count])
+        self._send_called.release()
+        return count
+
+    async def sent(self, count: int):
+        for _ in range(count):
+            await self._send_called.acquire()
+
+    def close(self):
+        pass
@@ -1,16 +1,20 @@
 # Copyright (c) Microsoft Corporation. All rights reserved.
 # Licensed under the MIT License.
 
+import asyncio
 from typing import List
 from uuid import uuid4
 
 import aiounittest
 
 from botframework.streaming import PayloadStream, StreamingRequest
-from botframework.streaming.payloads import SendOperations
+from botframework.streaming.payloads import HeaderSerializer, SendOperations
 from botframework.streaming.payloads.assemblers import PayloadStreamAssembler
 from botframework.streaming.payload_transport import PayloadSender
-from botframework.streaming.transport import TransportSenderBase
+from botframework.streaming.transport import (
+    TransportConstants,
+    TransportSenderBase,
+)
 
 
 class MockTransportSender(TransportSenderBase):
@@ -21,7 +25,7 @@ class MockTransportSender(TransportSenderBase):
         self.buffers = []
 
     async def send(self, buffer: List[int], offset: int, count: int) -> int:
-        self.buffers.append(buffer.copy())
+        self.buffers.append(bytes(buffer[offset : offset + count]))
 
         return count
 
@@ -54,3 +58,61 @@ class TestSendOperations(aiounittest.AsyncTestCase):
 
         await sut.send_request(uuid4(), request)
         self.assertEqual(4, len(transport.buffers))
+
+    async def test_request_dissasembler_sends_each_chunk_of_a_large_stream(self):
+        sender = PayloadSender()
+        transport = MockTransportSender()
+        sender.connect(transport)
+
+        sut = SendOperations(sender)
+
+        content = "".join(str(index) for index in range(1500)).encode("ascii")
+        request = StreamingRequest.create_post("/a/b")
+        request.add_stream(content)
+
+        await sut.send_request(uuid4(), request)
+        await asyncio.sleep(0.1)
+
+        stream_packets = [
+            payload
+            for header, payload in self._split_frames(transport.buffers)
+            if header.type == "S"
+        ]
+
+        self.assertEqual(2, len(stream_packets))
+        self.assertEqual(content, b"".join(stream_packets))
+
+    async def test_request_dissasembler_interleaves_streams(self):
+        sender = PayloadSender()
+        transport = MockTransportSender()
+        sender.connect(transport)
+
+        sut = SendOperations(sender)
+
+        first = b"a" * (TransportConstants.MAX_PAYLOAD_LENGTH * 3)
+        second = b"b" * (TransportConstants.MAX_PAYLOAD_LENGTH * 3)
+        request = StreamingRequest.create_post("/a/b")
+        request.add_stream(first)
+        request.add_stream(second)
+
+        await sut.send_request(uuid4(), request)
+        await asyncio.sleep(0.1)
+
+        stream_packets = [
+            payload[:1]
+            for header, payload in self._split_frames(transport.buffers)
+            if header.type == "S"
+        ]
+
+        self.assertEqual([b"a", b"b"] * 3, stream_packets)
+        self.assertEqual(0, sender.queue_depth)
+        self.assertEqual(0, sender.bytes_in_flight)
+
+    @staticmethod
+    def _split_frames(buffers: List[bytes]):
+        buffers = iter(buffers)
+        for buffer in buffers:
+            header = HeaderSerializer.deserialize(
+                buffer, 0, TransportConstants.MAX_HEADER_LENGTH
+            )
+            yield header, next(buffers) if header.payload_length else b""
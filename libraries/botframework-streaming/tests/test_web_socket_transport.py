@@ -0,0 +1,56 @@
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License.
+
+from typing import Any, List
+
+import aiounittest
+
+from botframework.streaming.transport.web_socket import (
+    WebSocket,
+    WebSocketMessage,
+    WebSocketMessageType,
+    WebSocketState,
+    WebSocketTransport,
+)
+
+
+class MockWebSocket(WebSocket):
+    # pylint: disable=unused-argument
+    def __init__(self, messages: List[bytes]):
+        self.messages = messages
+        self.sent = []
+
+    async def receive(self) -> WebSocketMessage:
+        return WebSocketMessage(
+            message_type=WebSocketMessageType.BINARY, data=self.messages.pop(0)
+        )
+
+    async def send(
+        self, buffer: Any, message_type: WebSocketMessageType, end_of_message: bool
+    ):
+        self.sent.append(bytes(buffer))
+
+    @property
+    def status(self) -> WebSocketState:
+        return WebSocketState.OPEN
+
+
+class TestWebSocketTransport(aiounittest.AsyncTestCase):
+    async def test_receive_reads_a_message_across_calls(self):
+        socket = MockWebSocket([b"headercontent", b"next"])
+        sut = WebSocketTransport(socket)
+        buffer = bytearray(20)
+
+        self.assertEqual(6, await sut.receive(buffer, 0, 6))
+        self.assertEqual(7, await sut.receive(buffer, 6, 10))
+        self.assertEqual(b"headercontent", bytes(buffer[:13]))
+
+        self.assertEqual(4, await sut.receive(buffer, 0, 10))
+        self.assertEqual(b"next", bytes(buffer[:4]))
+
+    async def test_send_sends_the_requested_slice(self):
+        socket = MockWebSocket([])
+        sut = WebSocketTransport(socket)
+
+        self.assertEqual(3, await sut.send(b"abcdef", 2, 3))
+        self.assertEqual([b"cde"], socket.sent)